@@ -0,0 +1,142 @@
+"""Process-wide, read-only artifact cache shared by every Streamlit session.
+
+``st.cache_data`` pickles its return value and hands each caller a fresh copy;
+this cache returns the same object to everyone instead. To make sharing safe
+every NumPy array in a cached artifact is made non-writeable, so an accidental
+in-place edit raises instead of leaking into other sessions; callers that need
+to modify data take a copy first (as the menus already do with ``df.copy()``).
+Entries are evicted least-recently-used once their estimated size exceeds
+``max_bytes``, and a newer version of a file replaces the older one at once.
+"""
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from artifacts.columnar import read_artifact
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+    max_bytes: int = 0
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def freeze(obj):
+    """Mark every ndarray reachable from ``obj`` read-only (in place) and return ``obj``."""
+    if isinstance(obj, np.ndarray):
+        obj.flags.writeable = False
+    elif isinstance(obj, dict):
+        for v in obj.values():
+            freeze(v)
+    elif isinstance(obj, (list, tuple)):
+        for v in obj:
+            freeze(v)
+    elif isinstance(obj, (pd.DataFrame, pd.Series)):
+        # Only numeric blocks: pandas' own routines expect object/extension blocks to be writeable.
+        for block in obj._mgr.blocks:
+            if isinstance(block.values, np.ndarray) and block.values.dtype.kind in "biufc":
+                block.values.flags.writeable = False
+    return obj
+
+
+def nbytes(obj):
+    """Rough resident size of an artifact; arrays, frames and bytes dominate."""
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        return int(np.sum(obj.memory_usage(deep=True)))
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(nbytes(k) + nbytes(v) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return sys.getsizeof(obj) + sum(nbytes(v) for v in obj)
+    return sys.getsizeof(obj)
+
+
+class ByteLRU:
+    """Thread-safe LRU mapping bounded by the total of the sizes given to ``put``."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = int(max_bytes)
+        self._lock = threading.Lock()
+        self._items = OrderedDict()  # key -> (value, size)
+        self._stats = CacheStats(max_bytes=self.max_bytes)
+
+    def get(self, key):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self._stats.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self._stats.hits += 1
+            return item[0]
+
+    def put(self, key, value, size, supersedes=None):
+        """Store ``value``; keys matching ``supersedes(key)`` (older versions) are dropped first.
+
+        A value larger than the whole budget is not stored. Returns the cached
+        value, which is an earlier one if another thread stored ``key`` first.
+        """
+        with self._lock:
+            if key in self._items:
+                return self._items[key][0]
+            if supersedes is not None:
+                for old in [k for k in self._items if supersedes(k)]:
+                    self._drop(old)
+            if size <= self.max_bytes:
+                self._items[key] = (value, size)
+                self._stats.bytes += size
+                while self._stats.bytes > self.max_bytes:
+                    self._drop(next(iter(self._items)))
+                    self._stats.evictions += 1
+            return value
+
+    def _drop(self, key):
+        _, size = self._items.pop(key)
+        self._stats.bytes -= size
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._stats.bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return CacheStats(**{**vars(self._stats), "entries": len(self._items)})
+
+
+class ArtifactCache:
+    def __init__(self, max_bytes=256 << 20, loader=read_artifact):
+        self.max_bytes = int(max_bytes)
+        self._loader = loader
+        self._lru = ByteLRU(max_bytes)
+
+    def get(self, entry):
+        """Shared, read-only artifact for a registry entry (anything with ``.path`` and ``.sha``)."""
+        key = (entry.path, entry.sha)
+        obj = self._lru.get(key)
+        if obj is not None:
+            return obj
+        obj = self._loader(entry.path)
+        size = nbytes(obj)
+        freeze(obj)
+        return self._lru.put(key, obj, size, supersedes=lambda k: k[0] == entry.path)
+
+    def clear(self):
+        self._lru.clear()
+
+    def stats(self):
+        return self._lru.stats()
@@ -0,0 +1,329 @@
+"""Columnar on-disk artifact format.
+
+A pickle ``<name>.pkl`` converts to a directory ``<name>.art/`` holding one
+``.npy`` file per NumPy array (opened with ``mmap_mode="r"``) and a
+``header.json`` with the nested structure, every scalar and the parameters of
+each ``MinMaxScaler`` (``min_``, ``scale_``, ``data_min_``, ``data_max_`` ...).
+Loading is a JSON parse plus a few ``mmap`` calls; the arrays are paged in on
+first access, are read-only, and nothing from scikit-learn is unpickled — the
+scalers come back as :class:`MinMaxParams`.
+
+    python -m artifacts.columnar              # convert every *.pkl under the app folder
+    python -m artifacts.columnar --sites goa_maharani --force
+"""
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import re
+import shutil
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+FORMAT = "lamongan-artifact"
+VERSION = 1
+SUFFIX = ".art"
+HEADER = "header.json"
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@dataclass
+class MinMaxParams:
+    """The fitted state of a ``MinMaxScaler`` with the same transform/inverse_transform API."""
+
+    min_: np.ndarray
+    scale_: np.ndarray
+    data_min_: np.ndarray
+    data_max_: np.ndarray
+    data_range_: np.ndarray
+    feature_range: tuple = (0, 1)
+    n_samples_seen_: int = 0
+
+    @property
+    def n_features_in_(self):
+        return len(self.min_)
+
+    def transform(self, X):
+        return np.asarray(X, dtype=float) * self.scale_ + self.min_
+
+    def inverse_transform(self, X):
+        return (np.asarray(X, dtype=float) - self.min_) / self.scale_
+
+    @classmethod
+    def from_scaler(cls, scaler):
+        return cls(
+            *(np.asarray(getattr(scaler, k), dtype=float) for k in ("min_", "scale_", "data_min_", "data_max_", "data_range_")),
+            feature_range=tuple(scaler.feature_range),
+            n_samples_seen_=int(np.max(getattr(scaler, "n_samples_seen_", 0))),
+        )
+
+
+def _is_minmax(obj):
+    return type(obj).__name__ in ("MinMaxScaler", "MinMaxParams") and hasattr(obj, "scale_")
+
+
+class _Writer:
+    def __init__(self, out_dir):
+        self.out_dir = out_dir
+        self.arrays = {}
+
+    def _file(self, key_path, ext):
+        stem = re.sub(r"[^A-Za-z0-9_.-]+", "_", ".".join(key_path)).strip("._") or "root"
+        name, i = stem + ext, 1
+        while name in self.arrays:
+            name, i = f"{stem}~{i}{ext}", i + 1
+        return name
+
+    def _array(self, arr, key_path):
+        arr = np.ascontiguousarray(arr)
+        if arr.dtype.metadata:
+            arr = arr.view(np.dtype(arr.dtype.str))
+        if arr.dtype.hasobject:
+            raise TypeError(f"array object di {'/'.join(key_path)} tidak dapat disimpan kolumnar")
+        name = self._file(key_path, ".npy")
+        path = os.path.join(self.out_dir, name)
+        np.save(path, arr, allow_pickle=False)
+        self.arrays[name] = {"dtype": arr.dtype.str, "shape": list(arr.shape), "sha": _digest(path)}
+        return {"t": "ndarray", "file": name}
+
+    def _column(self, values, key_path):
+        values = np.asarray(values)
+        if values.dtype.kind in "biufcM":
+            return self._array(values, key_path)
+        return {"t": "json", "v": self.encode(values.tolist(), key_path)["v"]}
+
+    def _index(self, index, key_path):
+        if isinstance(index, pd.RangeIndex):
+            return {"t": "range", "start": index.start, "stop": index.stop, "step": index.step, "name": index.name}
+        return {"t": "index", "name": index.name, "values": self._column(index.to_numpy(), key_path)}
+
+    def encode(self, obj, key_path=()):
+        if obj is None or isinstance(obj, (bool, int, float, str)):
+            return {"t": "json", "v": obj}
+        if isinstance(obj, np.generic):
+            return {"t": "json", "v": obj.item()}
+        if isinstance(obj, np.ndarray):
+            return self._array(obj, key_path)
+        if isinstance(obj, bytes):
+            name = self._file(key_path, ".bin")
+            with open(os.path.join(self.out_dir, name), "wb") as f:
+                f.write(obj)
+            self.arrays[name] = {"dtype": "bytes", "shape": [len(obj)], "sha": _digest(os.path.join(self.out_dir, name))}
+            return {"t": "bytes", "file": name}
+        if isinstance(obj, dict):
+            if not all(isinstance(k, str) for k in obj):
+                raise TypeError(f"kunci non-string di {'/'.join(key_path)}")
+            return {"t": "dict", "items": [[k, self.encode(v, key_path + (k,))] for k, v in obj.items()]}
+        if isinstance(obj, (list, tuple)):
+            items = [self.encode(v, key_path + (str(i),)) for i, v in enumerate(obj)]
+            if isinstance(obj, list) and all(it["t"] == "json" for it in items):
+                return {"t": "json", "v": [it["v"] for it in items]}
+            return {"t": "tuple" if isinstance(obj, tuple) else "list", "items": items}
+        if _is_minmax(obj):
+            p = obj if isinstance(obj, MinMaxParams) else MinMaxParams.from_scaler(obj)
+            return {
+                "t": "minmax",
+                **{k: np.asarray(getattr(p, k), dtype=float).tolist()
+                   for k in ("min_", "scale_", "data_min_", "data_max_", "data_range_")},
+                "feature_range": list(p.feature_range),
+                "n_samples_seen_": p.n_samples_seen_,
+            }
+        if isinstance(obj, pd.DataFrame):
+            return {
+                "t": "dataframe",
+                "columns": [[str(c), self._column(obj[c].to_numpy(), key_path + (str(c),))] for c in obj.columns],
+                "index": self._index(obj.index, key_path + ("index",)),
+            }
+        if isinstance(obj, pd.Series):
+            return {
+                "t": "series",
+                "name": obj.name,
+                "values": self._column(obj.to_numpy(), key_path),
+                "index": self._index(obj.index, key_path + ("index",)),
+            }
+        raise TypeError(f"tipe {type(obj).__name__} di {'/'.join(key_path) or '<root>'} belum didukung")
+
+
+def _digest(path):
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def save(obj, out_dir, source=None):
+    """Write ``obj`` as a columnar artifact; the directory is swapped in atomically."""
+    tmp_dir = out_dir.rstrip(os.sep) + ".tmp"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    try:
+        writer = _Writer(tmp_dir)
+        tree = writer.encode(obj)
+        header = {"format": FORMAT, "version": VERSION, "source": source, "arrays": writer.arrays, "tree": tree}
+        with open(os.path.join(tmp_dir, HEADER), "w", encoding="utf-8") as f:
+            json.dump(header, f, ensure_ascii=False, indent=1)
+    except Exception:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+    shutil.rmtree(out_dir, ignore_errors=True)
+    os.replace(tmp_dir, out_dir)
+    return out_dir
+
+
+def read_header(art_dir):
+    with open(os.path.join(art_dir, HEADER), encoding="utf-8") as f:
+        header = json.load(f)
+    if header.get("format") != FORMAT:
+        raise ValueError(f"{art_dir} bukan artifact kolumnar")
+    if header.get("version", 0) > VERSION:
+        raise ValueError(f"versi artifact {header['version']} lebih baru dari yang didukung ({VERSION})")
+    return header
+
+
+def _decode(node, art_dir, mmap):
+    t = node["t"]
+    if t == "json":
+        return node["v"]
+    if t == "ndarray":
+        return np.load(os.path.join(art_dir, node["file"]), mmap_mode="r" if mmap else None, allow_pickle=False)
+    if t == "bytes":
+        with open(os.path.join(art_dir, node["file"]), "rb") as f:
+            return f.read()
+    if t == "dict":
+        return {k: _decode(v, art_dir, mmap) for k, v in node["items"]}
+    if t in ("list", "tuple"):
+        items = [_decode(v, art_dir, mmap) for v in node["items"]]
+        return tuple(items) if t == "tuple" else items
+    if t == "minmax":
+        return MinMaxParams(
+            *(np.asarray(node[k], dtype=float) for k in ("min_", "scale_", "data_min_", "data_max_", "data_range_")),
+            feature_range=tuple(node["feature_range"]),
+            n_samples_seen_=node.get("n_samples_seen_", 0),
+        )
+    if t == "range":
+        return pd.RangeIndex(node["start"], node["stop"], node["step"], name=node.get("name"))
+    if t == "index":
+        return pd.Index(_decode(node["values"], art_dir, mmap), name=node.get("name"))
+    if t == "dataframe":
+        return pd.DataFrame(
+            {c: _decode(v, art_dir, mmap) for c, v in node["columns"]},
+            index=_decode(node["index"], art_dir, mmap),
+        )
+    if t == "series":
+        return pd.Series(_decode(node["values"], art_dir, mmap), index=_decode(node["index"], art_dir, mmap),
+                         name=node.get("name"))
+    raise ValueError(f"node artifact tidak dikenal: {t}")
+
+
+def load(art_dir, mmap=True):
+    """Rebuild the artifact dict; arrays are read-only memory maps unless ``mmap=False``."""
+    header = read_header(art_dir)
+    return _decode(header["tree"], art_dir, mmap)
+
+
+def read_artifact(path, mmap=True):
+    """Load either format: a ``.art`` directory or a legacy pickle."""
+    if os.path.isdir(path):
+        return load(path, mmap=mmap)
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def write_pickle(path, obj):
+    """Write a pickle artifact atomically (readers never see a half-written file)."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(obj, f)
+    os.replace(tmp_path, path)
+    return path
+
+
+def target_for(pkl_path):
+    return os.path.splitext(pkl_path)[0] + SUFFIX
+
+
+def is_current(pkl_path, art_dir=None):
+    """True when the converted directory exists and was built from the pickle as it is now."""
+    art_dir = art_dir or target_for(pkl_path)
+    try:
+        source = read_header(art_dir).get("source") or {}
+    except (OSError, ValueError):
+        return False
+    try:
+        return source.get("sha") == _digest(pkl_path)
+    except OSError:
+        return True
+
+
+def same(a, b):
+    """Structural equality used to verify a conversion round trip."""
+    if isinstance(a, MinMaxParams) or _is_minmax(a):
+        return all(np.array_equal(getattr(a, k), getattr(b, k)) for k in ("min_", "scale_", "data_min_", "data_max_"))
+    if isinstance(a, dict):
+        return isinstance(b, dict) and list(a) == list(b) and all(same(a[k], b[k]) for k in a)
+    if isinstance(a, (list, tuple)):
+        return type(a) is type(b) and len(a) == len(b) and all(same(x, y) for x, y in zip(a, b))
+    if isinstance(a, pd.DataFrame):
+        return isinstance(b, pd.DataFrame) and a.equals(b) and list(a.index) == list(b.index)
+    if isinstance(a, pd.Series):
+        return isinstance(b, pd.Series) and a.equals(b) and list(a.index) == list(b.index)
+    if isinstance(a, np.ndarray):
+        return a.shape == np.shape(b) and a.dtype == np.asarray(b).dtype and np.array_equal(a, b, equal_nan=a.dtype.kind == "f")
+    if isinstance(a, float) and np.isnan(a):
+        return isinstance(b, float) and np.isnan(b)
+    return a == b
+
+
+def convert(pkl_path, force=False, verify=True):
+    """Convert one pickle; returns the ``.art`` path, or None when it was already up to date."""
+    art_dir = target_for(pkl_path)
+    if not force and is_current(pkl_path, art_dir):
+        return None
+    with open(pkl_path, "rb") as f:
+        obj = pickle.load(f)
+    save(obj, art_dir, source={"file": os.path.basename(pkl_path), "sha": _digest(pkl_path)})
+    if verify and not same(obj, load(art_dir, mmap=False)):
+        shutil.rmtree(art_dir, ignore_errors=True)
+        raise ValueError(f"hasil konversi {pkl_path} tidak identik dengan pickle")
+    return art_dir
+
+
+def main(argv=None):
+    from artifacts.registry import classify
+
+    parser = argparse.ArgumentParser(description="Konversi artifact pickle ke format kolumnar (.art).")
+    parser.add_argument("--root", default=ROOT, help="folder aplikasi berisi folder per wisata")
+    parser.add_argument("--sites", nargs="*", help="nama folder wisata (default: semua)")
+    parser.add_argument("--force", action="store_true", help="konversi ulang walaupun sudah mutakhir")
+    args = parser.parse_args(argv)
+
+    converted = skipped = failed = 0
+    for folder in sorted(os.listdir(args.root)):
+        folder_path = os.path.join(args.root, folder)
+        if not os.path.isdir(folder_path) or folder.startswith((".", "_")) or (args.sites and folder not in args.sites):
+            continue
+        for file_name in sorted(os.listdir(folder_path)):
+            if not file_name.endswith(".pkl") or classify(file_name) is None:
+                continue
+            path = os.path.join(folder_path, file_name)
+            try:
+                out = convert(path, force=args.force)
+            except Exception as e:
+                failed += 1
+                print(f"GAGAL {folder}/{file_name}: {e}", flush=True)
+                continue
+            if out is None:
+                skipped += 1
+            else:
+                converted += 1
+                print(f"{folder}/{file_name} -> {os.path.basename(out)}", flush=True)
+    print(f"Selesai: {converted} dikonversi, {skipped} sudah mutakhir, {failed} gagal")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,116 @@
+"""Persistent, content-addressed cache of array results on local disk.
+
+Each entry is one ``<key>.npz`` file named by a hash of everything the result
+depends on, so a lookup never needs an index and entries written by other
+processes (pipeline workers, the dashboard) are shared as soon as they land.
+Writes go through a temporary file and ``os.replace``. A hit touches the file,
+making its mtime the last-use time; once the directory grows past
+``max_bytes`` the least recently used files are deleted.
+"""
+import hashlib
+import json
+import os
+import threading
+
+import numpy as np
+
+from artifacts.cache import CacheStats
+
+SUFFIX = ".npz"
+_NAMES = "__names__"
+
+
+def digest(*parts):
+    """Hex key over arrays/bytes (by content) and any other JSON-able parts."""
+    h = hashlib.blake2b(digest_size=20)
+    for part in parts:
+        if isinstance(part, np.ndarray):
+            h.update(str(part.dtype).encode() + str(part.shape).encode())
+            h.update(np.ascontiguousarray(part).tobytes())
+        elif isinstance(part, (bytes, bytearray)):
+            h.update(part)
+        else:
+            h.update(json.dumps(part, sort_keys=True, default=str).encode())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+class DiskCache:
+    def __init__(self, directory, max_bytes=256 << 20):
+        self.directory = directory
+        self.max_bytes = int(max_bytes)
+        self._lock = threading.Lock()
+        self._stats = CacheStats(max_bytes=self.max_bytes)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def get(self, key):
+        """``{name: array}`` stored under ``key`` (in stored order), or None."""
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                names = [str(n) for n in data[_NAMES]]
+                value = {name: data[name] for name in names}
+            os.utime(path)
+        except (OSError, ValueError, KeyError):
+            with self._lock:
+                self._stats.misses += 1
+            return None
+        with self._lock:
+            self._stats.hits += 1
+        return value
+
+    def put(self, key, arrays):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        names = list(arrays)
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **{_NAMES: np.array(names)}, **{n: np.asarray(arrays[n]) for n in names})
+        os.replace(tmp_path, path)
+        self.evict()
+        return arrays
+
+    def _files(self):
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return []
+        out = []
+        for name in names:
+            if not name.endswith(SUFFIX):
+                continue
+            try:
+                st = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            out.append((st.st_mtime, st.st_size, name))
+        return sorted(out)
+
+    def evict(self):
+        files = self._files()
+        total = sum(size for _, size, _ in files)
+        for _, size, name in files:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            total -= size
+            with self._lock:
+                self._stats.evictions += 1
+
+    def clear(self):
+        for _, _, name in self._files():
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+
+    def stats(self):
+        """Hit/miss/eviction counts of this process; entries and bytes of the whole directory."""
+        files = self._files()
+        with self._lock:
+            return CacheStats(**{**vars(self._stats), "entries": len(files), "bytes": sum(s for _, s, _ in files)})
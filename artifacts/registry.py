@@ -0,0 +1,159 @@
+"""Manifest of the per-site pickle artifacts.
+
+The site folders are scanned once; every ``*.pkl`` is classified by its file
+name into ``(site, stage, split, config)`` and recorded with size, mtime and a
+content hash. Menus resolve paths through :class:`ArtifactRegistry` instead of
+hard-coded maps, so a new site folder needs no code change. Lookups re-``stat``
+only the requested file to notice edits or deletions. A converted ``<name>.art``
+directory (see ``artifacts.columnar``) takes the place of ``<name>.pkl`` as long
+as it was built from the pickle's current content.
+"""
+import hashlib
+import os
+import re
+import threading
+from dataclasses import dataclass, replace
+
+from artifacts import columnar
+
+STAGES = ["preprocessing", "ceemdan", "normalisasi", "split", "modelling", "backtest", "comparison", "forecast"]
+_SPLIT_RE = re.compile(r"_(\d{2}_\d{2})(?=_|\.(?:pkl|art)$)")
+_CONFIG_RE = re.compile(r"_(cfg\d+)\.(?:pkl|art)$")
+
+
+@dataclass(frozen=True)
+class ArtifactEntry:
+    site: str
+    stage: str
+    split: str
+    config: str
+    path: str
+    rel_path: str
+    size: int
+    mtime: float
+    sha: str
+
+    @property
+    def key(self):
+        return (self.site, self.stage, self.split, self.config)
+
+    @property
+    def columnar(self):
+        return self.path.endswith(columnar.SUFFIX)
+
+
+def _stat_path(path):
+    # A columnar artifact changes exactly when its header does (it lists every array's digest).
+    return os.path.join(path, columnar.HEADER) if path.endswith(columnar.SUFFIX) else path
+
+
+def file_hash(path):
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def site_label(folder):
+    words = folder.replace("-", "_").split("_")
+    label = " ".join(w.capitalize() for w in words if w)
+    return label if label.lower().startswith("wisata") else f"Wisata {label}"
+
+
+def classify(file_name):
+    """``"modelling_wbl_split_80_20_cfg1.pkl"`` -> ``("modelling", "80_20", "cfg1")``; unknown stages give None."""
+    stage = file_name.split("_", 1)[0].lower()
+    if stage not in STAGES or not file_name.endswith((".pkl", columnar.SUFFIX)):
+        return None
+    split = _SPLIT_RE.search(file_name)
+    config = _CONFIG_RE.search(file_name)
+    return stage, split.group(1) if split else "", config.group(1) if config else ""
+
+
+class ArtifactRegistry:
+    def __init__(self, root):
+        self.root = os.path.abspath(root)
+        self._lock = threading.Lock()
+        self.refresh()
+
+    def refresh(self):
+        manifest = {}
+        folders = {}
+        for folder in sorted(os.listdir(self.root)):
+            folder_path = os.path.join(self.root, folder)
+            if not os.path.isdir(folder_path) or folder.startswith((".", "_")):
+                continue
+            for file_name in sorted(os.listdir(folder_path)):
+                parsed = classify(file_name)
+                if parsed is None:
+                    continue
+                site = site_label(folder)
+                path = os.path.join(folder_path, file_name)
+                if not self._preferred(path):
+                    continue
+                entry = self._make_entry(site, *parsed, path)
+                if entry is not None:
+                    manifest.setdefault(entry.key, entry)
+                    folders[site] = folder
+        with self._lock:
+            self._manifest = manifest
+            self._folders = folders
+
+    @staticmethod
+    def _preferred(path):
+        stem, ext = os.path.splitext(path)
+        if ext == ".pkl":
+            return not columnar.is_current(path)
+        pkl_path = stem + ".pkl"
+        return not os.path.exists(pkl_path) or columnar.is_current(pkl_path, path)
+
+    def _make_entry(self, site, stage, split, config, path):
+        try:
+            st = os.stat(_stat_path(path))
+            sha = file_hash(_stat_path(path))
+        except OSError:
+            return None
+        return ArtifactEntry(site, stage, split, config, path, os.path.relpath(path, self.root),
+                             st.st_size, st.st_mtime, sha)
+
+    def get(self, site, stage, split="", config=""):
+        """Current entry for a key, re-hashed if the file changed; None if unknown or deleted."""
+        key = (site, stage, split or "", config or "")
+        with self._lock:
+            entry = self._manifest.get(key)
+        if entry is None:
+            return None
+        try:
+            st = os.stat(_stat_path(entry.path))
+        except OSError:
+            with self._lock:
+                self._manifest.pop(key, None)
+            return None
+        if st.st_size != entry.size or st.st_mtime != entry.mtime:
+            entry = replace(entry, size=st.st_size, mtime=st.st_mtime, sha=file_hash(_stat_path(entry.path)))
+            with self._lock:
+                self._manifest[key] = entry
+        return entry
+
+    def path(self, site, stage, split="", config=""):
+        entry = self.get(site, stage, split, config)
+        return entry.path if entry else None
+
+    def entries(self, site=None, stage=None):
+        with self._lock:
+            items = list(self._manifest.values())
+        return [e for e in items if (site is None or e.site == site) and (stage is None or e.stage == stage)]
+
+    def sites(self, stage=None):
+        return sorted({e.site for e in self.entries(stage=stage)})
+
+    def folder(self, site):
+        return self._folders.get(site)
+
+    def splits(self, site, stage):
+        return sorted({e.split for e in self.entries(site, stage) if e.split})
+
+    def group(self, site, stage):
+        """``{(split, config): entry}`` for one site/stage, e.g. the four modelling runs."""
+        return {(e.split, e.config): e for e in sorted(self.entries(site, stage), key=lambda e: (e.split, e.config))}
@@ -0,0 +1,191 @@
+"""Summary index of the modelling metrics of every site.
+
+One small table holds, per site, the baselines without PSO (the stored Colab
+``elm_standard`` as "ELM" and the app-retrained ``elm_baseline`` under its own
+label, one row per model and split, averaged over the configs) and every ELM-PSO run (one row per split x config) with the
+train/test MAPE/MAE/RMSE/R², the rolling-origin backtest metrics of the site's
+``backtest_*`` artifact when there is one, and the per-site best flag (lowest
+backtest MAPE when every ELM-PSO run of the site has been backtested, else
+lowest MAPE Test, so the runs of a site are never ranked on mixed bases). It is
+rebuilt only when a modelling or backtest artifact changes (new content hash),
+and then only the changed artifacts are read; those loads run concurrently on
+a thread pool.
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+METRIC_COLUMNS = [
+    "MAPE Train (%)", "MAPE Test (%)",
+    "MAE Train", "RMSE Train", "R² Train",
+    "MAE Test", "RMSE Test", "R² Test",
+    "MAPE Backtest (%)", "MAE Backtest", "RMSE Backtest", "R² Backtest",
+]
+COLUMNS = ["Wisata", "Model", "Split", "Konfigurasi", "File Pickle", *METRIC_COLUMNS, "Terbaik?"]
+
+
+def load_many(entries, loader, max_workers=8):
+    """``{entry: artifact or exception}``, loading all entries concurrently."""
+    entries = list(entries)
+    if not entries:
+        return {}
+
+    def safe_load(entry):
+        try:
+            return loader(entry)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(entries)))) as pool:
+        return dict(zip(entries, pool.map(safe_load, entries)))
+
+
+def _pct(m):
+    return m["MAPE"] * 100.0 if m.get("MAPE") is not None else np.nan
+
+
+def _metric_values(metrics_train, metrics_test):
+    return {
+        "MAPE Train (%)": _pct(metrics_train),
+        "MAPE Test (%)": _pct(metrics_test),
+        "MAE Train": metrics_train.get("MAE", np.nan),
+        "RMSE Train": metrics_train.get("RMSE", np.nan),
+        "R² Train": metrics_train.get("R2", np.nan),
+        "MAE Test": metrics_test.get("MAE", np.nan),
+        "RMSE Test": metrics_test.get("RMSE", np.nan),
+        "R² Test": metrics_test.get("R2", np.nan),
+    }
+
+
+def _backtest_values(metrics):
+    metrics = metrics or {}
+    return {
+        "MAPE Backtest (%)": _pct(metrics),
+        "MAE Backtest": metrics.get("MAE", np.nan),
+        "RMSE Backtest": metrics.get("RMSE", np.nan),
+        "R² Backtest": metrics.get("R2", np.nan),
+    }
+
+
+def run_stem(rel_path):
+    """``"site/modelling_x_split_80_20_cfg1.art"`` -> ``"modelling_x_split_80_20_cfg1"`` (how backtests name runs)."""
+    return os.path.splitext(os.path.basename(rel_path))[0]
+
+
+def modelling_rows(entry, artifact):
+    """Baseline and ELM-PSO rows of one ``modelling_*`` artifact.
+
+    ``elm_standard`` (Colab) and ``elm_baseline`` (retrained in the app with the
+    parameters it stores) are different models and get separate rows.
+    """
+    elm_pso = artifact.get("elm_pso", {})
+    split = elm_pso.get("split_label", entry.split).replace("_", "/")
+    config = elm_pso.get("config", entry.config)
+    base = {"Wisata": entry.site, "Split": split, "Konfigurasi": config, "File Pickle": entry.rel_path}
+    models = []
+    if "elm_standard" in artifact or "elm_baseline" not in artifact:
+        models.append(("ELM", artifact.get("elm_standard", {})))
+    if "elm_baseline" in artifact:
+        models.append((artifact["elm_baseline"].get("label", "ELM baseline"), artifact["elm_baseline"]))
+    models.append(("ELM-PSO", elm_pso))
+    return [
+        {**base, "Model": model, **_metric_values(part.get("metrics_train", {}), part.get("metrics_test", {}))}
+        for model, part in models
+    ]
+
+
+def backtest_metrics(artifact):
+    """``{run stem: {model: {"metrics": ...}}}`` of a ``backtest_*`` artifact, without the per-origin arrays."""
+    # Older backtests stored the app baseline as "ELM", which is the label of the Colab elm_standard rows.
+    return {
+        stem: {model: {"metrics": part["metrics"]} for model, part in run.items()
+               if model != "ELM" and isinstance(part, dict) and "metrics" in part}
+        for stem, run in artifact.get("runs", {}).items()
+    }
+
+
+def with_backtest(rows, run):
+    """``rows`` of one modelling artifact with the backtest metrics of its run; a backtested model without
+    a stored row (the app baseline next to a Colab artifact) gets a row of its own."""
+    out = [{**row, **_backtest_values(run.get(row["Model"], {}).get("metrics"))} for row in rows]
+    if rows:
+        base = {k: rows[0][k] for k in ("Wisata", "Split", "Konfigurasi", "File Pickle")}
+        known = {row["Model"] for row in rows}
+        out += [{**base, "Model": model, **_metric_values({}, {}), **_backtest_values(part["metrics"])}
+                for model, part in run.items() if model not in known]
+    return out
+
+
+def summarize(rows):
+    """Per-run rows -> index table: baselines averaged per (site, model, split), PSO kept per run with the best flag."""
+    df = pd.DataFrame(rows, columns=[c for c in COLUMNS if c != "Terbaik?"])
+    elm = df[df["Model"] != "ELM-PSO"].groupby(["Wisata", "Model", "Split"], as_index=False)[METRIC_COLUMNS].mean()
+    elm["Konfigurasi"] = ""
+    elm["File Pickle"] = ""
+    elm["Terbaik?"] = ""
+    pso = df[df["Model"] == "ELM-PSO"].sort_values(["Wisata", "Split", "Konfigurasi"], kind="stable")
+    pso = pso.reset_index(drop=True)
+    has_backtest = pso.groupby("Wisata")["MAPE Backtest (%)"].transform(lambda s: s.notna().all())
+    basis = pso["MAPE Backtest (%)"].where(has_backtest, pso["MAPE Test (%)"])
+    best = basis.dropna().groupby(pso["Wisata"]).idxmin()
+    pso["Terbaik?"] = ""
+    pso.loc[best.values, "Terbaik?"] = "✅"
+    return pd.concat([elm[COLUMNS], pso[COLUMNS]], ignore_index=True)
+
+
+class ModellingIndex:
+    def __init__(self, loader, max_workers=8):
+        self._loader = loader
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._rows = {}  # (path, sha) -> modelling artifact rows, or backtest metrics per run stem
+        self._signature = None
+        self._table = pd.DataFrame(columns=COLUMNS)
+        self.errors = []
+        self.builds = 0
+
+    def table(self, registry):
+        """The index for the registry's current modelling and backtest artifacts (rebuilt only if one changed)."""
+        entries = [registry.get(*e.key) for stage in ("modelling", "backtest") for e in registry.entries(stage=stage)]
+        entries = sorted((e for e in entries if e is not None), key=lambda e: e.rel_path)
+        signature = tuple((e.path, e.sha) for e in entries)
+        with self._lock:
+            if signature == self._signature:
+                return self._table
+            missing = [e for e in entries if (e.path, e.sha) not in self._rows]
+            errors = []
+            for entry, result in load_many(missing, self._loader, self.max_workers).items():
+                if isinstance(result, Exception):
+                    errors.append((entry.site, entry.rel_path, result))
+                elif entry.stage == "backtest":
+                    self._rows[(entry.path, entry.sha)] = backtest_metrics(result)
+                else:
+                    self._rows[(entry.path, entry.sha)] = modelling_rows(entry, result)
+            self._rows = {k: v for k, v in self._rows.items() if k in set(signature)}
+            backtests = {}
+            for e in entries:
+                if e.stage == "backtest":
+                    backtests[e.site] = self._rows.get((e.path, e.sha), {})
+            rows = []
+            for e in entries:
+                if e.stage != "modelling":
+                    continue
+                run = backtests.get(e.site, {}).get(run_stem(e.rel_path), {})
+                rows += with_backtest(self._rows.get((e.path, e.sha), []), run)
+            self._table = summarize(rows) if rows else pd.DataFrame(columns=COLUMNS)
+            self.errors = errors
+            # A failed load is retried on the next call instead of being cached as part of this signature.
+            self._signature = signature if not errors else None
+            self.builds += 1
+            return self._table
+
+    def site(self, registry, site):
+        """``(df_elm, df_pso)`` of one site, in the layout of the Modelling tables (``df_elm``: every baseline)."""
+        table = self.table(registry)
+        rows = table[table["Wisata"] == site]
+        df_elm = rows[rows["Model"] != "ELM-PSO"][["Model", "Split", *METRIC_COLUMNS]].reset_index(drop=True)
+        df_pso = rows[rows["Model"] == "ELM-PSO"][["File Pickle", "Split", "Konfigurasi", *METRIC_COLUMNS, "Terbaik?"]]
+        return df_elm, df_pso.reset_index(drop=True)
@@ -0,0 +1,170 @@
+"""Rolling-origin (walk-forward) backtest of the ELM baseline and the stored ELM-PSO runs.
+
+A run's windows (train and test rows of ``splitted_data``, in time order) are
+refitted at many forecast origins: at origin ``t`` the model is fitted on the
+first ``t`` rows and scored on the next ``horizon`` rows, one step ahead with
+the observed lags like the holdout metrics. The hidden activations ``H`` do not
+depend on the origin, so they are computed once per run, and the Gram matrices
+of consecutive origins differ only by the rows in between::
+
+    G_t = G_{t-1} + H_(t-1..t)^T H_(t-1..t),    (G_t + reg I) beta_t = r_t
+
+so a chunk of origins costs one cumulative sum and one batched solve. Chunks
+of origins are spread over a process pool. Errors of all origins are scored
+together, baseline and ELM-PSO in one vectorized pass, on the sum of the
+normalised components (the basis of ``metrics_test``). The baseline is the
+app's ``elm.BASELINE_PARAMS`` model and is stored under its own label, not as
+the Colab ``elm_standard`` ("ELM"), whose parameters are not stored.
+
+    python -m engine.backtest --workers 4
+    python -m engine.backtest --sites wisata_brumbun --horizon 3
+"""
+import argparse
+import os
+import time
+from datetime import datetime
+
+import numpy as np
+
+from artifacts.columnar import read_artifact, write_pickle
+from artifacts.registry import ArtifactRegistry
+from engine import elm, trainer
+from engine.forecast import best_params
+
+MODELS = (elm.BASELINE_LABEL, "ELM-PSO")
+DEFAULT_PARAMS = {"min_train": 0.5, "horizon": 1, "step": 1}
+ORIGIN_CHUNK = 16
+
+
+def origins(n_rows, min_train=0.5, horizon=1, step=1):
+    """Training row counts ``t`` of the origins; ``min_train`` < 1 is a fraction of ``n_rows``."""
+    start = int(n_rows * min_train) if min_train < 1 else int(min_train)
+    return np.arange(max(start, 1), n_rows - horizon + 1, max(int(step), 1))
+
+
+def _predict_chunk(H, y, reg, chunk, horizon):
+    """Predictions ``(K, C, horizon)`` of the fits at the ascending origins ``chunk``."""
+    Ht = np.swapaxes(H, -1, -2)
+    bounds = np.concatenate([[0], chunk])
+    G = np.stack([Ht[:, :, a:b] @ H[:, a:b] for a, b in zip(bounds[:-1], bounds[1:])]).cumsum(axis=0)
+    r = np.stack([Ht[:, :, a:b] @ y[:, a:b, None] for a, b in zip(bounds[:-1], bounds[1:])]).cumsum(axis=0)
+    G = G + reg * np.eye(H.shape[-1])
+    try:
+        beta = np.linalg.solve(G, r)[..., 0]
+    except np.linalg.LinAlgError:
+        beta = (np.linalg.pinv(G) @ r)[..., 0]
+    rows = chunk[:, None] + np.arange(horizon)
+    return np.einsum("ckhl,kcl->kch", H[:, rows], beta)
+
+
+def _tasks(stem, artifact, ticks, horizon):
+    """``(stem, model, H, y, reg, chunk)`` for every origin chunk of one modelling artifact."""
+    _, (X_train, X_test, y_train, y_test) = elm.stack_components(artifact["splitted_data"])
+    X = np.concatenate([X_train, X_test], axis=1)
+    y = np.concatenate([y_train, y_test], axis=1)
+    elm_pso = artifact.get("elm_pso", {})
+    seed = elm_pso.get("SEED", artifact.get("elm_standard", {}).get("SEED", 42))
+    out = []
+    for model, params in zip(MODELS, (elm.BASELINE_PARAMS, best_params(elm_pso))):
+        W, b = elm.hidden_params(seed, X.shape[-1], int(params["neurons"]))
+        H = elm.hidden_layer(X, W, b, params["activation"])
+        reg = float(params.get("reg", 0.0))
+        out += [(stem, model, H, y, reg, ticks[i:i + ORIGIN_CHUNK]) for i in range(0, len(ticks), ORIGIN_CHUNK)]
+    return out
+
+
+def _run_task(task, horizon):
+    _, _, H, y, reg, chunk = task
+    return _predict_chunk(H, y, reg, chunk, horizon)
+
+
+def backtest_runs(runs, min_train=0.5, horizon=1, step=1, workers=1):
+    """``{stem: result}`` for ``{stem: modelling artifact}``; see ``build_backtest`` for the result layout."""
+    prepared, tasks = {}, []
+    for stem, artifact in runs.items():
+        n_rows = sum(np.asarray(part).shape[0] for part in next(iter(artifact["splitted_data"].values()))[2:])
+        ticks = origins(n_rows, min_train, horizon, step)
+        if len(ticks) == 0:
+            raise ValueError(f"{stem}: hanya {n_rows} baris window, terlalu sedikit untuk backtest")
+        prepared[stem] = ticks
+        tasks += _tasks(stem, artifact, ticks, horizon)
+
+    workers = max(1, min(int(workers or 1), len(tasks)))
+    if workers == 1:
+        preds = [_run_task(task, horizon) for task in tasks]
+    else:
+        with trainer.process_pool(workers, 1) as executor:
+            preds = list(executor.map(_run_task, tasks, [horizon] * len(tasks), chunksize=4))
+
+    results = {}
+    for stem, ticks in prepared.items():
+        mine = [(task, p) for task, p in zip(tasks, preds) if task[0] == stem]
+        y = mine[0][0][3]
+        rows = ticks[:, None] + np.arange(horizon)
+        actual = y[:, rows].sum(axis=0)
+        pred = np.stack([np.concatenate([p for task, p in mine if task[1] == model]).sum(axis=1) for model in MODELS])
+        scores = elm.metrics(actual.reshape(1, -1), pred.reshape(len(MODELS), -1))
+        results[stem] = {
+            "origins": ticks,
+            "actual": actual,
+            **{model: {
+                "pred": pred[i],
+                "metrics": {k: float(v[i]) for k, v in scores.items()},
+            } for i, model in enumerate(MODELS)},
+        }
+    return results
+
+
+def build_backtest(modelling, min_train=0.5, horizon=1, step=1, workers=1):
+    """Backtest artifact of a site from ``{file name: modelling artifact}``.
+
+    ``runs`` maps each modelling file stem to ``origins`` (training rows),
+    ``actual`` ``(K, horizon)`` and, per model, ``pred`` ``(K, horizon)`` and
+    pooled ``metrics`` (MAPE/MAE/RMSE/R2).
+    """
+    runs = {os.path.splitext(os.path.basename(name))[0]: artifact for name, artifact in modelling.items()}
+    return {
+        "runs": backtest_runs(runs, min_train, horizon, step, workers),
+        "min_train": min_train,
+        "horizon": horizon,
+        "step": step,
+        "timestamp": datetime.now().isoformat(),
+    }
+
+
+def main(argv=None):
+    from engine.pipeline import existing_outputs, site_slug
+
+    parser = argparse.ArgumentParser(description="Backtest rolling-origin untuk semua run modelling per wisata.")
+    parser.add_argument("--root", default=trainer.ROOT)
+    parser.add_argument("--sites", nargs="*", help="nama folder wisata (default: semua)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--min-train", type=float, default=DEFAULT_PARAMS["min_train"],
+                        help="baris latih di origin pertama (pecahan < 1 atau jumlah baris)")
+    parser.add_argument("--horizon", type=int, default=DEFAULT_PARAMS["horizon"])
+    parser.add_argument("--step", type=int, default=DEFAULT_PARAMS["step"])
+    args = parser.parse_args(argv)
+
+    registry = ArtifactRegistry(args.root)
+    workers = args.workers or os.cpu_count() or 1
+    t_start = time.time()
+    for site in registry.sites("modelling"):
+        entries = registry.group(site, "modelling")
+        site_dir = os.path.join(args.root, os.path.dirname(next(iter(entries.values())).rel_path))
+        if args.sites and os.path.basename(site_dir) not in args.sites:
+            continue
+        t_site = time.time()
+        modelling = {entry.path: read_artifact(entry.path) for entry in entries.values()}
+        artifact = build_backtest(modelling, args.min_train, args.horizon, args.step, workers)
+        out_name = existing_outputs(site_dir).get(("backtest", "", ""), f"backtest_{site_slug(site_dir)}.pkl")
+        write_pickle(os.path.join(site_dir, out_name), artifact)
+        best = min(artifact["runs"].items(), key=lambda kv: kv[1]["ELM-PSO"]["metrics"]["MAPE"])
+        print(f"{site}: {len(artifact['runs'])} run, {len(best[1]['origins'])} origin, "
+              f"terbaik {best[0]} (MAPE {best[1]['ELM-PSO']['metrics']['MAPE'] * 100:.2f}%) "
+              f"— {time.time() - t_site:.2f} s", flush=True)
+    print(f"Selesai dalam {time.time() - t_start:.1f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,133 @@
+"""Seed-ensemble forecasts with P10/P50/P90 bands.
+
+A member is one ELM hidden-layer seed, optionally on top of a fresh CEEMDAN
+noise realisation. Members are grouped into tasks that share a
+decomposition: the stored decomposition is reused by most members and each
+extra noise realisation is decomposed once and shared by all of its members.
+A task fits and rolls out every site for each of its seeds (see
+``engine.forecast``) and returns only the summed forecasts, so a member never
+outlives its task and the parent keeps one ``(N, S, H)`` array of totals.
+Tasks run on a process pool with a bounded number in flight; the site data is
+sent once per worker through the pool initializer.
+"""
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import get_context
+
+import numpy as np
+
+from artifacts.columnar import MinMaxParams
+from engine import ceemdan, forecast
+
+QUANTILES = (0.1, 0.5, 0.9)
+SEED_CHUNK = 16
+_WORKER = {"sites": None}
+
+
+def site_payload(modelling_artifact, normalisasi_artifact, ceemdan_params=None):
+    """The part of a site's artifacts an ensemble member needs (picklable, no sklearn objects)."""
+    elm_pso = modelling_artifact.get("elm_pso", {})
+    return {
+        "modelling": {"elm_pso": {k: elm_pso[k] for k in ("gbest_result", "best_params", "WINDOW_SIZE", "SEED")
+                                  if k in elm_pso}},
+        "normalisasi": {
+            "normalized_components": {k: np.asarray(v, dtype=float) for k, v in
+                                      normalisasi_artifact["normalized_components"].items()},
+            "scalers": {k: MinMaxParams.from_scaler(v) for k, v in normalisasi_artifact["scalers"].items()},
+        },
+        "series": np.asarray(normalisasi_artifact["original_series"], dtype=float).ravel(),
+        "ceemdan": {k: v for k, v in (ceemdan_params or {}).items() if k in ("trials", "epsilon")},
+    }
+
+
+def minmax(values, feature_range=(0, 1)):
+    """``MinMaxScaler().fit_transform`` of one component, returning the values and its ``MinMaxParams``."""
+    values = np.asarray(values, dtype=float).ravel()
+    lo, hi = feature_range
+    data_min, data_max = values.min(), values.max()
+    data_range = (data_max - data_min) or 1.0
+    scale = (hi - lo) / data_range
+    params = MinMaxParams(
+        np.array([lo - data_min * scale]), np.array([scale]), np.array([data_min]), np.array([data_max]),
+        np.array([data_range]), feature_range=tuple(feature_range), n_samples_seen_=values.size,
+    )
+    return values * scale + params.min_[0], params
+
+
+def redecompose(site, noise_seed):
+    """Normalised components of a new CEEMDAN noise realisation, scaled like the stored ones."""
+    components = ceemdan.decompose_cached(site["series"], seed=noise_seed, workers=1, **site["ceemdan"])
+    feature_range = next(iter(site["normalisasi"]["scalers"].values())).feature_range
+    normalized, scalers = {}, {}
+    for name, values in components.items():
+        normalized[name], scalers[name] = minmax(values, feature_range)
+    return {"normalized_components": normalized, "scalers": scalers}
+
+
+def _init_worker(sites):
+    _WORKER["sites"] = sites
+
+
+def _run_task(noise_seed, elm_seeds, horizon):
+    sites = _WORKER["sites"]
+    names = sorted(sites)
+    normalised = {
+        name: sites[name]["normalisasi"] if noise_seed is None else redecompose(sites[name], noise_seed)
+        for name in names
+    }
+    out = np.empty((len(elm_seeds), len(names), horizon))
+    for i, seed in enumerate(elm_seeds):
+        fits = {name: forecast.fit_site(sites[name]["modelling"], normalised[name], seed=seed) for name in names}
+        result = forecast.rollout(fits, horizon)
+        out[i] = [result[name]["total"] for name in names]
+    return out
+
+
+def plan(n_members, noise_realizations=0, base_seed=42):
+    """Tasks ``(noise_seed or None, [elm seeds])``: members spread evenly over the decompositions."""
+    n_members = max(1, int(n_members))
+    noise_seeds = [None] + [base_seed + 1000 + k for k in range(int(noise_realizations))]
+    seeds = base_seed + np.arange(n_members)
+    tasks = []
+    for k, noise_seed in enumerate(noise_seeds):
+        mine = seeds[k::len(noise_seeds)].tolist()
+        # Only the stored decomposition is cheap to share, so only its seeds are split into chunks.
+        step = SEED_CHUNK if noise_seed is None else max(len(mine), 1)
+        tasks += [(noise_seed, mine[i:i + step]) for i in range(0, len(mine), step)]
+    return tasks
+
+
+def run(sites, horizon=forecast.MAX_HORIZON, n_members=50, noise_realizations=0, base_seed=42, workers=None):
+    """``{"sites", "members" (N, S, H), "quantiles" {q: (S, H)}}`` for ``{site: site_payload(...)}``."""
+    names = sorted(sites)
+    tasks = plan(n_members, noise_realizations, base_seed)
+    members = np.empty((sum(len(seeds) for _, seeds in tasks), len(names), horizon))
+    offsets = np.cumsum([0] + [len(seeds) for _, seeds in tasks])
+    workers = max(1, min(workers or os.cpu_count() or 1, len(tasks)))
+
+    if workers == 1:
+        _init_worker(sites)
+        try:
+            for i, (noise_seed, seeds) in enumerate(tasks):
+                members[offsets[i]:offsets[i + 1]] = _run_task(noise_seed, seeds, horizon)
+        finally:
+            _WORKER["sites"] = None
+    else:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"),
+                                 initializer=_init_worker, initargs=(sites,)) as executor:
+            pending = {}
+            queue = iter(enumerate(tasks))
+            for i, (noise_seed, seeds) in queue:
+                pending[executor.submit(_run_task, noise_seed, seeds, horizon)] = i
+                # At most two tasks per worker in flight, so results never pile up.
+                while len(pending) >= 2 * workers:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for fut in done:
+                        j = pending.pop(fut)
+                        members[offsets[j]:offsets[j + 1]] = fut.result()
+            for fut in list(pending):
+                j = pending.pop(fut)
+                members[offsets[j]:offsets[j + 1]] = fut.result()
+
+    bands = np.quantile(members, QUANTILES, axis=0)
+    return {"sites": names, "members": members, "quantiles": dict(zip(QUANTILES, bands))}
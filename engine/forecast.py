@@ -0,0 +1,135 @@
+"""Recursive multi-month forecast of every site at once.
+
+Each site's best ELM-PSO configuration is refitted on all windows of its
+normalised components (one batched solve per site, see ``engine.elm``), or,
+when the run carries an OS-ELM state covering exactly those windows (see
+``engine.oselm``), its updated weights are used as they are. The
+fitted sites are then padded to a common number of components and hidden
+units and rolled forward together: one step is a single
+``(S, C, w) x (S, w, L)`` product for all sites and components, and the
+prediction is shifted into the window for the next step. Padded components
+and units carry zero output weights, so they never reach the result.
+Forecasts are inverse-scaled per component with the stored MinMax scalers
+and summed into the visitor count (floored at zero). Every step is clipped to the scaler's
+``feature_range`` (the range the component was observed in) before it is fed
+back, so a component that overfits its noise cannot blow up over the horizon.
+"""
+import numpy as np
+
+from engine import elm
+from engine.pso import ACTIVATION_NAMES
+
+MAX_HORIZON = 12
+
+
+def best_params(elm_pso):
+    """Hyperparameters of a stored ``elm_pso`` dict, in the order used by ``elm.retrain_artifact``."""
+    return elm_pso.get("gbest_result") or elm_pso.get("best_params") or elm.BASELINE_PARAMS
+
+
+def _oselm_state(elm_pso, names, n_rows):
+    """The run's ``os_elm`` state when it was fitted on exactly ``n_rows`` windows of ``names``, else None."""
+    state = elm_pso.get("os_elm")
+    if state is None or list(state["components"]) != names or state["n_rows"] != n_rows:
+        return None
+    return state
+
+
+def fit_site(modelling_artifact, normalisasi_artifact, seed=None, dtype=np.float64):
+    """Refit a site's best model on its full normalised components and keep what the rollout needs.
+
+    ``seed`` overrides the stored ``SEED`` of the hidden layer (ensemble members);
+    ``dtype`` is the precision of the fit and of the rollout. Without ``seed``, a
+    stored OS-ELM state in step with the components replaces the refit
+    (``source`` ``"os_elm"`` instead of ``"refit"``).
+    """
+    elm_pso = modelling_artifact.get("elm_pso", {})
+    params = best_params(elm_pso)
+    window = int(elm_pso.get("WINDOW_SIZE", 3))
+    use_state = seed is None
+    seed = elm_pso.get("SEED", 42) if seed is None else seed
+    components = normalisasi_artifact["normalized_components"]
+    scalers = normalisasi_artifact["scalers"]
+    names = list(components)
+    series = np.stack([np.asarray(components[k], dtype=float).ravel() for k in names])
+    state = _oselm_state(elm_pso, names, series.shape[1] - window) if use_state else None
+    if state is not None:
+        model = {k: np.asarray(state[k], dtype=dtype) for k in ("W", "b", "beta")}
+        model["activation"] = state["activation"]
+    else:
+        model = elm.fit(elm.windows(series, window), series[:, window:], params["neurons"], params["activation"],
+                        params.get("reg", 0.0), seed, dtype)
+    return {
+        "source": "os_elm" if state is not None else "refit",
+        "updates": len(state["updates"]) if state is not None else 0,
+        "components": names,
+        "window": window,
+        "W": model["W"],
+        "b": model["b"],
+        "beta": model["beta"],
+        "activation": model["activation"],
+        "last": series[:, -window:].copy(),
+        "min_": np.array([float(np.ravel(scalers[k].min_)[0]) for k in names]),
+        "scale_": np.array([float(np.ravel(scalers[k].scale_)[0]) for k in names]),
+        "range": np.array([tuple(map(float, scalers[k].feature_range)) for k in names]),
+    }
+
+
+def _rollout_group(fits, horizon):
+    S = len(fits)
+    C = max(len(f["components"]) for f in fits)
+    L = max(f["W"].shape[1] for f in fits)
+    w = fits[0]["window"]
+    dtype = np.result_type(*(f["W"] for f in fits))
+    X = np.zeros((S, C, w), dtype)
+    W = np.zeros((S, w, L), dtype)
+    b = np.zeros((S, 1, L), dtype)
+    beta = np.zeros((S, C, L), dtype)
+    min_ = np.zeros((S, C))
+    scale_ = np.ones((S, C))
+    lo = np.full((S, C), -np.inf, dtype)
+    hi = np.full((S, C), np.inf, dtype)
+    act = np.zeros((S, 1, 1), dtype=int)
+    for i, f in enumerate(fits):
+        c, n = len(f["components"]), f["W"].shape[1]
+        X[i, :c] = f["last"]
+        W[i, :, :n] = f["W"]
+        b[i, 0, :n] = f["b"]
+        beta[i, :c, :n] = f["beta"]
+        min_[i, :c] = f["min_"]
+        scale_[i, :c] = f["scale_"]
+        lo[i, :c], hi[i, :c] = f["range"].T
+        act[i] = ACTIVATION_NAMES.index(f["activation"])
+
+    norm = np.empty((S, C, horizon), dtype)
+    for h in range(horizon):
+        Z = X @ W + b
+        A = np.select([act == 0, act == 1], [elm.ACTIVATIONS["relu"](Z), elm.ACTIVATIONS["sigmoid"](Z)],
+                      elm.ACTIVATIONS["tanh"](Z))
+        step = np.clip(np.einsum("scl,scl->sc", A, beta), lo, hi)
+        norm[:, :, h] = step
+        X = np.concatenate([X[:, :, 1:], step[:, :, None]], axis=2)
+    orig = (norm - min_[..., None]) / scale_[..., None]
+    return norm, orig
+
+
+def rollout(fits, horizon):
+    """``{site: {"components", "norm" (C, H), "orig" (C, H), "total" (H,)}}`` for ``{site: fit_site(...)}``."""
+    horizon = int(horizon)
+    if not 1 <= horizon <= MAX_HORIZON:
+        raise ValueError(f"horizon harus 1–{MAX_HORIZON} bulan, bukan {horizon}")
+    groups = {}
+    for site, f in fits.items():
+        groups.setdefault(f["window"], []).append(site)
+    out = {}
+    for sites in groups.values():
+        norm, orig = _rollout_group([fits[s] for s in sites], horizon)
+        for i, site in enumerate(sites):
+            c = len(fits[site]["components"])
+            out[site] = {
+                "components": fits[site]["components"],
+                "norm": norm[i, :c],
+                "orig": orig[i, :c],
+                "total": np.maximum(orig[i, :c].sum(axis=0), 0.0),
+            }
+    return out
@@ -0,0 +1,261 @@
+"""Chunked ingestion of visitor data files into the monthly ``no, bulan, tahun, jumlah`` layout.
+
+A file is read ``chunk_rows`` rows at a time (``read_csv(chunksize=...)`` or
+openpyxl's read-only row stream for ``.xlsx``), keeping only the known columns
+with their dtypes declared up front (``DTYPES``): the highly repetitive ones
+(dates, month names, years, sites) as categoricals, so each distinct value is
+parsed once per chunk and broadcast back through the category codes. Each
+chunk is validated and converted with vectorized operations and then dropped,
+so peak memory follows the chunk size rather than the file size. Two layouts
+are accepted:
+
+* monthly: ``no, bulan, tahun, jumlah`` (one row per month, kept as is);
+* daily: ``tanggal, jumlah`` (e.g. gate-counter exports), summed per month on
+  the fly into small per-chunk partials that are combined at the end.
+
+Either layout may carry a site column (``wisata``/``lokasi``/``site``); the
+result then holds one monthly frame per site.
+"""
+import io
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import take
+
+CHUNK_ROWS = 100_000
+BULAN = {
+    "januari": 1, "februari": 2, "maret": 3, "april": 4, "mei": 5, "juni": 6,
+    "juli": 7, "agustus": 8, "september": 9, "oktober": 10, "november": 11, "desember": 12,
+}
+NAMA_BULAN = {v: k.capitalize() for k, v in BULAN.items()}
+MONTHLY_COLUMNS = ["no", "bulan", "tahun", "jumlah"]
+DAILY_COLUMNS = ["tanggal", "jumlah"]
+SITE_COLUMNS = ["wisata", "lokasi", "site"]
+DTYPES = {"no": str, "jumlah": str, "bulan": "category", "tahun": "category", "tanggal": "category",
+          **{c: "category" for c in SITE_COLUMNS}}
+_SAMPLES = 5
+
+
+def _clean(name):
+    return str(name).strip().lower()
+
+
+def _excel_chunks(file, chunk_rows):
+    from openpyxl import load_workbook
+
+    wb = load_workbook(file, read_only=True, data_only=True)
+    try:
+        rows = wb.worksheets[0].iter_rows(values_only=True)
+        header = [_clean(c) for c in next(rows, ())]
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) == chunk_rows:
+                yield pd.DataFrame(batch, columns=header, dtype=str)
+                batch = []
+        if batch or not header:
+            yield pd.DataFrame(batch, columns=header, dtype=str)
+    finally:
+        wb.close()
+
+
+def iter_chunks(file, name, chunk_rows=CHUNK_ROWS):
+    """Frames of at most ``chunk_rows`` rows of the known columns (``DTYPES``), names stripped and lower-case."""
+    name = name.lower()
+    if name.endswith(".csv"):
+        header = pd.read_csv(file, nrows=0).columns
+        if hasattr(file, "seek"):
+            file.seek(0)
+        usecols = [c for c in header if _clean(c) in DTYPES]
+        reader = pd.read_csv(file, chunksize=chunk_rows, usecols=usecols, skipinitialspace=True,
+                             dtype={c: DTYPES[_clean(c)] for c in usecols})
+        for chunk in reader:
+            chunk.columns = [_clean(c) for c in chunk.columns]
+            yield chunk
+        return
+    if name.endswith(".xlsx"):
+        chunks = _excel_chunks(file, chunk_rows)
+    else:
+        # Legacy .xls has no streaming reader; it is read whole and then handled like the others.
+        df = pd.read_excel(file, dtype=str)
+        df.columns = [_clean(c) for c in df.columns]
+        chunks = (df.iloc[start:start + chunk_rows] for start in range(0, max(len(df), 1), chunk_rows))
+    for chunk in chunks:
+        chunk = chunk[[c for c in chunk.columns if c in DTYPES]]
+        yield chunk.astype({c: DTYPES[c] for c in chunk.columns if DTYPES[c] == "category"})
+
+
+def by_value(column, parse):
+    """``parse`` applied once to each distinct value of ``column`` and broadcast back to its rows."""
+    column = column.astype("category")
+    parsed = parse(pd.Series(column.cat.categories.astype(str), dtype=object))
+    return pd.Series(take(parsed.to_numpy(), column.cat.codes.to_numpy(), allow_fill=True), index=column.index)
+
+
+def month_numbers(values):
+    """Month names (``"Januari"``, ``" maret "``) or numbers 1–12 -> ``1..12``, NaN where invalid."""
+    text = values.astype("string").str.strip().str.lower()
+    by_name = text.map(BULAN)
+    by_number = pd.to_numeric(text, errors="coerce")
+    by_number = by_number.where(by_number.isin(range(1, 13)))
+    return by_name.fillna(by_number).astype(float)
+
+
+def parse_dates(values):
+    """ISO dates first (fast path), then day-first dates such as ``31/01/2024``; NaT where invalid."""
+    dates = pd.to_datetime(values, errors="coerce", format="ISO8601")
+    rest = dates.isna() & values.notna()
+    if rest.any():
+        dates[rest] = pd.to_datetime(values[rest], errors="coerce", dayfirst=True, format="mixed")
+    return dates
+
+
+class _Problems:
+    """Count of invalid values per column and the first few of them."""
+
+    def __init__(self):
+        self.counts = {}
+        self.samples = {}
+
+    def add(self, column, values, parsed):
+        bad = values[parsed.isna() & values.notna()]
+        if len(bad):
+            self.counts[column] = self.counts.get(column, 0) + len(bad)
+            samples = self.samples.setdefault(column, [])
+            samples += bad.iloc[:_SAMPLES - len(samples)].astype(str).tolist()
+
+    def report(self):
+        return {c: {"jumlah": n, "contoh": self.samples[c]} for c, n in self.counts.items()}
+
+
+def _site_column(columns):
+    return next((c for c in SITE_COLUMNS if c in columns), None)
+
+
+def _numbers(values):
+    return pd.to_numeric(values, errors="coerce")
+
+
+def _sites(chunk, site_col):
+    return by_value(chunk[site_col], lambda s: s.str.strip()).fillna("") if site_col else ""
+
+
+def _monthly_chunk(chunk, site_col, problems):
+    bulan_num = by_value(chunk["bulan"], month_numbers)
+    problems.add("bulan", chunk["bulan"], bulan_num)
+    tahun = by_value(chunk["tahun"], _numbers)
+    problems.add("tahun", chunk["tahun"], tahun)
+    jumlah = _numbers(chunk["jumlah"])
+    problems.add("jumlah", chunk["jumlah"], jumlah)
+    bulan = by_value(chunk["bulan"], lambda s: month_numbers(s).map(NAMA_BULAN).fillna(s.str.strip().str.capitalize()))
+    return pd.DataFrame({
+        "site": _sites(chunk, site_col),
+        "no": _numbers(chunk["no"]),
+        "bulan": bulan,
+        "tahun": tahun.astype(float),
+        "jumlah": jumlah,
+    })
+
+
+def _daily_chunk(chunk, site_col, problems):
+    tanggal = by_value(chunk["tanggal"], parse_dates)
+    problems.add("tanggal", chunk["tanggal"], tanggal)
+    jumlah = _numbers(chunk["jumlah"])
+    problems.add("jumlah", chunk["jumlah"], jumlah)
+    valid = tanggal.notna()
+    tanggal = pd.DatetimeIndex(tanggal[valid])
+    daily = pd.DataFrame({
+        "site": _sites(chunk, site_col)[valid] if site_col else "",
+        "tahun": tanggal.year,
+        "bulan_num": tanggal.month,
+        "jumlah": jumlah[valid].to_numpy(),
+    })
+    return daily.groupby(["site", "tahun", "bulan_num"], sort=False).agg(
+        jumlah=("jumlah", "sum"), terisi=("jumlah", "count"), hari=("jumlah", "size"),
+    )
+
+
+def _finish_monthly(rows):
+    out = {}
+    for site, df in rows.groupby("site", sort=True):
+        df = df.drop(columns="site").reset_index(drop=True)
+        if df["no"].isna().all():
+            df["no"] = np.arange(1, len(df) + 1)
+        df["no"] = df["no"].astype("Int64")
+        df["tahun"] = df["tahun"].astype("Int64")
+        out[site] = df
+    return out
+
+
+def _finish_daily(partials):
+    totals = pd.concat(partials).groupby(level=[0, 1, 2]).sum()
+    # A month without a single valid count stays missing instead of becoming 0.
+    totals["jumlah"] = totals["jumlah"].where(totals["terisi"] > 0)
+    out, incomplete = {}, 0
+    for site, df in totals.groupby(level=0, sort=True):
+        df = df.droplevel(0).sort_index().reset_index()
+        days = pd.to_datetime(dict(year=df["tahun"], month=df["bulan_num"], day=1)).dt.days_in_month
+        incomplete += int((df["hari"] < days).sum())
+        jumlah = df["jumlah"]
+        if jumlah.notna().all() and np.allclose(jumlah, jumlah.round()):
+            jumlah = jumlah.round().astype(np.int64)
+        out[site] = pd.DataFrame({
+            "no": pd.array(np.arange(1, len(df) + 1), dtype="Int64"),
+            "bulan": df["bulan_num"].map(NAMA_BULAN),
+            "tahun": df["tahun"].astype("Int64"),
+            "jumlah": jumlah,
+        })
+    return out, incomplete
+
+
+def ingest(file, name, chunk_rows=CHUNK_ROWS):
+    """Read ``file`` chunk by chunk into ``{"sites": {site or "": monthly frame}, ...}`` plus a report.
+
+    Raises ``ValueError`` when the header has neither the monthly nor the daily columns, or when no row
+    yields a valid month (a header-only file, a daily file whose dates are all invalid).
+    """
+    if isinstance(file, (bytes, bytearray)):
+        file = io.BytesIO(file)
+    problems = _Problems()
+    layout, site_col = None, None
+    parts = []
+    n_rows = n_chunks = 0
+    for chunk in iter_chunks(file, name, chunk_rows):
+        if layout is None:
+            columns = set(chunk.columns)
+            if set(MONTHLY_COLUMNS) <= columns:
+                layout = "bulanan"
+            elif set(DAILY_COLUMNS) <= columns:
+                layout = "harian"
+            else:
+                missing = [c for c in MONTHLY_COLUMNS if c not in columns]
+                raise ValueError(
+                    f"kolom yang hilang: {', '.join(missing)}. Pastikan ada kolom: no, bulan, tahun, jumlah "
+                    "(data bulanan) atau tanggal, jumlah (data harian)."
+                )
+            site_col = _site_column(columns)
+        n_rows += len(chunk)
+        n_chunks += 1
+        build = _monthly_chunk if layout == "bulanan" else _daily_chunk
+        parts.append(build(chunk, site_col, problems))
+    if layout is None:
+        raise ValueError("file kosong")
+
+    incomplete = 0
+    if layout == "bulanan":
+        sites = _finish_monthly(pd.concat(parts, ignore_index=True))
+    else:
+        sites, incomplete = _finish_daily(parts)
+    if not sites:
+        raise ValueError(f"tidak ada baris dengan {'bulan/tahun' if layout == 'bulanan' else 'tanggal'} yang valid "
+                         f"dari {n_rows} baris data")
+    return {
+        "sites": sites,
+        "layout": layout,
+        "site_column": site_col,
+        "rows": n_rows,
+        "chunks": n_chunks,
+        "chunk_rows": chunk_rows,
+        "invalid": problems.report(),
+        "incomplete_months": incomplete,
+    }
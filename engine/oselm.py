@@ -0,0 +1,160 @@
+"""Online-sequential ELM (OS-ELM) updates of the stored ELM-PSO models.
+
+The ridge solution ``beta = (H^T H + reg I)^-1 H^T y`` is kept together with
+its inverse covariance ``P = (H^T H + reg I)^-1`` for every component. New
+window rows ``(H_k, y_k)`` are then absorbed with one recursive least-squares
+block step, batched over the components::
+
+    P    <- P - P H_k^T (I + H_k P H_k^T)^-1 H_k P
+    beta <- beta + P H_k^T (y_k - H_k beta)
+
+which gives the same weights as refitting on all rows seen so far, for the
+cost of a ``(k x k)`` solve instead of an ``(L x L)`` one over the history.
+The state starts from the same fit as ``forecast.fit_site`` (every window of
+the full normalised series) and lives under ``elm_pso["os_elm"]`` in the
+modelling artifact; ``fit_site`` uses its weights instead of refitting while
+it covers exactly the windows of the site's normalised components.
+"""
+import os
+from datetime import datetime
+
+import numpy as np
+
+from artifacts import columnar
+from engine import elm
+from engine.ceemdan import decompose_cached
+from engine.forecast import best_params
+
+
+def init_state(series, names, elm_pso):
+    """OS-ELM state fitted on every window of ``series (C, n)`` (components ``names``) with the run's best
+    hyperparameters: the model ``forecast.fit_site`` refits on the same series."""
+    params = best_params(elm_pso)
+    window = int(elm_pso.get("WINDOW_SIZE", 3))
+    X, y = elm.windows(series, window), series[:, window:]
+    W, b = elm.hidden_params(elm_pso.get("SEED", 42), X.shape[-1], int(params["neurons"]))
+    H = elm.hidden_layer(X, W, b, params["activation"])
+    reg = float(params.get("reg", 0.0))
+    Ht = np.swapaxes(H, -1, -2)
+    A = Ht @ H + reg * np.eye(H.shape[-1])
+    try:
+        P = np.linalg.inv(A)
+    except np.linalg.LinAlgError:
+        P = np.linalg.pinv(A)
+    beta = (P @ (Ht @ y[..., None]))[..., 0]
+    return {
+        "components": names,
+        "W": W,
+        "b": b,
+        "activation": params["activation"],
+        "reg": reg,
+        "beta": beta,
+        "P": P,
+        "n_rows": int(X.shape[1]),
+        "updates": [],
+    }
+
+
+def update(state, X_new, y_new):
+    """New state after absorbing the rows ``X_new (C, k, w)`` / ``y_new (C, k)``; ``state`` is not modified."""
+    H = elm.hidden_layer(np.asarray(X_new, dtype=float), state["W"], state["b"], state["activation"])
+    Ht = np.swapaxes(H, -1, -2)
+    P, beta = state["P"], state["beta"]
+    PHt = P @ Ht
+    S = np.eye(H.shape[-2]) + H @ PHt
+    P = P - PHt @ np.linalg.solve(S, np.swapaxes(PHt, -1, -2))
+    resid = np.asarray(y_new, dtype=float) - np.einsum("ckl,cl->ck", H, beta)
+    beta = beta + np.einsum("cij,cjk,ck->ci", P, Ht, resid)
+    return {
+        **state,
+        "beta": beta,
+        "P": P,
+        "n_rows": state["n_rows"] + H.shape[-2],
+        "updates": [*state["updates"], {"rows": int(H.shape[-2]), "timestamp": datetime.now().isoformat()}],
+    }
+
+
+def new_windows(series, n_new, window):
+    """Window rows ``(C, n_new, w)`` / targets ``(C, n_new)`` for the last ``n_new`` points of ``series (C, n)``."""
+    series = np.asarray(series, dtype=float)
+    n = series.shape[1]
+    return elm.windows(series[:, n - n_new - window:], window), series[:, n - n_new:]
+
+
+def extend_normalisasi(normalisasi_artifact, new_values, seed=42, workers=1, window=3, **ceemdan_params):
+    """Normalisasi artifact with ``new_values`` appended to the series and to every normalised component.
+
+    This is an approximation: the extended series is decomposed again with
+    CEEMDAN only to read off the components of the new months, which are joined
+    onto the stored history (kept, with its scalers, so the OS-ELM state stays
+    valid). CEEMDAN is not causal, so the new decomposition differs from the
+    stored one and the components step at the join. The largest gap over the
+    last ``window`` stored months (the lags of the first new windows), in
+    normalised units, is appended to ``sambungan_oselm`` for the UI to report;
+    a large gap calls for a full pipeline rerun instead.
+    """
+    original = np.asarray(normalisasi_artifact["original_series"], dtype=float).ravel()
+    new_values = np.asarray(new_values, dtype=float).ravel()
+    extended = np.concatenate([original, new_values])
+    components = decompose_cached(extended, seed=seed, workers=workers, **ceemdan_params)
+    stored = normalisasi_artifact["normalized_components"]
+    if list(components) != list(stored):
+        raise ValueError(
+            f"dekomposisi data baru menghasilkan {len(components)} komponen, bukan {len(stored)}; "
+            "jalankan ulang pipeline lengkap"
+        )
+    scalers = normalisasi_artifact["scalers"]
+    n_old = len(original)
+    gaps = {
+        k: float(np.max(np.abs(
+            np.asarray(scalers[k].transform(components[k][n_old - window:n_old].reshape(-1, 1)), dtype=float).ravel()
+            - np.asarray(stored[k], dtype=float).ravel()[n_old - window:]
+        )))
+        for k in stored
+    }
+    worst = max(gaps, key=gaps.get)
+    join = {
+        "bulan_baru": len(new_values),
+        "selisih_maks": gaps[worst],
+        "komponen": worst,
+        "params": {"seed": seed, **ceemdan_params},
+        "waktu": datetime.now().isoformat(),
+    }
+    normalized = {
+        k: np.concatenate([
+            np.asarray(stored[k], dtype=float).ravel(),
+            np.asarray(scalers[k].transform(components[k][-len(new_values):].reshape(-1, 1)), dtype=float).ravel(),
+        ])
+        for k in stored
+    }
+    return {
+        **normalisasi_artifact,
+        "normalized_components": normalized,
+        "original_series": extended,
+        "sambungan_oselm": [*normalisasi_artifact.get("sambungan_oselm", []), join],
+    }
+
+
+def update_artifact(artifact, series, n_new):
+    """Modelling artifact with its ``os_elm`` state advanced by the last ``n_new`` points of ``series``.
+
+    ``series`` is ``{component: normalised values}`` including the new points; the
+    artifact's ``splitted_data`` and metrics are left as they were trained. Without
+    a state covering exactly the series before the new points, one is first fitted on it.
+    """
+    elm_pso = artifact.get("elm_pso", {})
+    window = int(elm_pso.get("WINDOW_SIZE", 3))
+    names = list(series)
+    stacked = np.stack([np.asarray(series[k], dtype=float).ravel() for k in names])
+    state = elm_pso.get("os_elm")
+    if state is None or list(state["components"]) != names or state["n_rows"] != stacked.shape[1] - n_new - window:
+        state = init_state(stacked[:, :-n_new], names, elm_pso)
+    X_new, y_new = new_windows(stacked, n_new, window)
+    return {**artifact, "elm_pso": {**elm_pso, "os_elm": update(state, X_new, y_new)}}
+
+
+def save(path, artifact):
+    """Atomically write ``artifact`` as the pickle behind a registry path (a ``.art`` entry gets its ``.pkl``)."""
+    if path.endswith(columnar.SUFFIX):
+        path = os.path.splitext(path)[0] + ".pkl"
+    return columnar.write_pickle(path, artifact)
@@ -0,0 +1,499 @@
+"""Headless, incremental rebuild of every artifact from the raw monthly data.
+
+The stages of a site form a small DAG::
+
+    data_<slug>.csv or store -> preprocessing -> ceemdan -> normalisasi -> split (80/20, 90/10)
+        -> modelling (split x config) -> backtest -> comparison, forecast
+
+Every node is addressed by a hash of its stage, its parameters (seed, split
+ratio, PSO config, window size, CEEMDAN trials/epsilon, backtest origins) and the keys of its
+inputs; the raw node's key is the hash of the data file, or for a site in the
+local visitor store (``engine.store``, which then takes precedence) the key of
+its stored months, read with one indexed query. ``pipeline.json`` in
+the site folder records, per output file, the node key and the file hash it
+was written with. A run rebuilds a node only when its key changed or its file
+is missing or was replaced since (e.g. by an OS-ELM update), so appending a
+month to one site's data rebuilds that site alone. A file that ``pipeline.json``
+does not record (the shipped Colab pickles on a first run) is never
+overwritten without ``--force``. Sites are independent and
+are built in parallel worker processes, one CEEMDAN/PSO run per worker.
+
+    python -m engine.pipeline --init-raw            # data_<slug>.csv dari artifact preprocessing
+    python -m engine.pipeline --dry-run             # tampilkan node yang usang saja
+    python -m engine.pipeline --force               # juga timpa pickle yang tidak tercatat di pipeline.json
+    python -m engine.pipeline --workers 4 --sites wisata_brumbun
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import as_completed
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from artifacts.columnar import read_artifact, write_pickle
+from artifacts.registry import classify, file_hash
+from engine import backtest, ceemdan, elm, forecast, pso, store, trainer
+from engine.ensemble import minmax
+from engine.ingest import BULAN
+
+ROOT = trainer.ROOT
+MANIFEST = "pipeline.json"
+SPLIT_RATIOS = {"80_20": 0.8, "90_10": 0.9}
+DEFAULT_PARAMS = {
+    "seed": 42,
+    "window_size": 3,
+    "ceemdan": {"trials": 100, "epsilon": 0.005},
+    "splits": list(SPLIT_RATIOS),
+    "configs": list(pso.CONFIGS),
+    "backtest": backtest.DEFAULT_PARAMS,
+    "precision": "float64",
+}
+
+Node = namedtuple("Node", "name out_name deps params build")
+
+
+def node_key(name, params, dep_keys):
+    payload = json.dumps([name, params, dep_keys], sort_keys=True, default=str).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+# ---- stage builders (same layouts as the Colab pickles) ----
+
+def read_raw(path):
+    df = pd.read_excel(path) if path.endswith((".xlsx", ".xls")) else pd.read_csv(path)
+    df.columns = [str(c).strip().lower() for c in df.columns]
+    missing = {"bulan", "tahun", "jumlah"} - set(df.columns)
+    if missing:
+        raise ValueError(f"{path}: kolom {sorted(missing)} tidak ditemukan")
+    return df
+
+
+def build_preprocessing(raw):
+    """Duplicates dropped, dates parsed, zeros and missing ``jumlah`` imputed with the median of the rest.
+
+    ValueError (naming the rows) when a ``bulan`` is not a month name or a ``tahun`` not a whole year.
+    """
+    df = raw[["bulan", "tahun", "jumlah"]].copy()
+    df["bulan"] = df["bulan"].astype(str).str.strip().str.capitalize()
+    tahun = pd.to_numeric(df["tahun"], errors="coerce")
+    bad = df["bulan"].str.lower().map(BULAN).isna() | tahun.isna() | (tahun % 1 != 0)
+    if bad.any():
+        rows = [int(i) + 1 for i in np.flatnonzero(bad.to_numpy())]
+        sample = raw.loc[bad, ["bulan", "tahun"]].head(3).to_dict("records")
+        raise ValueError(f"{len(rows)} baris tanpa bulan/tahun yang valid: baris ke-{rows[:10]} (contoh: {sample})")
+    df["tahun"] = tahun.astype(int)
+    df["jumlah"] = pd.to_numeric(df["jumlah"], errors="coerce")
+    missing_info = df.isna().sum()
+    n_before = len(df)
+    df = df.drop_duplicates(subset=["bulan", "tahun"], keep="last")
+    n_after = len(df)
+    df["bulan_num"] = df["bulan"].str.lower().map(BULAN).astype(int)
+    df["tanggal"] = pd.to_datetime(dict(year=df["tahun"], month=df["bulan_num"], day=1))
+    df = df.sort_values("tanggal").reset_index(drop=True)
+
+    zero = df["jumlah"] == 0
+    bad = df["jumlah"].isna() | zero
+    median = float(df.loc[~bad, "jumlah"].median())
+    n_zero = int(zero.sum())
+    idx_zero = df.index[zero].tolist()
+    idx_missing = df.index[df["jumlah"].isna()].tolist()
+    df.loc[bad, "jumlah"] = median
+    if np.allclose(df["jumlah"], df["jumlah"].round()):
+        df["jumlah"] = df["jumlah"].round().astype(np.int64)
+    idx = df.index[bad].tolist()
+    return {
+        "df_preprocessed": df,
+        "median_jumlah": median,
+        "jumlah_col": "jumlah",
+        "missing_info": missing_info,
+        "total_missing": int(missing_info.sum()),
+        "n_zero": n_zero,
+        "idx_imputasi": idx,
+        "idx_nol": idx_zero,
+        "idx_kosong": idx_missing,
+        "baris_imputasi": df.loc[idx],
+        "n_before": n_before,
+        "n_after": n_after,
+        "n_dup": n_before - n_after,
+    }
+
+
+def build_ceemdan(preprocessing, trials, epsilon, seed):
+    series = preprocessing["df_preprocessed"]["jumlah"].to_numpy(dtype=float)
+    components = ceemdan.decompose_cached(series, trials=trials, epsilon=epsilon, seed=seed, workers=1)
+    return ceemdan.build_artifact(series, components, seed, trials=trials, epsilon=epsilon)
+
+
+def build_normalisasi(ceemdan_artifact):
+    normalized, scalers = {}, {}
+    for name, values in ceemdan_artifact["components"].items():
+        normalized[name], scalers[name] = minmax(values)
+    return {
+        "normalized_components": normalized,
+        "scalers": scalers,
+        "original_series": np.asarray(ceemdan_artifact["original_series"], dtype=float),
+    }
+
+
+def build_split(normalisasi, ratio):
+    components = normalisasi["normalized_components"]
+    series = np.asarray(normalisasi["original_series"], dtype=float)
+    N = len(series)
+    split_index = int(N * ratio)
+    return {
+        "train_components": {k: np.asarray(v)[:split_index] for k, v in components.items()},
+        "test_components": {k: np.asarray(v)[split_index:] for k, v in components.items()},
+        "y_train": series[:split_index],
+        "y_test": series[split_index:],
+        "train_ratio": ratio,
+        "split_index": split_index,
+        "N": N,
+        "label": f"{round(ratio * 100)}/{round((1 - ratio) * 100)}",
+    }
+
+
+def _best_run(modelling, backtest_artifact=None):
+    """``(file name, artifact)`` of the run with the lowest ELM-PSO backtest MAPE, or the lowest MAPE Test
+    unless every run has been backtested (the same basis as the "Terbaik?" flag)."""
+    runs = (backtest_artifact or {}).get("runs", {})
+    stems = {name: os.path.splitext(os.path.basename(name))[0] for name in modelling}
+    backtested = all(stem in runs for stem in stems.values())
+
+    def score(kv):
+        if backtested:
+            return runs[stems[kv[0]]]["ELM-PSO"]["metrics"]["MAPE"]
+        return kv[1]["elm_pso"]["metrics_test"]["MAPE"]
+
+    return min(modelling.items(), key=score)
+
+
+def _inverse_sum(pred, names, scalers):
+    """Normalised component predictions ``(C, n)`` -> visitor counts ``(n,)``."""
+    return sum(np.asarray(scalers[k].inverse_transform(pred[i].reshape(-1, 1))).ravel() for i, k in enumerate(names))
+
+
+def build_comparison(normalisasi, modelling, backtest_artifact=None):
+    """Actual vs ELM vs ELM-PSO on the best run's windows, in visitor counts."""
+    out_name, best = _best_run(modelling, backtest_artifact)
+    elm_pso = best["elm_pso"]
+    seed = elm_pso.get("SEED", 42)
+    scalers = normalisasi["scalers"]
+    preds = {}
+    for label, params in (("elm", elm.BASELINE_PARAMS), ("pso", forecast.best_params(elm_pso))):
+        result = elm.train_site(best["splitted_data"], params, seed)
+        names = result["components"]
+        preds[label] = np.concatenate([
+            _inverse_sum(result["pred_train"], names, scalers), _inverse_sum(result["pred_test"], names, scalers)
+        ])
+    _, (_, _, y_train, y_test) = elm.stack_components(best["splitted_data"])
+    actual = _inverse_sum(np.concatenate([y_train, y_test], axis=1), names, scalers)
+    return {
+        "actual": actual,
+        "pred_elm": preds["elm"],
+        "pred_pso": preds["pso"],
+        "pred_elm_visual": preds["elm"],
+        "elm_label": elm.BASELINE_LABEL,
+        "split_label": elm_pso["split_label"],
+        "config": elm_pso["config"],
+        "mape_test": elm_pso["metrics_test"]["MAPE"],
+        "best_pickle_name": os.path.basename(out_name),
+        "best_params": elm_pso.get("best_params", {}),
+    }
+
+
+def build_forecast(normalisasi, modelling, backtest_artifact=None, precision="float64"):
+    """Next month from the best run (see ``_best_run``), in the ``forecast_*_next_1month_best`` layout."""
+    out_name, best = _best_run(modelling, backtest_artifact)
+    elm_pso = best["elm_pso"]
+    fit = forecast.fit_site(best, normalisasi, dtype=elm.PRECISIONS[precision])
+    result = forecast.rollout({"site": fit}, 1)["site"]
+    names = result["components"]
+    original = np.asarray(normalisasi["original_series"], dtype=float)
+    scalers = normalisasi["scalers"]
+    return {
+        "best_pickle": os.path.basename(out_name),
+        "split_label": elm_pso["split_label"],
+        "config": elm_pso["config"],
+        "y_next_norm": float(result["norm"][:, 0].sum()),
+        "y_next_orig": float(result["total"][0]),
+        "original_series": original.tolist(),
+        "forecast_series": original.tolist() + [float(result["total"][0])],
+        "forecast_components_norm": {k: float(result["norm"][i, 0]) for i, k in enumerate(names)},
+        "forecast_components_orig": {k: float(result["orig"][i, 0]) for i, k in enumerate(names)},
+        "normalized_components": {k: np.asarray(v).tolist() for k, v in normalisasi["normalized_components"].items()},
+        "scalers_summary": {
+            k: {"feature_range": tuple(s.feature_range), "data_min_": np.ravel(s.data_min_).tolist(),
+                "data_max_": np.ravel(s.data_max_).tolist()}
+            for k, s in scalers.items()
+        },
+        "n_components": len(names),
+        "window_size": fit["window"],
+        "seed": elm_pso.get("SEED", 42),
+        "precision": precision,
+        "timestamp": datetime.now().isoformat(),
+    }
+
+
+# ---- DAG ----
+
+def plan_site(slug, params=DEFAULT_PARAMS, existing=None):
+    """Nodes in topological order; ``build`` takes the artifacts of ``deps`` as keyword arguments.
+
+    ``existing`` maps ``(stage, split, config)`` to the pickle a site already has
+    for it, so a rebuild overwrites that file even if its slug differs.
+    """
+    seed, window = params["seed"], params["window_size"]
+    precision = params.get("precision", "float64")
+    # Only a non-default precision enters the node keys, so float64 manifests stay valid.
+    precision_key = {} if precision == "float64" else {"precision": precision}
+    existing = existing or {}
+
+    def out(stage, default, split="", config=""):
+        return existing.get((stage, split, config), default)
+
+    nodes = [
+        Node("preprocessing", out("preprocessing", f"preprocessing_{slug}.pkl"), ["raw"], {},
+             lambda raw: build_preprocessing(raw)),
+        Node("ceemdan", out("ceemdan", f"ceemdan_{slug}.pkl"), ["preprocessing"], {**params["ceemdan"], "seed": seed},
+             lambda preprocessing: build_ceemdan(preprocessing, seed=seed, **params["ceemdan"])),
+        Node("normalisasi", out("normalisasi", f"normalisasi_{slug}.pkl"), ["ceemdan"], {},
+             lambda ceemdan: build_normalisasi(ceemdan)),
+    ]
+    runs = {}
+    for split_key in params["splits"]:
+        ratio = SPLIT_RATIOS[split_key]
+        split_node = f"split_{split_key}"
+        nodes.append(Node(split_node, out("split", f"split_{slug}_{split_key}.pkl", split_key), ["normalisasi"], {"ratio": ratio},
+                          lambda normalisasi, ratio=ratio: build_split(normalisasi, ratio)))
+        for config in params["configs"]:
+            name = f"modelling_{split_key}_{config}"
+            runs[name] = out("modelling", f"modelling_{slug}_split_{split_key}_{config}.pkl", split_key, config)
+            nodes.append(Node(
+                name, runs[name], [split_node],
+                {"split": split_key, "config": config, "seed": seed, "window_size": window, **pso.CONFIGS[config],
+                 **precision_key},
+                lambda split_key=split_key, config=config, **inputs: trainer.build_modelling(
+                    inputs[f"split_{split_key}"], split_key, config, seed=seed, window_size=window, precision=precision),
+            ))
+
+    def by_file(inputs):
+        return {runs[name]: artifact for name, artifact in inputs.items()}
+
+    nodes.append(Node("backtest", out("backtest", f"backtest_{slug}.pkl"), [*runs], params["backtest"],
+                      lambda **inputs: backtest.build_backtest(by_file(inputs), **params["backtest"])))
+    nodes.append(Node("comparison", out("comparison", f"comparison_{slug}.pkl"), ["normalisasi", "backtest", *runs], {},
+                      lambda normalisasi, backtest, **inputs: build_comparison(normalisasi, by_file(inputs), backtest)))
+    nodes.append(Node("forecast", out("forecast", f"forecast_{slug}_next_1month_best.pkl"), ["normalisasi", "backtest", *runs],
+                      precision_key,
+                      lambda normalisasi, backtest, **inputs: build_forecast(normalisasi, by_file(inputs), backtest,
+                                                                             precision)))
+    return nodes
+
+
+def raw_file(site_dir):
+    files = sorted(glob.glob(os.path.join(site_dir, "data_*.csv")) + glob.glob(os.path.join(site_dir, "data_*.xlsx")))
+    return files[0] if files else None
+
+
+def site_slug(site_dir):
+    raw = raw_file(site_dir)
+    if raw:
+        return os.path.splitext(os.path.basename(raw))[0][len("data_"):]
+    found = glob.glob(os.path.join(site_dir, "preprocessing_*.pkl")) + glob.glob(os.path.join(site_dir, "preprocessing_*.art"))
+    if found:
+        return os.path.splitext(os.path.basename(sorted(found)[0]))[0][len("preprocessing_"):]
+    return os.path.basename(site_dir)
+
+
+def existing_outputs(site_dir):
+    """``{(stage, split, config): file name}`` of the pickles (or converted ``.art``) already in a site folder."""
+    out = {}
+    for file_name in sorted(os.listdir(site_dir)):
+        parsed = classify(file_name)
+        if parsed is not None:
+            out.setdefault(parsed, os.path.splitext(file_name)[0] + ".pkl")
+    return out
+
+
+def load_manifest(site_dir):
+    try:
+        with open(os.path.join(site_dir, MANIFEST)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def build_site(site_dir, params=DEFAULT_PARAMS, force=False, dry_run=False):
+    """Rebuild the stale nodes of one site; returns ``[(node, status, seconds)]``.
+
+    FileExistsError when a stale node would overwrite a file ``pipeline.json`` does not record, unless ``force``.
+    """
+    site = os.path.basename(site_dir)
+    db = store.VisitorStore.at(os.path.dirname(site_dir))
+    stored_key = db.raw_key(site) if db else None
+    raw = raw_file(site_dir)
+    if raw is None and stored_key is None:
+        raise FileNotFoundError(f"{site_dir}: tidak ada data_*.csv / data_*.xlsx (jalankan dengan --init-raw)")
+    slug = site_slug(site_dir)
+    manifest = load_manifest(site_dir)
+    keys = {"raw": stored_key or file_hash(raw)}
+    outputs = {"raw": raw}
+    cache = {}
+    stale = set()
+    report = []
+
+    def get(name):
+        if name not in cache:
+            if name != "raw":
+                cache[name] = read_artifact(outputs[name])
+            else:
+                cache[name] = db.query(site) if stored_key else read_raw(raw)
+        return cache[name]
+
+    for node in plan_site(slug, params, existing_outputs(site_dir)):
+        key = node_key(node.name, node.params, [keys[d] for d in node.deps])
+        path = os.path.join(site_dir, node.out_name)
+        keys[node.name], outputs[node.name] = key, path
+        recorded = manifest.get(node.out_name, {})
+        fresh = (
+            not force
+            and not stale.intersection(node.deps)
+            and recorded.get("key") == key
+            and os.path.exists(path)
+            and recorded.get("sha") == file_hash(path)
+        )
+        if fresh:
+            report.append((node.out_name, "segar", 0.0))
+            continue
+        stale.add(node.name)
+        foreign = not force and node.out_name not in manifest and os.path.exists(path)
+        if dry_run:
+            report.append((node.out_name, "usang, menimpa file tak tercatat (perlu --force)" if foreign else "usang", 0.0))
+            continue
+        if foreign:
+            raise FileExistsError(
+                f"{path} tidak tercatat di {MANIFEST} (mis. pickle asli Colab); pakai --force untuk menimpanya"
+            )
+        t_start = time.time()
+        artifact = node.build(**{d: get(d) for d in node.deps})
+        write_pickle(path, artifact)
+        cache[node.name] = artifact
+        manifest[node.out_name] = {"key": key, "sha": file_hash(path), "built": datetime.now().isoformat()}
+        write_manifest(site_dir, manifest)
+        report.append((node.out_name, "dibangun", time.time() - t_start))
+    return report
+
+
+def write_manifest(site_dir, manifest):
+    tmp_path = os.path.join(site_dir, MANIFEST + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, os.path.join(site_dir, MANIFEST))
+
+
+def init_raw(site_dir, dry_run=False):
+    """Write ``data_<slug>.csv`` from the site's preprocessing artifact (imputed zeros restored); returns its
+    path, or None without a preprocessing artifact. ``dry_run`` only returns the path."""
+    slug = site_slug(site_dir)
+    found = sorted(glob.glob(os.path.join(site_dir, f"preprocessing_{slug}.*")))
+    if not found:
+        return None
+    path = os.path.join(site_dir, f"data_{slug}.csv")
+    if not dry_run:
+        store.raw_frame(read_artifact(found[0])).to_csv(path, index=False)
+    return path
+
+
+def site_dirs(root=ROOT, sites=None):
+    db = store.VisitorStore.at(root)
+    stored = set(db.sites()) if db else set()
+    out = []
+    for folder in sorted(os.listdir(root)):
+        path = os.path.join(root, folder)
+        if not os.path.isdir(path) or folder.startswith((".", "_")) or (sites and folder not in sites):
+            continue
+        if folder in stored or raw_file(path) or glob.glob(os.path.join(path, "preprocessing_*")):
+            out.append(path)
+    return out
+
+
+def run(dirs, workers=None, params=DEFAULT_PARAMS, force=False, dry_run=False):
+    """Yield ``(site_dir, report or exception)`` as sites finish."""
+    cores = os.cpu_count() or 1
+    workers = max(1, min(workers or cores, len(dirs) or 1))
+    if workers == 1 or dry_run:
+        for d in dirs:
+            try:
+                yield d, build_site(d, params, force, dry_run)
+            except Exception as e:
+                yield d, e
+        return
+    with trainer.process_pool(workers, max(1, cores // workers)) as executor:
+        futures = {executor.submit(build_site, d, params, force): d for d in dirs}
+        for fut in as_completed(futures):
+            try:
+                yield futures[fut], fut.result()
+            except Exception as e:
+                yield futures[fut], e
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bangun ulang artifact yang usang, dari data mentah sampai forecast.")
+    parser.add_argument("--root", default=ROOT)
+    parser.add_argument("--sites", nargs="*", help="nama folder wisata (default: semua)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--force", action="store_true",
+                        help="bangun ulang semua node, juga yang menimpa pickle tak tercatat di pipeline.json")
+    parser.add_argument("--dry-run", action="store_true", help="hanya tampilkan node yang usang")
+    parser.add_argument("--init-raw", action="store_true", help="buat data_<slug>.csv dari artifact preprocessing bila belum ada")
+    parser.add_argument("--seed", type=int, default=DEFAULT_PARAMS["seed"])
+    parser.add_argument("--window-size", type=int, default=DEFAULT_PARAMS["window_size"])
+    parser.add_argument("--trials", type=int, default=DEFAULT_PARAMS["ceemdan"]["trials"])
+    parser.add_argument("--epsilon", type=float, default=DEFAULT_PARAMS["ceemdan"]["epsilon"])
+    parser.add_argument("--splits", nargs="*", default=DEFAULT_PARAMS["splits"], choices=list(SPLIT_RATIOS))
+    parser.add_argument("--configs", nargs="*", default=DEFAULT_PARAMS["configs"], choices=list(pso.CONFIGS))
+    parser.add_argument("--precision", default=DEFAULT_PARAMS["precision"], choices=list(elm.PRECISIONS),
+                        help="presisi ELM/PSO dan forecast (float32: setengah memori)")
+    args = parser.parse_args(argv)
+
+    dirs = site_dirs(args.root, args.sites)
+    if args.init_raw:
+        for d in dirs:
+            if raw_file(d) is None:
+                path = init_raw(d, args.dry_run)
+                status = "akan dibuat" if args.dry_run else "dibuat"
+                print(f"{os.path.relpath(path or d, args.root)}: {status} dari artifact preprocessing"
+                      if path else f"{os.path.relpath(d, args.root)}: tanpa artifact preprocessing")
+    params = {
+        "seed": args.seed,
+        "window_size": args.window_size,
+        "ceemdan": {"trials": args.trials, "epsilon": args.epsilon},
+        "splits": args.splits,
+        "configs": args.configs,
+        "backtest": DEFAULT_PARAMS["backtest"],
+        "precision": args.precision,
+    }
+    t_start = time.time()
+    failed = 0
+    for site_dir, report in run(dirs, args.workers, params, args.force, args.dry_run):
+        name = os.path.relpath(site_dir, args.root)
+        if isinstance(report, Exception):
+            failed += 1
+            print(f"{name}: GAGAL — {report}", flush=True)
+            continue
+        built = [r for r in report if r[1] != "segar"]
+        print(f"{name}: {len(built)}/{len(report)} node {'usang' if args.dry_run else 'dibangun'}", flush=True)
+        for out_name, status, seconds in built:
+            print(f"  {out_name}: {status}" + (f" ({seconds:.1f} s)" if seconds else ""), flush=True)
+    print(f"Selesai dalam {time.time() - t_start:.1f} s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,246 @@
+"""Particle Swarm Optimisation of the ELM hyperparameters (neurons, activation, reg).
+
+Every iteration scores the whole swarm as one batched ELM fit. Because the
+hidden units are drawn per unit from the fixed ``SEED`` (see
+``engine.elm.hidden_params``), all particles share the same hidden
+pre-activations; a particle only selects an activation, a prefix of the units
+and a ridge strength. The activations and Gram matrices are therefore computed
+once per run and each iteration is a single ``(P, C, L, L)`` batched solve.
+"""
+import time
+
+import numpy as np
+
+from engine import elm
+
+CONFIGS = {
+    "cfg1": {"particles": 20, "iterations": 200},
+    "cfg2": {"particles": 30, "iterations": 300},
+}
+ACTIVATION_NAMES = ["relu", "sigmoid", "tanh"]
+# Search box per dimension: neurons, activation index, log10(reg). The reg range covers every optimum
+# stored in the shipped modelling artifacts (about 4e-9 to 0.96).
+BOUNDS = np.array([[5.0, 100.0], [0.0, 3.0], [-10.0, 0.5]])
+
+
+def decode(positions):
+    # Neurons and activation are hard limits (hidden units drawn, activations known); reg is taken as is,
+    # since ``optimize`` keeps particles inside the active box, which a warm start may move past BOUNDS.
+    positions = np.atleast_2d(positions)
+    neurons = np.clip(np.rint(positions[:, 0]), BOUNDS[0, 0], BOUNDS[0, 1]).astype(int)
+    act_idx = np.clip(np.floor(positions[:, 1]), 0, len(ACTIVATION_NAMES) - 1).astype(int)
+    reg = 10.0 ** positions[:, 2]
+    return neurons, act_idx, reg
+
+
+def to_params(position):
+    neurons, act_idx, reg = decode(position)
+    return {"neurons": int(neurons[0]), "activation": ACTIVATION_NAMES[act_idx[0]], "reg": float(reg[0])}
+
+
+def encode(params):
+    return np.array([
+        float(params["neurons"]),
+        ACTIVATION_NAMES.index(params["activation"]) + 0.5,
+        np.log10(max(float(params.get("reg", 1e-6)), 10.0 ** BOUNDS[2, 0])),
+    ])
+
+
+def previous_optimum(elm_pso):
+    """Hyperparameters of a stored ``elm_pso`` dict to warm-start from (``best_params`` first)."""
+    for key in ("best_params", "gbest_result"):
+        params = elm_pso.get(key) or {}
+        if {"neurons", "activation"} <= params.keys() and params["activation"] in ACTIVATION_NAMES:
+            return {"neurons": params["neurons"], "activation": params["activation"], "reg": params.get("reg", 1e-6)}
+    return None
+
+
+def warm_bounds(params, neuron_radius=15.0, log_reg_radius=1.0):
+    """Search box shrunk around a previous optimum; the activation keeps its full range.
+
+    The reg window is centred on the optimum even where it leaves ``BOUNDS``;
+    only the neuron window is cut to the hidden units available.
+    """
+    center = encode(params)
+    bounds = BOUNDS.copy()
+    bounds[0] = [max(BOUNDS[0, 0], center[0] - neuron_radius), min(BOUNDS[0, 1], center[0] + neuron_radius)]
+    bounds[2] = [center[2] - log_reg_radius, center[2] + log_reg_radius]
+    return bounds
+
+
+class SwarmEvaluator:
+    """Precomputed hidden activations for one site/split, scoring many particles per call."""
+
+    def __init__(self, splitted_data, seed=42, max_neurons=None, dtype=np.float64):
+        self.names, parts = elm.stack_components(splitted_data)
+        X_train, X_test, y_train, y_test = (p.astype(dtype, copy=False) for p in parts)
+        self.max_neurons = int(max_neurons or BOUNDS[0, 1])
+        W, b = elm.hidden_params(seed, X_train.shape[-1], self.max_neurons, dtype)
+        Z_train = X_train @ W + b
+        Z_test = X_test @ W + b
+        self.A_train = np.stack([elm.ACTIVATIONS[a](Z_train) for a in ACTIVATION_NAMES])
+        self.A_test = np.stack([elm.ACTIVATIONS[a](Z_test) for a in ACTIVATION_NAMES])
+        # Gram matrices in float64 whatever the dtype (see ``engine.elm``); only the activations shrink.
+        A64 = self.A_train.astype(np.float64, copy=False)
+        At = np.swapaxes(A64, -1, -2)
+        self.gram = At @ A64
+        self.rhs = (At @ y_train.astype(np.float64)[None, ..., None])[..., 0]
+        self.y_train = y_train
+        self.y_test = y_test
+        self.eye = np.eye(self.max_neurons)
+
+    @property
+    def nbytes(self):
+        """Memory held by the precomputed activations and Gram matrices."""
+        return self.A_train.nbytes + self.A_test.nbytes + self.gram.nbytes + self.rhs.nbytes
+
+    def solve(self, neurons, act_idx, reg):
+        mask = (np.arange(self.max_neurons)[None, :] < neurons[:, None]).astype(self.gram.dtype)
+        G = self.gram[act_idx] * (mask[:, None, :, None] * mask[:, None, None, :])
+        G = G + reg[:, None, None, None] * self.eye
+        rhs = self.rhs[act_idx] * mask[:, None, :]
+        try:
+            beta = np.linalg.solve(G, rhs[..., None])[..., 0]
+        except np.linalg.LinAlgError:
+            beta = (np.linalg.pinv(G) @ rhs[..., None])[..., 0]
+        return beta.astype(self.A_train.dtype, copy=False)
+
+    def predict(self, beta, act_idx, part="test"):
+        A = self.A_test if part == "test" else self.A_train
+        return np.einsum("pcnl,pcl->pcn", A[act_idx], beta)
+
+    def fitness(self, positions):
+        neurons, act_idx, reg = decode(positions)
+        beta = self.solve(neurons, act_idx, reg)
+        pred = self.predict(beta, act_idx, "test").sum(axis=1)
+        fit = elm.metrics(self.y_test.sum(axis=0)[None, :], pred)["MAPE"]
+        return np.where(np.isfinite(fit), fit, np.inf)
+
+    def evaluate(self, position):
+        """Full train/test metrics for a single position."""
+        neurons, act_idx, reg = decode(position)
+        beta = self.solve(neurons, act_idx, reg)
+        pred_train = self.predict(beta, act_idx, "train")[0]
+        pred_test = self.predict(beta, act_idx, "test")[0]
+        return {
+            "pred_train": pred_train,
+            "pred_test": pred_test,
+            "metrics_train": {k: float(v) for k, v in elm.metrics(self.y_train.sum(axis=0), pred_train.sum(axis=0)).items()},
+            "metrics_test": {k: float(v) for k, v in elm.metrics(self.y_test.sum(axis=0), pred_test.sum(axis=0)).items()},
+        }
+
+
+def swarm_spread(pos, bounds=BOUNDS):
+    """Mean per-dimension standard deviation of the swarm, relative to the search box ``bounds``."""
+    return float(np.mean(np.std(pos, axis=0) / (bounds[:, 1] - bounds[:, 0])))
+
+
+def optimize(evaluator, particles, iterations, seed=42, w_max=0.9, w_min=0.4, c1=2.0, c2=2.0,
+             patience=None, min_delta=1e-6, diversity_tol=None, warm_start=None, warm_fraction=0.5):
+    """Standard global-best PSO with linearly decreasing inertia.
+
+    With ``patience`` the run stops once gbest has not improved by more than
+    ``min_delta`` for that many iterations; with ``diversity_tol`` it stops once
+    the swarm spread (see ``swarm_spread``) collapses below it. ``warm_start``
+    (a params dict) shrinks the search box around it (see ``warm_bounds``) and
+    seeds ``warm_fraction`` of the swarm there, the first particle on it (reg
+    below ``10 ** BOUNDS[2, 0]`` is raised to that floor by ``encode``).
+    """
+    rng = np.random.RandomState(seed)
+    bounds = warm_bounds(warm_start) if warm_start else BOUNDS
+    low, high = bounds[:, 0], bounds[:, 1]
+    v_max = 0.2 * (high - low)
+
+    pos = low + rng.uniform(size=(particles, len(bounds))) * (high - low)
+    if warm_start:
+        n_warm = max(1, int(round(warm_fraction * particles)))
+        jitter = rng.normal(scale=0.05, size=(n_warm, len(bounds))) * (high - low)
+        jitter[0] = 0.0
+        pos[:n_warm] = np.clip(encode(warm_start) + jitter, low, high - 1e-9)
+    vel = rng.uniform(-1.0, 1.0, size=pos.shape) * v_max
+    fit = evaluator.fitness(pos)
+    pbest, pbest_fit = pos.copy(), fit.copy()
+    g = int(np.argmin(pbest_fit))
+    gbest, gbest_fit = pbest[g].copy(), float(pbest_fit[g])
+    history = []
+    spread = []
+    stop_reason = "max_iter"
+    last_improvement = 0
+    best_seen = gbest_fit
+
+    for it in range(iterations):
+        w = w_max - (w_max - w_min) * it / max(iterations - 1, 1)
+        r1 = rng.uniform(size=pos.shape)
+        r2 = rng.uniform(size=pos.shape)
+        vel = w * vel + c1 * r1 * (pbest - pos) + c2 * r2 * (gbest - pos)
+        vel = np.clip(vel, -v_max, v_max)
+        pos = np.clip(pos + vel, low, high - 1e-9)
+
+        fit = evaluator.fitness(pos)
+        improved = fit < pbest_fit
+        pbest[improved] = pos[improved]
+        pbest_fit[improved] = fit[improved]
+        g = int(np.argmin(pbest_fit))
+        if pbest_fit[g] < gbest_fit:
+            gbest, gbest_fit = pbest[g].copy(), float(pbest_fit[g])
+        history.append(gbest_fit)
+        spread.append(swarm_spread(pos, bounds))
+
+        if best_seen - gbest_fit > min_delta:
+            best_seen = gbest_fit
+            last_improvement = it
+        if patience and it - last_improvement >= patience:
+            stop_reason = "plateau"
+            break
+        if diversity_tol and spread[-1] < diversity_tol:
+            stop_reason = "diversity"
+            break
+
+    return {
+        "gbest_position": gbest,
+        "gbest_fit": gbest_fit,
+        "gbest_history": history,
+        "spread_history": spread,
+        "iterations_run": len(history),
+        "stop_reason": stop_reason,
+    }
+
+
+def run_config(splitted_data, config, split_label, seed=42, window_size=3, patience=None, diversity_tol=None,
+               warm_start=None, precision="float64"):
+    """Run one PSO configuration and return an ``elm_pso`` dict in the modelling-artifact layout.
+
+    ``warm_start`` is the previous run's params (see ``previous_optimum``); it
+    implies a plateau stop (patience 20 unless given) so the run can end early.
+    ``precision`` is a key of ``elm.PRECISIONS``.
+    """
+    cfg = CONFIGS[config]
+    if warm_start and patience is None:
+        patience = 20
+    t_start = time.time()
+    evaluator = SwarmEvaluator(splitted_data, seed=seed, dtype=elm.PRECISIONS[precision])
+    result = optimize(evaluator, cfg["particles"], cfg["iterations"], seed=seed,
+                      patience=patience, diversity_tol=diversity_tol, warm_start=warm_start)
+    params = to_params(result["gbest_position"])
+    scores = evaluator.evaluate(result["gbest_position"])
+    elapsed = time.time() - t_start
+    return {
+        "split_label": split_label,
+        "WINDOW_SIZE": window_size,
+        "SEED": seed,
+        "config": config,
+        "precision": precision,
+        "gbest_result": {"mape_gbest": result["gbest_fit"], **params},
+        "best_params": {**params, "best_mape_test": scores["metrics_test"]["MAPE"], "elapsed_time": elapsed},
+        "metrics_train": scores["metrics_train"],
+        "metrics_test": scores["metrics_test"],
+        "gbest_history": result["gbest_history"],
+        "spread_history": result["spread_history"],
+        "iterations_run": result["iterations_run"],
+        "iterations_max": cfg["iterations"],
+        "stop_reason": result["stop_reason"],
+        "warm_start": warm_start,
+        # Iterations not run because of the early stop; a cold run with the same patience skips some too.
+        "iterations_skipped": cfg["iterations"] - result["iterations_run"],
+        "elapsed_time": elapsed,
+    }
@@ -0,0 +1,259 @@
+"""Local SQLite store of the monthly visitor counts, keyed by ``(site, tahun, bulan)``.
+
+One row per site and month in a ``WITHOUT ROWID`` table whose primary key is
+``(site, tahun, bulan)``, so a site's months (or a range of them) are one
+index range scan in time order and a new month is one ``INSERT ... ON
+CONFLICT`` rather than a rewrite of a data file or artifact. Every write bumps
+the site's ``versi``, which the dashboard uses as a cache key; the pipeline
+keys its raw node on the stored content (see ``raw_key``). The database runs
+in WAL mode, so the dashboard keeps reading while the pipeline or another
+session writes. Sites are the site folder names (``wisata_brumbun``).
+
+    python -m engine.store --import            # isi dari data_*.csv / preprocessing_*.pkl tiap wisata
+    python -m engine.store --import --force    # timpa wisata yang sudah ada
+    python -m engine.store --list
+"""
+import argparse
+import os
+import sqlite3
+import threading
+from contextlib import closing
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from artifacts.diskcache import digest
+from engine.ingest import NAMA_BULAN, month_numbers
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DB_NAME = os.path.join(".data", "kunjungan.sqlite")
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS kunjungan (
+    site TEXT NOT NULL,
+    tahun INTEGER NOT NULL,
+    bulan INTEGER NOT NULL CHECK (bulan BETWEEN 1 AND 12),
+    jumlah REAL,
+    sumber TEXT,
+    diperbarui TEXT NOT NULL,
+    PRIMARY KEY (site, tahun, bulan)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS versi (
+    site TEXT PRIMARY KEY,
+    versi INTEGER NOT NULL,
+    kunci TEXT,
+    diperbarui TEXT NOT NULL
+) WITHOUT ROWID;
+"""
+_UPSERT = """
+INSERT INTO kunjungan (site, tahun, bulan, jumlah, sumber, diperbarui) VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (site, tahun, bulan) DO UPDATE SET
+    jumlah = excluded.jumlah, sumber = excluded.sumber, diperbarui = excluded.diperbarui
+"""
+_BUMP = """
+INSERT INTO versi (site, versi, kunci, diperbarui) VALUES (?, 1, ?, ?)
+ON CONFLICT (site) DO UPDATE SET versi = versi + 1, kunci = excluded.kunci, diperbarui = excluded.diperbarui
+"""
+
+
+def db_path(root=ROOT):
+    return os.path.join(root, DB_NAME)
+
+
+def raw_frame(preprocessing):
+    """Raw ``no, bulan, tahun, jumlah`` of a preprocessing artifact (imputed zeros/missing values restored).
+
+    Zero and missing rows come from ``idx_nol``/``idx_kosong``. Older artifacts only
+    have ``idx_imputasi``: its rows are zeros when nothing was missing, missing
+    when there were no zeros, and otherwise (which is which is not stored) missing.
+    """
+    df = preprocessing["df_preprocessed"][["bulan", "tahun", "jumlah"]].copy()
+    if "idx_nol" in preprocessing and "idx_kosong" in preprocessing:
+        idx_zero, idx_missing = preprocessing["idx_nol"], preprocessing["idx_kosong"]
+    elif preprocessing.get("total_missing", 0) == 0:
+        idx_zero, idx_missing = preprocessing.get("idx_imputasi", []), []
+    else:
+        idx_zero, idx_missing = [], preprocessing.get("idx_imputasi", [])
+    df["jumlah"] = df["jumlah"].astype(float)
+    df.loc[idx_zero, "jumlah"] = 0.0
+    df.loc[idx_missing, "jumlah"] = np.nan
+    df.insert(0, "no", range(1, len(df) + 1))
+    return df
+
+
+def _rows(site, frame, source, now):
+    """``_UPSERT`` parameters of ``frame`` (``bulan`` as names or 1–12); ValueError on an invalid month or year."""
+    bulan = month_numbers(frame["bulan"])
+    tahun = pd.to_numeric(frame["tahun"], errors="coerce")
+    bad = bulan.isna() | tahun.isna()
+    if bad.any():
+        sample = frame.loc[bad, ["bulan", "tahun"]].head(3).to_dict("records")
+        raise ValueError(f"{int(bad.sum())} baris tanpa bulan/tahun yang valid (contoh: {sample})")
+    jumlah = pd.to_numeric(frame["jumlah"], errors="coerce").astype(float)
+    return [
+        (site, int(t), int(b), None if np.isnan(j) else float(j), source, now)
+        for t, b, j in zip(tahun.to_numpy(), bulan.to_numpy(), jumlah.to_numpy())
+    ]
+
+
+class VisitorStore:
+    def __init__(self, path):
+        self.path = path
+        self._ready = False
+        self._lock = threading.Lock()
+
+    @property
+    def exists(self):
+        return os.path.exists(self.path)
+
+    @classmethod
+    def at(cls, root=ROOT):
+        """The store of an app folder, or None when it has not been created yet."""
+        path = db_path(root)
+        return cls(path) if os.path.exists(path) else None
+
+    def _connect(self):
+        with self._lock:
+            if not self._ready:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                with closing(sqlite3.connect(self.path, timeout=30)) as con:
+                    con.execute("PRAGMA journal_mode=WAL")
+                    con.executescript(SCHEMA)
+                self._ready = True
+        return closing(sqlite3.connect(self.path, timeout=30))
+
+    def _write(self, site, rows, key=None, replace=False):
+        with self._connect() as con, con:
+            if replace:
+                con.execute("DELETE FROM kunjungan WHERE site = ?", (site,))
+            con.executemany(_UPSERT, rows)
+            con.execute(_BUMP, (site, key, datetime.now().isoformat()))
+        return len(rows)
+
+    def upsert(self, site, frame, source="upload"):
+        """Insert or overwrite the months of ``frame`` (``bulan, tahun, jumlah``); returns the row count."""
+        return self._write(site, _rows(site, frame, source, datetime.now().isoformat()))
+
+    def append(self, site, tahun, bulan, jumlah, source="manual"):
+        """Insert or overwrite a single month."""
+        return self.upsert(site, pd.DataFrame({"bulan": [bulan], "tahun": [tahun], "jumlah": [jumlah]}), source)
+
+    def replace(self, site, frame, source, key=None):
+        """All of a site's months replaced by ``frame`` (bulk import); ``key`` see ``raw_key``."""
+        return self._write(site, _rows(site, frame, source, datetime.now().isoformat()), key, replace=True)
+
+    def query(self, site, start=None, end=None):
+        """``no, bulan, tahun, jumlah`` of ``site`` between the ``(tahun, bulan)`` bounds (inclusive), in time order."""
+        sql = "SELECT tahun, bulan, jumlah FROM kunjungan WHERE site = ?"
+        args = [site]
+        if start is not None:
+            sql += " AND (tahun, bulan) >= (?, ?)"
+            args += [int(start[0]), int(start[1])]
+        if end is not None:
+            sql += " AND (tahun, bulan) <= (?, ?)"
+            args += [int(end[0]), int(end[1])]
+        with self._connect() as con:
+            rows = con.execute(sql + " ORDER BY tahun, bulan", args).fetchall()
+        tahun, bulan, jumlah = (np.array(c) for c in zip(*rows)) if rows else ([], [], [])
+        jumlah = pd.to_numeric(pd.Series(jumlah, dtype=float))
+        if jumlah.notna().all() and np.allclose(jumlah, jumlah.round()):
+            jumlah = jumlah.round().astype(np.int64)
+        return pd.DataFrame({
+            "no": pd.array(np.arange(1, len(rows) + 1), dtype="Int64"),
+            "bulan": pd.Series(bulan, dtype="Int64").map(NAMA_BULAN).astype(object),
+            "tahun": pd.array(tahun, dtype="Int64"),
+            "jumlah": jumlah,
+        })
+
+    def sites(self):
+        with self._connect() as con:
+            return [site for (site,) in con.execute("SELECT site FROM versi ORDER BY site")]
+
+    def summary(self):
+        """``site, bulan, awal, akhir, versi, diperbarui`` of every stored site."""
+        with self._connect() as con:
+            rows = con.execute("""
+                SELECT k.site, COUNT(*), MIN(k.tahun * 12 + k.bulan - 1), MAX(k.tahun * 12 + k.bulan - 1),
+                       v.versi, v.diperbarui
+                FROM kunjungan k JOIN versi v ON v.site = k.site GROUP BY k.site ORDER BY k.site
+            """).fetchall()
+        label = lambda m: f"{NAMA_BULAN[m % 12 + 1]} {m // 12}"
+        return pd.DataFrame(
+            [(s, n, label(lo), label(hi), v, t) for s, n, lo, hi, v, t in rows],
+            columns=["site", "bulan", "awal", "akhir", "versi", "diperbarui"],
+        )
+
+    def bounds(self, site):
+        """First and last ``(tahun, bulan)`` of ``site``, or None."""
+        with self._connect() as con:
+            first = con.execute("SELECT tahun, bulan FROM kunjungan WHERE site = ? ORDER BY tahun, bulan LIMIT 1",
+                                (site,)).fetchone()
+            last = con.execute("SELECT tahun, bulan FROM kunjungan WHERE site = ? "
+                               "ORDER BY tahun DESC, bulan DESC LIMIT 1", (site,)).fetchone()
+        return (tuple(first), tuple(last)) if first else None
+
+    def version(self, site):
+        """Write counter of ``site`` (0 when it is not stored)."""
+        with self._connect() as con:
+            row = con.execute("SELECT versi FROM versi WHERE site = ?", (site,)).fetchone()
+        return row[0] if row else 0
+
+    def raw_key(self, site):
+        """Pipeline key of the site's raw data: the hash of the file it was imported from while no write
+        has followed (so moving a site to the store rebuilds nothing), else a hash of the stored rows."""
+        with self._connect() as con:
+            row = con.execute("SELECT kunci FROM versi WHERE site = ?", (site,)).fetchone()
+            if row is None:
+                return None
+            if row[0]:
+                return row[0]
+            data = np.array(con.execute("SELECT tahun, bulan, jumlah FROM kunjungan WHERE site = ? "
+                                        "ORDER BY tahun, bulan", (site,)).fetchall(), dtype=float)
+        return "store-" + digest(data)
+
+
+def import_site(db, site_dir, force=False):
+    """Load a site folder's raw data file, or else its preprocessing artifact, into ``db``; returns
+    ``(rows, source)``, or None when the site is already stored (and not ``force``) or has no data."""
+    from artifacts.columnar import read_artifact
+    from artifacts.registry import file_hash
+    from engine.pipeline import raw_file, read_raw, site_slug
+
+    site = os.path.basename(site_dir)
+    if site in db.sites() and not force:
+        return None
+    raw = raw_file(site_dir)
+    if raw is not None:
+        source = os.path.basename(raw)
+        return db.replace(site, read_raw(raw), source, key=file_hash(raw)), source
+    found = [f for f in sorted(os.listdir(site_dir)) if f.startswith(f"preprocessing_{site_slug(site_dir)}.")]
+    if not found:
+        return None
+    return db.replace(site, raw_frame(read_artifact(os.path.join(site_dir, found[0]))), found[0]), found[0]
+
+
+def main(argv=None):
+    from engine.pipeline import site_dirs
+
+    parser = argparse.ArgumentParser(description="Penyimpanan lokal data kunjungan bulanan (SQLite).")
+    parser.add_argument("--root", default=ROOT)
+    parser.add_argument("--sites", nargs="*", help="nama folder wisata (default: semua)")
+    parser.add_argument("--import", dest="import_", action="store_true",
+                        help="impor data_*.csv / preprocessing_*.pkl tiap wisata")
+    parser.add_argument("--force", action="store_true", help="timpa wisata yang sudah tersimpan")
+    parser.add_argument("--list", action="store_true", help="tampilkan isi penyimpanan")
+    args = parser.parse_args(argv)
+
+    db = VisitorStore(db_path(args.root))
+    if args.import_:
+        for site_dir in site_dirs(args.root, args.sites):
+            done = import_site(db, site_dir, args.force)
+            site = os.path.basename(site_dir)
+            print(f"{site}: {done[0]} bulan dari {done[1]}" if done else f"{site}: dilewati (sudah tersimpan atau tanpa data)")
+    if args.list or not args.import_:
+        print(db.summary().to_string(index=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,193 @@
+"""Headless batch trainer for the modelling artifacts.
+
+Fans the (site x split x config) jobs out over a process pool and writes each
+result as ``<out>/<site>/modelling_<slug>_split_<split>_<cfg>.pkl`` with the same
+``splitted_data`` / ``elm_pso`` layout the Modelling menu reads; the baseline
+goes under ``elm_baseline`` (see ``engine.elm.BASELINE_PARAMS``), never under
+the Colab ``elm_standard``. Each worker is pinned to ``--blas-threads`` BLAS
+threads so that ``workers x blas_threads`` stays within the core count. The IMF components of
+a job are already trained as one batched array op (see ``engine.pso``), so
+when there are fewer jobs than cores the spare cores go to those BLAS threads
+instead of to more processes. ``--out`` defaults to ``_hasil_latih/`` beside
+the site folders, so the shipped artifacts are not replaced; an existing
+output file is only overwritten with ``--force``.
+
+    python -m engine.trainer --workers 16
+    python -m engine.trainer --sites wisata_brumbun goa_maharani --configs cfg1 --warm-start
+"""
+import argparse
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+
+from artifacts.columnar import read_artifact, write_pickle
+from artifacts.registry import ArtifactRegistry
+from engine import elm, pso
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OUT_DIR = "_hasil_latih"
+SPLITS = ["80_20", "90_10"]
+BLAS_ENV = ["OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS", "BLIS_NUM_THREADS", "NUMEXPR_NUM_THREADS"]
+
+
+def discover_jobs(root=ROOT, sites=None, splits=SPLITS, configs=tuple(pso.CONFIGS)):
+    jobs = []
+    for entry in sorted(ArtifactRegistry(root).entries(stage="split"), key=lambda e: e.rel_path):
+        site_dir = os.path.dirname(entry.rel_path)
+        if (sites and site_dir not in sites) or entry.split not in splits:
+            continue
+        stem = os.path.splitext(os.path.basename(entry.path))[0]
+        slug = stem[len("split_"):-len(f"_{entry.split}")]
+        for config in configs:
+            jobs.append({
+                "site": entry.site,
+                "split_key": entry.split,
+                "config": config,
+                "split_path": entry.path,
+                "out_name": os.path.join(site_dir, f"modelling_{slug}_split_{entry.split}_{config}.pkl"),
+            })
+    return jobs
+
+
+def _pin_blas(n_threads):
+    try:
+        from threadpoolctl import threadpool_limits
+        threadpool_limits(limits=n_threads)
+    except ImportError:
+        pass
+
+
+def build_modelling(split_artifact, split_key, config, seed=42, window_size=3, patience=None,
+                    diversity_tol=None, warm_params=None, precision="float64"):
+    """Modelling artifact (``splitted_data`` / ``elm_baseline`` / ``elm_pso``) for one split x config."""
+    splitted = elm.build_splitted_data(
+        split_artifact.get("train_components", {}), split_artifact.get("test_components", {}), window_size
+    )
+    std = elm.train_site(splitted, elm.BASELINE_PARAMS, seed, elm.PRECISIONS[precision])
+    elm_baseline = {
+        "label": elm.BASELINE_LABEL,
+        "params": dict(elm.BASELINE_PARAMS),
+        "split_label": split_key,
+        "WINDOW_SIZE": window_size,
+        "SEED": seed,
+        "metrics_train": std["metrics_train"],
+        "metrics_test": std["metrics_test"],
+    }
+    elm_pso = pso.run_config(
+        splitted, config, split_key, seed=seed, window_size=window_size,
+        patience=patience, diversity_tol=diversity_tol, warm_start=warm_params, precision=precision,
+    )
+    return {"splitted_data": splitted, "elm_baseline": elm_baseline, "elm_pso": elm_pso}
+
+
+def previous_artifact(job, out_path):
+    """Path of the job's earlier modelling artifact: the last output, else the one beside its split file."""
+    shipped = os.path.join(os.path.dirname(job["split_path"]), os.path.basename(job["out_name"]))
+    return next((p for p in (out_path, shipped) if os.path.exists(p)), None)
+
+
+def train_job(job, out_root=os.path.join(ROOT, OUT_DIR), seed=42, window_size=3, patience=None, diversity_tol=None,
+              warm_start=False, precision="float64"):
+    t_start = time.time()
+    out_path = os.path.join(out_root, job["out_name"])
+    warm_params = None
+    previous = previous_artifact(job, out_path) if warm_start else None
+    if previous is not None:
+        with open(previous, "rb") as f:
+            warm_params = pso.previous_optimum(pickle.load(f).get("elm_pso", {}))
+
+    artifact = build_modelling(
+        read_artifact(job["split_path"]), job["split_key"], job["config"], seed=seed, window_size=window_size,
+        patience=patience, diversity_tol=diversity_tol, warm_params=warm_params, precision=precision,
+    )
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    write_pickle(out_path, artifact)
+    elm_pso = artifact["elm_pso"]
+    return {
+        **job,
+        "out_path": out_path,
+        "mape_test": elm_pso["metrics_test"]["MAPE"],
+        "iterations_run": elm_pso["iterations_run"],
+        "seconds": time.time() - t_start,
+    }
+
+
+def process_pool(workers, blas_threads):
+    """Spawn pool whose workers each use ``blas_threads`` BLAS threads."""
+    # Spawned workers read the BLAS thread count from the environment when numpy loads.
+    saved = {k: os.environ.get(k) for k in BLAS_ENV}
+    os.environ.update({k: str(blas_threads) for k in BLAS_ENV})
+    try:
+        return ProcessPoolExecutor(
+            max_workers=workers, mp_context=get_context("spawn"), initializer=_pin_blas, initargs=(blas_threads,)
+        )
+    finally:
+        for k, v in saved.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+
+
+def run(jobs, workers=None, blas_threads=None, **job_kwargs):
+    cores = os.cpu_count() or 1
+    workers = max(1, min(workers or cores, len(jobs) or 1))
+    blas_threads = blas_threads or max(1, cores // workers)
+    if workers == 1:
+        _pin_blas(blas_threads)
+        for job in jobs:
+            yield train_job(job, **job_kwargs)
+        return
+
+    with process_pool(workers, blas_threads) as executor:
+        futures = [executor.submit(train_job, job, **job_kwargs) for job in jobs]
+        for fut in as_completed(futures):
+            yield fut.result()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Latih ulang semua artifact modelling (ELM & ELM-PSO).")
+    parser.add_argument("--root", default=ROOT, help="folder aplikasi berisi folder per wisata")
+    parser.add_argument("--out", default=None, help=f"folder keluaran (default: <root>/{OUT_DIR})")
+    parser.add_argument("--force", action="store_true", help="timpa file modelling yang sudah ada di folder keluaran")
+    parser.add_argument("--sites", nargs="*", help="nama folder wisata (default: semua)")
+    parser.add_argument("--splits", nargs="*", default=SPLITS)
+    parser.add_argument("--configs", nargs="*", default=list(pso.CONFIGS))
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--blas-threads", type=int, default=None, help="default: jumlah core / workers")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--window-size", type=int, default=3)
+    parser.add_argument("--patience", type=int, default=None)
+    parser.add_argument("--diversity-tol", type=float, default=None)
+    parser.add_argument("--warm-start", action="store_true", help="mulai PSO dari best_params artifact sebelumnya")
+    parser.add_argument("--precision", default="float64", choices=list(elm.PRECISIONS),
+                        help="presisi ELM/PSO (float32: setengah memori)")
+    args = parser.parse_args(argv)
+
+    jobs = discover_jobs(args.root, args.sites, args.splits, args.configs)
+    if not jobs:
+        parser.error("tidak ada file split_*.pkl yang cocok")
+    out_root = args.out or os.path.join(args.root, OUT_DIR)
+    existing = [job["out_name"] for job in jobs if os.path.exists(os.path.join(out_root, job["out_name"]))]
+    if existing and not args.force:
+        parser.error(f"{len(existing)} file modelling sudah ada di {out_root} (mis. {existing[0]}); "
+                     "pakai --force untuk menimpa atau --out untuk folder lain")
+    t_start = time.time()
+    for res in run(
+        jobs, workers=args.workers, blas_threads=args.blas_threads, out_root=out_root,
+        seed=args.seed, window_size=args.window_size, patience=args.patience,
+        diversity_tol=args.diversity_tol, warm_start=args.warm_start, precision=args.precision,
+    ):
+        print(
+            f"{res['out_name']}: MAPE test {res['mape_test'] * 100:.2f}% "
+            f"({res['iterations_run']} iterasi, {res['seconds']:.1f} s)",
+            flush=True,
+        )
+    print(f"Selesai: {len(jobs)} job dalam {time.time() - t_start:.1f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,46 @@
+"""Dashboard pages, one module per menu.
+
+A page module is imported the first time its menu is opened, so its heavy
+dependencies (matplotlib, PyEMD, the engine) load only then and only once per
+process; ``IMPORT_REPORT`` records what each first import cost.
+"""
+import importlib
+import sys
+import time
+
+# (module, judul, ikon, memakai artifact)
+PAGES = [
+    ("home", "Home", "🏠", False),
+    ("upload", "Upload Data", "📂", False),
+    ("preprocessing", "Preprocessing", "🧹", True),
+    ("ceemdan", "Dekomposisi CEEMDAN", "📉", True),
+    ("normalisasi", "Normalisasi", "⚙️", True),
+    ("split", "Split Data", "✂️", True),
+    ("modelling", "Modelling", "📊", True),
+    ("peringkat", "Peringkat Model", "🏆", True),
+    ("prediksi", "Prediksi", "📈", True),
+]
+IMPORT_REPORT = {}
+
+
+def load(name):
+    """Import ``views.<name>`` on first use and record its import time and the packages it pulled in."""
+    full_name = f"{__name__}.{name}"
+    if full_name in sys.modules:
+        return sys.modules[full_name]
+    before = set(sys.modules)
+    t_start = time.perf_counter()
+    module = importlib.import_module(full_name)
+    new_modules = set(sys.modules) - before
+    IMPORT_REPORT[name] = {
+        "seconds": time.perf_counter() - t_start,
+        "modules": len(new_modules),
+        "packages": third_party(new_modules),
+    }
+    return module
+
+
+def third_party(modules):
+    """Top-level non-stdlib packages among ``modules`` (the ones worth reporting)."""
+    tops = {m.split(".")[0] for m in modules}
+    return sorted(t for t in tops if not t.startswith("_") and t not in sys.stdlib_module_names and t != __name__)
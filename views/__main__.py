@@ -0,0 +1,40 @@
+"""Cold import cost of every page, each measured in a fresh interpreter.
+
+    python -m views
+"""
+import json
+import os
+import subprocess
+import sys
+
+from views import PAGES
+
+_PROBE = """
+import json, sys, time
+import streamlit
+base = set(sys.modules)
+t = time.perf_counter()
+import views.{name}
+new = set(sys.modules) - base
+from views import third_party
+print(json.dumps({{"seconds": time.perf_counter() - t, "modules": len(new), "packages": third_party(new)}}))
+"""
+
+
+def measure(name, root):
+    out = subprocess.run([sys.executable, "-c", _PROBE.format(name=name)], cwd=root, capture_output=True,
+                         text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    print(f"{'halaman':<15}{'import (ms)':>12}{'modul':>8}  paket baru")
+    for name, *_ in PAGES:
+        res = measure(name, root)
+        print(f"{name:<15}{res['seconds'] * 1000:>12.0f}{res['modules']:>8}  {', '.join(res['packages'])}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,239 @@
+"""Dekomposisi CEEMDAN: artifact Colab atau dekomposisi langsung dari data sesi."""
+import os
+from datetime import datetime
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from engine.ceemdan import build_artifact, decompose_cached
+from views.common import get_registry, load_artifact
+from views.exports import export_buttons
+from views.figures import content_hash, figure_key, show_figure
+
+
+def render():
+    registry = get_registry()
+    st.markdown("---")
+    st.markdown(
+        """
+        <style>
+            .upload-title-center {
+                text-align: left; 
+                font-size: 26px;
+                font-weight: 700;
+                color: #2b2b2b;
+                margin-top: -10px;
+                margin-bottom: 18px;
+                display: flex;
+                align-items: center;
+                gap: 10px;
+            }
+            .upload-title-center span.icon {
+                font-size: 30px;
+            }
+        </style>
+
+        <div class="upload-title-center">
+            <span class="icon">📉</span>
+            <span>Menu Dekomposisi CEEMDAN</span>
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
+
+    sumber = st.radio(
+        "Sumber hasil dekomposisi:",
+        ["📦 Artifact Colab (pickle)", "⚡ Jalankan CEEMDAN (data sesi)"],
+        index=0,
+        horizontal=True,
+    )
+
+    if sumber.startswith("📦"):
+        wisata_choice = st.selectbox("🗺 Silahkan Pilih Data Wisata :", registry.sites("ceemdan"))
+        entry = registry.get(wisata_choice, "ceemdan")
+
+        if entry is None:
+            st.error(f"❌ File `ceemdan_*.pkl` untuk {wisata_choice} tidak ditemukan. Pastikan file pickle CEEMDAN ada di folder aplikasi.")
+            st.stop()
+        pickle_path = entry.rel_path
+
+        try:
+            ceemdan_artifact = load_artifact(entry)
+        except Exception as e:
+            st.error(f"❌ Gagal memuat `{pickle_path}`: {e}")
+            st.stop()
+    else:
+        if "df" not in st.session_state or "jumlah" not in st.session_state["df"].columns:
+            st.warning("⚠️ Belum ada data di memori. Muat data lewat menu **Upload Data** atau **Preprocessing** terlebih dahulu.")
+            st.stop()
+
+        series = pd.to_numeric(st.session_state["df"]["jumlah"], errors="coerce").dropna().to_numpy(dtype=float)
+        st.caption(f"Seri `jumlah` dari `st.session_state['df']`: **{len(series)}** titik.")
+
+        with st.form("form_ceemdan_run"):
+            cp1, cp2, cp3, cp4 = st.columns(4)
+            with cp1:
+                trials = st.number_input("Trials (ensemble noise)", min_value=10, max_value=2000, step=10, value=100)
+            with cp2:
+                epsilon = st.number_input("Epsilon (lebar noise)", min_value=0.0001, max_value=1.0, step=0.001, value=0.005, format="%.4f")
+            with cp3:
+                seed = st.number_input("Seed", min_value=0, step=1, value=42)
+            with cp4:
+                workers = st.number_input("Jumlah proses", min_value=1, max_value=os.cpu_count() or 1, step=1, value=os.cpu_count() or 1)
+            run_ceemdan = st.form_submit_button("🚀 Jalankan CEEMDAN")
+
+        if run_ceemdan:
+            try:
+                with st.spinner("Menjalankan dekomposisi CEEMDAN..."):
+                    t_start = datetime.now()
+                    components = decompose_cached(series, trials=int(trials), epsilon=float(epsilon), seed=int(seed), workers=int(workers))
+                    st.session_state["ceemdan_artifact"] = build_artifact(
+                        series, components, int(seed), trials=int(trials), epsilon=float(epsilon)
+                    )
+                st.success(f"✅ Dekomposisi selesai dalam {(datetime.now() - t_start).total_seconds():.1f} detik.")
+            except Exception as e:
+                st.error(f"❌ Gagal menjalankan CEEMDAN: {e}")
+                st.stop()
+
+        if "ceemdan_artifact" not in st.session_state:
+            st.info("ℹ️ Atur parameter lalu tekan **Jalankan CEEMDAN** untuk mendekomposisi data sesi.")
+            st.stop()
+
+        wisata_choice = "Data Sesi"
+        ceemdan_artifact = st.session_state["ceemdan_artifact"]
+        entry = None
+
+    components = ceemdan_artifact.get("components", {})
+    original_series = np.asarray(ceemdan_artifact.get("original_series", []), dtype=float)
+    jumlah_col = ceemdan_artifact.get("jumlah_col", "jumlah")
+    seed_used = ceemdan_artifact.get("seed", None)
+    imf_descriptions = ceemdan_artifact.get("imf_descriptions", {}) or {}
+    version = entry.sha if entry is not None else content_hash(original_series, *components.values())
+    imf_energy = ceemdan_artifact.get("imf_energy", {}) or {}
+
+    if len(original_series) == 0 or not components:
+        st.error("❌ Artifact CEEMDAN tidak berisi 'original_series' atau 'components'. Periksa hasil Colab.")
+        st.stop()
+
+    n_imf = len([k for k in components.keys() if k.lower() != "residual"])
+    series_length = len(original_series)
+
+    c1, c2, c3, c4 = st.columns([1,1,1,1])
+    with c1:
+        st.markdown('<div class="metric-card"><div style="font-size:1.02rem;font-weight:600">{}</div><div class="small-muted">Wisata</div></div>'.format(wisata_choice), unsafe_allow_html=True)
+    with c2:
+        st.markdown('<div class="metric-card"><div style="font-size:1.02rem;font-weight:600">{}</div><div class="small-muted">Jumlah IMF</div></div>'.format(n_imf), unsafe_allow_html=True)
+    with c3:
+        st.markdown('<div class="metric-card"><div style="font-size:1.02rem;font-weight:600">{}</div><div class="small-muted">Panjang Sinyal</div></div>'.format(series_length), unsafe_allow_html=True)
+    with c4:
+        st.markdown('<div class="metric-card"><div style="font-size:1.02rem;font-weight:600">{}</div><div class="small-muted">Seed CEEMDAN</div></div>'.format(seed_used if seed_used is not None else "-"), unsafe_allow_html=True)
+
+    if imf_energy:
+        st.markdown("### ⚡ Ringkasan Perkiraan Energi per Komponen")
+        df_energy = pd.DataFrame(
+            [{"Komponen": k, "Energi (%)": imf_energy.get(k, np.nan)} for k in components.keys()]
+        ).sort_values("Komponen")
+        st.dataframe(df_energy.style.format({"Energi (%)":"{:.2f}"}), use_container_width=True)
+
+    st.markdown("---")
+
+    all_components = list(components.keys())
+    def sort_key(name):
+        if name.lower() == "residual":
+            return 999
+        try:
+            return int("".join(filter(str.isdigit, name)) or 0)
+        except Exception:
+            return 0
+    all_components = sorted(all_components, key=sort_key)
+
+    with st.expander("🔧 Opsi Tampilan Komponen (Pilih komponen untuk ditampilkan)", expanded=True):
+        default_selection = [c for c in all_components if c.lower() != "residual"][:min(6, len(all_components))]
+        sel_components = st.multiselect("Pilih komponen (IMF) yang ingin divisualisasikan:", all_components, default=default_selection)
+
+        export_buttons(
+            (wisata_choice, "ceemdan", version, "components"),
+            lambda: pd.DataFrame({name: components[name] for name in all_components}),
+            f"{wisata_choice.replace(' ','_')}_components", "components",
+            "⬇️ Unduh Komponen (CSV)", "⬇️ Unduh Komponen (Excel)",
+        )
+
+    st.markdown("---")
+
+    st.markdown("### 📈 Sinyal Asli ")
+    try:
+        def draw_original():
+            df_orig = pd.DataFrame({"value": original_series})
+            fig, ax = plt.subplots(figsize=(12,4))
+
+            ax.plot(df_orig.index, df_orig["value"], linewidth=2)
+            ax.set_title(f"Sinyal Asli — {jumlah_col} — {wisata_choice}", fontsize=12, fontweight="bold")
+            ax.set_xlabel("Index Waktu")
+            ax.set_ylabel("Jumlah Wisatawan")
+
+            max_idx = int(df_orig["value"].idxmax())
+            max_val = df_orig.loc[max_idx, "value"]
+
+            ax.scatter(max_idx, max_val, s=80, zorder=3)
+            ax.text(
+                max_idx, max_val,
+                f"{int(max_val):,}".replace(",", "."),
+                ha="center", va="bottom", fontsize=9
+            )
+
+            ax.grid(True, linestyle="--", alpha=0.5)
+            return fig
+
+        show_figure(figure_key(wisata_choice, "ceemdan", version, ("original",)), draw_original)
+
+    except Exception as e:
+        st.error(f"Gagal membuat grafik sinyal asli: {e}")
+
+    st.markdown("---")
+
+    st.markdown("### 📉 Visualisasi IMF yang Dipilih")
+    if not sel_components:
+        st.warning("Pilih minimal 1 komponen IMF pada opsi tampilan di atas.")
+    else:
+        try:
+            def draw_imfs():
+                n = len(sel_components)
+                fig, axes = plt.subplots(n, 1, figsize=(12, 2.5*n), sharex=True)
+
+                if n == 1:
+                    axes = [axes]
+
+                for ax, name in zip(axes, sel_components):
+                    y = components[name]
+                    ax.plot(y, linewidth=1.5)
+                    ax.set_title(name, fontsize=10)
+                    ax.grid(True, linestyle="--", alpha=0.4)
+
+                fig.tight_layout()
+                return fig
+
+            show_figure(figure_key(wisata_choice, "ceemdan", version, sel_components), draw_imfs)
+
+        except Exception as e:
+            st.error(f"Gagal membuat subplot IMF: {e}")
+
+    st.markdown("---")
+
+    st.markdown("### 🔍 Nilai & Penjelasan Komponen")
+    for name in all_components:
+        with st.expander(f"{name} — lihat penjelasan", expanded=False):
+            arr = np.asarray(components[name], dtype=float)
+            preview_vals = np.round(arr[:8], 3).tolist()
+            st.write(f"Contoh 8 nilai pertama: `{preview_vals}`")
+            desc = imf_descriptions.get(name, None)
+            if desc:
+                st.caption(desc)
+            else:
+                if name.lower() == "residual":
+                    st.caption("Residual: komponen yang mewakili trend atau sisa setelah semua IMF diambil.")
+                else:
+                    st.caption("IMF: komponen osilasi pada frekuensi tertentu. IMF dengan indeks kecil biasanya frekuensi lebih tinggi.")
+
+    st.success("🎉 Dekomposisi CEEMDAN beserta penjelasan tiap komponen berhasil ditampilkan!")
@@ -0,0 +1,74 @@
+"""Shared by the pages that read artifacts: registry, process-wide cache and their sidebar tools."""
+import os
+import sys
+
+import streamlit as st
+
+from artifacts.cache import ArtifactCache
+from artifacts.registry import ArtifactRegistry
+from artifacts.summary import ModellingIndex
+from engine import ceemdan, store
+
+ARTIFACT_CACHE_MB = 128
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@st.cache_resource(show_spinner=False)
+def get_registry():
+    return ArtifactRegistry(APP_DIR)
+
+
+# Satu cache untuk semua sesi: artifact dibagi (array read-only), bukan disalin per pengguna.
+@st.cache_resource(show_spinner=False)
+def get_artifact_cache():
+    return ArtifactCache(max_bytes=ARTIFACT_CACHE_MB << 20)
+
+
+def load_artifact(entry):
+    return get_artifact_cache().get(entry)
+
+
+@st.cache_resource(show_spinner=False)
+def get_store():
+    """Local visitor-count store of the app folder (created on the first write)."""
+    return store.VisitorStore(store.db_path(APP_DIR))
+
+
+# Ringkasan metrik modelling semua wisata; dibangun ulang hanya bila ada artifact modelling yang berubah.
+@st.cache_resource(show_spinner=False)
+def get_modelling_index():
+    return ModellingIndex(get_artifact_cache().get)
+
+
+def artifact_sidebar():
+    registry = get_registry()
+    if st.sidebar.button("🔄 Pindai Ulang Artifact", use_container_width=True):
+        registry.refresh()
+        st.sidebar.success(f"{len(registry.entries())} artifact terdaftar.")
+    with st.sidebar.expander("📦 Cache Artifact"):
+        cache_stats = get_artifact_cache().stats()
+        st.caption(
+            f"Hit: **{cache_stats.hits}** · Miss: **{cache_stats.misses}** · Eviction: **{cache_stats.evictions}**  \n"
+            f"Isi: **{cache_stats.entries}** artifact, **{cache_stats.bytes / 2**20:.1f} / {cache_stats.max_bytes / 2**20:.0f} MB** "
+            f"(hit rate {cache_stats.hit_rate:.0%})"
+        )
+        # views.figures pulls in matplotlib; until a page that draws has loaded it, there is no figure cache.
+        figures = sys.modules.get("views.figures")
+        if figures is None:
+            st.caption("Grafik — belum ada grafik yang digambar di proses ini.")
+        else:
+            fig_stats = figures.get_figure_cache().stats()
+            st.caption(
+                f"Grafik — Hit: **{fig_stats.hits}** · Miss: **{fig_stats.misses}** · "
+                f"Eviction: **{fig_stats.evictions}** · "
+                f"**{fig_stats.bytes / 2**20:.1f} / {fig_stats.max_bytes / 2**20:.0f} MB**"
+            )
+        emd_stats = ceemdan.default_cache().stats()
+        st.caption(
+            f"CEEMDAN (disk) — Hit: **{emd_stats.hits}** · Miss: **{emd_stats.misses}** · "
+            f"Eviction: **{emd_stats.evictions}** · **{emd_stats.entries}** dekomposisi, "
+            f"**{emd_stats.bytes / 2**20:.1f} / {emd_stats.max_bytes / 2**20:.0f} MB**"
+        )
+        if st.button("🧹 Kosongkan Cache CEEMDAN", use_container_width=True):
+            ceemdan.default_cache().clear()
+            st.rerun()
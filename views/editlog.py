@@ -0,0 +1,224 @@
+"""Undo/redo history of the Upload Data table, kept as row and cell deltas.
+
+A ``Change`` records only what an edit touched: the old and new values of
+the edited cells (per column), the removed rows with their positions and the
+appended rows. It is built straight from ``st.data_editor``'s change set
+(``edited_rows``/``deleted_rows``/``added_rows``, positions relative to the
+table shown), so nothing has to compare whole frames. Applying a change never
+writes into an existing frame: edited columns are rebuilt and all others are
+shared with the previous version (copy-on-write per column), so the history
+holds no frame copies. ``EditLog`` keeps the undo and redo stacks within
+``max_steps`` entries and ``max_bytes`` of delta data, dropping the oldest
+steps first.
+"""
+import itertools
+from collections import deque
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+HISTORY_BYTES = 16 << 20
+HISTORY_STEPS = 100
+INT_COLUMNS = ("no", "tahun")
+NUMERIC_COLUMNS = ("jumlah",)
+_VERSIONS = itertools.count(1)
+
+
+def coerce(name, values):
+    """Column ``name`` as the table keeps it: ``no``/``tahun`` Int64, ``jumlah`` numeric, others as is."""
+    if name in INT_COLUMNS:
+        return pd.to_numeric(values, errors="coerce").astype("Int64")
+    if name in NUMERIC_COLUMNS:
+        return pd.to_numeric(values, errors="coerce")
+    return values
+
+
+def _nbytes(*parts):
+    return int(sum(p.memory_usage(deep=True).sum() if isinstance(p, pd.DataFrame) else
+                   p.memory_usage(deep=True) if isinstance(p, pd.Series) else p.nbytes for p in parts))
+
+
+def _set_cells(frame, cells, which):
+    """``frame`` with ``cells[column] = (positions, old, new)`` written from ``which`` (1 old, 2 new)."""
+    if not cells:
+        return frame
+    columns = {}
+    for name in frame.columns:
+        column = frame[name]
+        if name in cells:
+            values = column.to_numpy(dtype=object, copy=True)
+            values[cells[name][0]] = cells[name][which].to_numpy(dtype=object)
+            column = pd.Series(values, index=frame.index, name=name)
+            column = column.astype(cells[name][1].dtype) if which == 1 else coerce(name, column)
+        columns[name] = column
+    return pd.DataFrame(columns, index=frame.index, copy=False)
+
+
+def _restore_dtypes(frame, dtypes):
+    changed = {c: t for c, t in dtypes.items() if c in frame.columns and frame[c].dtype != t}
+    for name, dtype in changed.items():
+        try:
+            frame[name] = frame[name].astype(dtype)
+        except (TypeError, ValueError):
+            pass
+    return frame
+
+
+@dataclass
+class Change:
+    label: str
+    dtypes: pd.Series
+    cells: dict = field(default_factory=dict)
+    removed: pd.DataFrame = None
+    added: pd.DataFrame = None
+
+    @property
+    def nbytes(self):
+        parts = [p for parts in self.cells.values() for p in parts]
+        return _nbytes(*parts, *(df for df in (self.removed, self.added) if df is not None))
+
+    def apply(self, frame):
+        frame = _set_cells(frame, self.cells, 2)
+        if self.removed is not None:
+            keep = np.ones(len(frame), dtype=bool)
+            keep[self.removed.index] = False
+            frame = frame[keep].reset_index(drop=True)
+        if self.added is not None:
+            frame = pd.concat([frame, self.added], ignore_index=True)
+        return frame
+
+    def revert(self, frame):
+        if self.added is not None:
+            frame = frame.iloc[:len(frame) - len(self.added)]
+        if self.removed is not None:
+            n = len(frame) + len(self.removed)
+            kept = np.ones(n, dtype=bool)
+            kept[self.removed.index] = False
+            order = np.empty(n, dtype=np.intp)
+            order[kept] = np.arange(len(frame))
+            order[self.removed.index] = len(frame) + np.arange(len(self.removed))
+            frame = pd.concat([frame, self.removed], ignore_index=True).iloc[order]
+        frame = frame.reset_index(drop=True)
+        frame = _set_cells(frame, self.cells, 1)
+        return _restore_dtypes(frame, self.dtypes)
+
+
+def _same(a, b):
+    if pd.isna(a) or pd.isna(b):
+        return pd.isna(a) and pd.isna(b)
+    return a == b
+
+
+def _rows_at(frame, positions):
+    """Rows at ``positions`` of ``frame``, indexed by those positions."""
+    positions = np.array(sorted(set(positions)), dtype=np.intp)
+    return frame.iloc[positions].set_axis(positions)
+
+
+def _new_rows(frame, rows):
+    added = pd.DataFrame(list(rows), columns=frame.columns)
+    for name in added.columns:
+        added[name] = coerce(name, added[name])
+    return added
+
+
+def from_editor(frame, state):
+    """``Change`` of ``frame`` from a ``st.data_editor`` change set, or None when it changes nothing."""
+    cells = {}
+    edited = {}
+    for row, values in (state.get("edited_rows") or {}).items():
+        for name, value in values.items():
+            if name in frame.columns:
+                edited.setdefault(name, {})[int(row)] = value
+    for name, values in edited.items():
+        positions = np.fromiter(values, dtype=np.intp, count=len(values))
+        old = frame[name].iloc[positions].reset_index(drop=True)
+        new = coerce(name, pd.Series(list(values.values()), dtype=object))
+        changed = np.array([not _same(a, b) for a, b in zip(old, new)], dtype=bool)
+        if changed.any():
+            cells[name] = (positions[changed], old[changed].reset_index(drop=True),
+                           new[changed].reset_index(drop=True))
+    deleted = sorted({int(r) for r in state.get("deleted_rows") or []})
+    added = [row for row in state.get("added_rows") or [] if any(v is not None for v in row.values())]
+    if not (cells or deleted or added):
+        return None
+
+    n_cells = sum(len(c[0]) for c in cells.values())
+    parts = [f"edit {n_cells} sel" if n_cells else "", f"hapus {len(deleted)} baris" if deleted else "",
+             f"tambah {len(added)} baris" if added else ""]
+    after_cells = _set_cells(frame, cells, 2) if deleted else frame
+    return Change(
+        label=", ".join(p for p in parts if p),
+        dtypes=frame.dtypes,
+        cells=cells,
+        removed=_rows_at(after_cells, deleted) if deleted else None,
+        added=_new_rows(frame, added) if added else None,
+    )
+
+
+def append_rows(frame, rows, label):
+    """``Change`` appending ``rows`` (a frame or records) to ``frame``."""
+    rows = rows.to_dict("records") if isinstance(rows, pd.DataFrame) else rows
+    return Change(label=label, dtypes=frame.dtypes, added=_new_rows(frame, rows))
+
+
+def delete_rows(frame, positions, label):
+    """``Change`` removing the rows at ``positions`` of ``frame``."""
+    return Change(label=label, dtypes=frame.dtypes, removed=_rows_at(frame, positions))
+
+
+class EditLog:
+    """Current table plus bounded undo/redo stacks of ``Change``; ``version`` is unique per state."""
+
+    def __init__(self, frame, max_bytes=HISTORY_BYTES, max_steps=HISTORY_STEPS):
+        self.frame = frame
+        self.max_bytes = int(max_bytes)
+        self.max_steps = int(max_steps)
+        self.undo_stack = deque()
+        self.redo_stack = []
+        self.version = next(_VERSIONS)
+
+    @property
+    def nbytes(self):
+        return sum(size for _, size in itertools.chain(self.undo_stack, self.redo_stack))
+
+    def _set(self, frame):
+        self.frame = frame
+        self.version = next(_VERSIONS)
+        return frame
+
+    def refresh(self):
+        """New ``version`` for the same table, e.g. to discard an editor change set that was rejected."""
+        self.version = next(_VERSIONS)
+
+    def record(self, change):
+        """Apply ``change`` to the current table and push it; clears the redo stack."""
+        frame = change.apply(self.frame)
+        self.undo_stack.append((change, change.nbytes))
+        self.redo_stack.clear()
+        self._trim()
+        return self._set(frame)
+
+    def undo(self):
+        """The reverted ``Change``, or None when there is nothing to undo."""
+        if not self.undo_stack:
+            return None
+        change, size = self.undo_stack.pop()
+        self._set(change.revert(self.frame))
+        self.redo_stack.append((change, size))
+        return change
+
+    def redo(self):
+        """The re-applied ``Change``, or None when there is nothing to redo."""
+        if not self.redo_stack:
+            return None
+        change, size = self.redo_stack.pop()
+        self._set(change.apply(self.frame))
+        self.undo_stack.append((change, size))
+        return change
+
+    def _trim(self):
+        # A single change larger than the budget is still kept, so the last edit can always be undone.
+        while len(self.undo_stack) > 1 and (len(self.undo_stack) > self.max_steps or self.nbytes > self.max_bytes):
+            self.undo_stack.popleft()
@@ -0,0 +1,90 @@
+"""CSV/Excel download payloads, built on request and shared across sessions.
+
+``st.download_button`` needs its bytes up front, so serialising a table on
+every rerun costs the full ``to_csv`` + Excel write even when nobody downloads.
+``export_buttons`` instead shows a "prepare" button until the payload for a
+key ``(site, stage, artifact hash, name)`` exists; once built it is kept in a
+byte-bounded LRU and every later visitor gets the download buttons directly.
+The Excel file is streamed row by row with xlsxwriter's ``constant_memory``
+mode, converting ``EXCEL_CHUNK_ROWS`` rows at a time, so large component
+tables never hold the whole worksheet (or a copy of every cell) in memory.
+"""
+import hashlib
+from datetime import datetime
+from io import BytesIO
+
+import pandas as pd
+import streamlit as st
+
+from artifacts.cache import ByteLRU
+
+EXPORT_CACHE_MB = 64
+EXCEL_CHUNK_ROWS = 4096
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+
+@st.cache_resource(show_spinner=False)
+def get_export_cache():
+    return ByteLRU(EXPORT_CACHE_MB << 20)
+
+
+def frame_hash(df):
+    """Version tag for an in-session table (e.g. the edited upload data); changes with the column names,
+    the values and the row order."""
+    h = hashlib.blake2b(digest_size=8)
+    h.update("\x1f".join(map(str, df.columns)).encode("utf-8"))
+    h.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def csv_bytes(df):
+    return df.to_csv(index=False).encode("utf-8")
+
+
+def excel_bytes(df, sheet_name="Sheet1"):
+    """Single-sheet workbook written row by row (xlsxwriter ``constant_memory``)."""
+    import xlsxwriter
+
+    buf = BytesIO()
+    workbook = xlsxwriter.Workbook(buf, {"constant_memory": True, "nan_inf_to_errors": True})
+    sheet = workbook.add_worksheet(sheet_name[:31])
+    header_fmt = workbook.add_format({"bold": True, "border": 1})
+    date_fmt = workbook.add_format({"num_format": "yyyy-mm-dd hh:mm:ss"})
+    sheet.write_row(0, 0, [str(c) for c in df.columns], header_fmt)
+    for start in range(0, len(df), EXCEL_CHUNK_ROWS):
+        chunk = df.iloc[start:start + EXCEL_CHUNK_ROWS]
+        columns = [chunk[c].astype(object).where(chunk[c].notna(), None).tolist() for c in chunk.columns]
+        for r, row in enumerate(zip(*columns), start=start + 1):
+            for c, value in enumerate(row):
+                if value is None:
+                    continue
+                if isinstance(value, datetime):
+                    sheet.write_datetime(r, c, value, date_fmt)
+                else:
+                    sheet.write(r, c, value)
+    workbook.close()
+    return buf.getvalue()
+
+
+def export_buttons(key, build_frame, file_stem, sheet_name, csv_label, excel_label):
+    """CSV + Excel download buttons for the table ``build_frame()``, serialised only on request."""
+    cache = get_export_cache()
+    csv_data = cache.get(key + ("csv",))
+    xlsx_data = cache.get(key + ("xlsx",))
+    if csv_data is None or xlsx_data is None:
+        if not st.button("📦 Siapkan File Unduhan (CSV & Excel)", key=f"export_{'_'.join(map(str, key))}",
+                         use_container_width=True):
+            return
+        with st.spinner("Menyiapkan file unduhan..."):
+            df = build_frame()
+            data = csv_bytes(df)
+            csv_data = cache.put(key + ("csv",), data, len(data))
+            data = excel_bytes(df, sheet_name)
+            xlsx_data = cache.put(key + ("xlsx",), data, len(data))
+    col1, col2 = st.columns([1, 1])
+    with col1:
+        st.download_button(csv_label, data=csv_data, file_name=f"{file_stem}.csv", mime="text/csv",
+                           use_container_width=True)
+    with col2:
+        st.download_button(excel_label, data=xlsx_data, file_name=f"{file_stem}.xlsx", mime=XLSX_MIME,
+                           use_container_width=True)
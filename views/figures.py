@@ -0,0 +1,78 @@
+"""Rendered charts cached across reruns and sessions.
+
+A chart is drawn once per key ``(site, stage, artifact hash, selection, split)``
+and its encoded PNG/SVG bytes are kept in a byte-bounded LRU. A rerun caused by
+an unrelated widget serves those bytes with ``st.image`` instead of drawing the
+figure again through Agg.
+"""
+import hashlib
+from io import BytesIO
+
+import matplotlib.pyplot as plt
+import numpy as np
+import streamlit as st
+
+from artifacts.cache import ByteLRU
+
+FIGURE_CACHE_MB = 64
+DPI = 200  # sama dengan st.pyplot
+# st.image downsizes anything wider on every call (decode + resize + re-encode),
+# so PNGs are stored at most this wide.
+MAX_WIDTH_PX = 1460
+
+
+@st.cache_resource(show_spinner=False)
+def get_figure_cache():
+    return ByteLRU(FIGURE_CACHE_MB << 20)
+
+
+def figure_key(site, stage, version, selection=(), split=""):
+    return (site, stage, version, tuple(selection), split)
+
+
+def content_hash(*arrays):
+    """Version tag for data that has no artifact hash (session results, PSO reruns)."""
+    h = hashlib.blake2b(digest_size=16)
+    for arr in arrays:
+        arr = np.ascontiguousarray(np.asarray(arr, dtype=float))
+        h.update(str(arr.shape).encode())
+        h.update(arr.tobytes())
+    return h.hexdigest()
+
+
+def render_figure(key, draw, fmt="png"):
+    """Encoded bytes of the chart for ``key``; ``draw()`` builds the Figure only on a miss."""
+    cache = get_figure_cache()
+    full_key = key + (fmt,)
+    data = cache.get(full_key)
+    if data is None:
+        fig = draw()
+        try:
+            buf = BytesIO()
+            fig.savefig(buf, format=fmt, dpi=min(DPI, MAX_WIDTH_PX / fig.get_figwidth()), bbox_inches="tight")
+        finally:
+            plt.close(fig)
+        data = buf.getvalue()
+        if fmt == "png":
+            data = _fit_width(data)
+        data = cache.put(full_key, data, len(data))
+    return data
+
+
+def _fit_width(png):
+    from PIL import Image
+
+    image = Image.open(BytesIO(png))
+    if image.width <= MAX_WIDTH_PX:
+        return png
+    height = int(image.height * MAX_WIDTH_PX / image.width)
+    buf = BytesIO()
+    image.resize((MAX_WIDTH_PX, height), resample=Image.BILINEAR).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def show_figure(key, draw, fmt="png"):
+    """Cached replacement for ``st.pyplot(draw())``; returns the encoded bytes (e.g. for a download button)."""
+    data = render_figure(key, draw, fmt)
+    st.image(data.decode("utf-8") if fmt == "svg" else data, use_container_width=True)
+    return data
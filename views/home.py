@@ -0,0 +1,108 @@
+"""Halaman Home: pengantar alur dashboard."""
+import streamlit as st
+
+
+def render():
+    st.markdown(
+        """
+        <style>
+        /* HERO */
+        .hero {
+            background: linear-gradient(90deg, rgba(11,92,255,0.18), rgba(0,183,255,0.12));
+            padding: 35px;
+            border-radius: 14px;
+            border: 1px solid rgba(11,92,255,0.25);
+            margin-bottom: 22px;
+            text-align: center;
+        }
+
+        .hero h1 {
+            margin: 0;
+            color: #053474;
+            font-size: 35px;
+            font-weight: 750;
+            line-height: 1.25;
+        }
+
+        .hero p {
+            margin: 10px 0 0 0;
+            color: #1d1d1d;
+            font-size: 17px;
+            font-weight: 450;
+        }
+        </style>
+        """,
+        unsafe_allow_html=True,
+    )
+    st.markdown(
+        """
+        <div class="hero">
+            <h1>🏠 SELAMAT DATANG DI APLIKASI PREDIKSI JUMLAH KUNJUNGAN WISATAWAN<br>KABUPATEN LAMONGAN</h1>
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    st.markdown("### 📘 Tentang Aplikasi")
+    st.write("""
+    Aplikasi ini digunakan untuk melakukan prediksi jumlah kunjungan wisatawan nusantara 
+    di Kabupaten Lamongan menggunakan metode *CEEMDAN (Complete Ensemble Empirical Mode Decomposition with Adaptive Noise)* 
+    dan *ELM (Extreme Learning Machine)* yang dioptimasi dengan algoritma *PSO (Particle Swarm Optimization)*.
+    """)
+    st.markdown("### ⚙️ Fitur Utama:")
+    st.markdown("""
+        - **📂 Upload Data**  
+      Mengunggah file CSV/Excelberisi data kunjungan wisata yang akan digunakan untuk analisis.  
+
+    - **🧹 Preprocessing**  
+      Menampilkan hasil *preprocessing* seperti mengecek *missing value*, mengecek jumlah data yang 0, penyesuaian format waktu dan imputasi median.  
+
+    - **📊 Dekomposisi CEEMDAN**  
+      Melakukan dekomposisi sinyal data menjadi beberapa komponen IMF dan residu menggunakan metode CEEMDAN.  
+
+    - **⚙️ Normalisasi**  
+      Melakukan normalisasi setiap komponen hasil dekomposisi agar siap digunakan dalam proses pelatihan model.  
+
+    - **✂️ Split Data**  
+      Memisahkan data menjadi data latih (*training set*) dan data uji (*testing set*).  
+
+    - **🤖 Modelling**  
+      Melatih model ELM standar dan ELM dengan optimasi PSO pada setiap komponen hasil dekomposisi.  
+
+    - **🏆 Peringkat Model**  
+      Membandingkan seluruh run ELM-PSO dan baseline ELM dari semua objek wisata dalam satu tabel peringkat.  
+
+    - **📈 Prediksi**  
+      Menampilkan hasil prediksi gabungan (rekonstruksi) untuk periode tertentu, seperti 1 bulan berikutnya.  
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
+    with st.expander("📚 Panduan singkat — langkah demi langkah", expanded=False):
+        st.markdown(
+            """
+            <div class="howto-list">
+            1. <strong>Upload Data</strong> — Pastikan kolom <code>no, bulan, tahun, jumlah</code>. Periksa preview dan koreksi langsung bila perlu.<br>
+            2. <strong>Preprocessing</strong> — Muat artifact pickle preprocessing dari Colab agar data tersimpan di aplikasi.<br>
+            3. <strong>CEEMDAN → Normalisasi → Split</strong> — Muat file pickle masing-masing untuk menampilkan IMF, scaler, dan hasil split.<br>
+            4. <strong>Modelling</strong> — Muat file modelling untuk membandingkan ELM biasa dan ELM+PSO.<br>
+            5. <strong>Peringkat Model</strong> — Bandingkan semua wisata sekaligus; filter split/konfigurasi dan urutkan per metrik.<br>
+            6. <strong>Prediksi</strong> — Tampilkan grafik prediksi yang digambar ulang dengan Matplotlib dan bisa diunduh PNG bila ingin laporan.
+            </div>
+            """,
+            unsafe_allow_html=True,
+        )
+
+    st.markdown("---")
+    c1, c2 = st.columns([3,1])
+    with c1:
+        st.markdown("#### ℹ️ Catatan Penting")
+        st.markdown(
+            "- Pastikan semua file pickle yang dihasilkan di Google Colab diletakkan di folder aplikasi, satu folder per wisata, dengan nama file diawali nama tahapnya (mis. `split_<nama>_80_20.pkl`, `modelling_<nama>_split_80_20_cfg1.pkl`). Folder wisata baru otomatis terdeteksi.  \n"
+            "- Jalankan `python -m artifacts.columnar` sekali untuk mengonversi pickle ke format kolumnar (`.art`) yang lebih cepat dimuat dan tidak bergantung pada versi scikit-learn; folder `.art` otomatis dipakai selama masih sesuai dengan pickle-nya.  \n"
+            "- Nama kolom dan tipe data harus konsisten agar pipeline berjalan lancar.  \n"
+            "- Bila grafik tidak muncul: periksa isi file pickle (pastikan `original_series`, `components`, atau `forecast_series` tersedia)."
+        )
+    with c2:
+        st.markdown("#### ✉️ Kontak")
+        st.markdown("Jika perlu bantuan, tulis ringkasan masalah dan kirimkan file pickle terkait ke: **devidwi1809@gmail.com**")
+    st.markdown("")
+    st.stop()
@@ -0,0 +1,420 @@
+"""Modelling: hasil ELM vs ELM-PSO, latih ulang, dan jalankan ulang PSO."""
+from datetime import datetime
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from engine.elm import BASELINE_LABEL
+from views.common import get_modelling_index, get_registry, load_artifact
+from views.figures import content_hash, figure_key, show_figure
+
+
+def backtest_caption(registry, site):
+    entry = registry.get(site, "backtest")
+    if entry is None:
+        st.caption(
+            "ℹ️ Backtest *rolling-origin* belum tersedia untuk wisata ini — jalankan `python -m engine.backtest` "
+            "atau `python -m engine.pipeline`."
+        )
+        return
+    try:
+        artifact = load_artifact(entry)
+    except Exception as e:
+        st.error(f"❌ Gagal membaca file `{entry.rel_path}`: {e}")
+        return
+    n_origins = max((len(run["origins"]) for run in artifact["runs"].values()), default=0)
+    st.caption(
+        f"🔁 Backtest *rolling-origin*: model dilatih ulang di **{n_origins} origin** "
+        f"(mulai {artifact['min_train']:g} data latih, langkah {artifact['step']}) dan diuji pada "
+        f"**{artifact['horizon']} bulan** berikutnya di tiap origin — `{entry.rel_path}`, "
+        f"dibuat {str(artifact.get('timestamp', '-'))[:19]}. Baseline backtest adalah **{BASELINE_LABEL}**, "
+        "bukan ELM standar hasil Colab."
+    )
+
+
+def render():
+    registry = get_registry()
+    st.markdown("---")
+    st.markdown(
+        """
+        <style>
+            .upload-title-center {
+                text-align: left; 
+                font-size: 26px;
+                font-weight: 700;
+                color: #2b2b2b;
+                margin-top: -10px;
+                margin-bottom: 18px;
+                display: flex;
+                align-items: center;
+                gap: 10px;
+            }
+            .upload-title-center span.icon {
+                font-size: 30px;
+            }
+        </style>
+
+        <div class="upload-title-center">
+            <span class="icon">📊</span>
+            <span>Menu Modelling</span>
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
+    st.write("""
+    Pada tahap ini ditampilkan **ringkasan hasil modelling**:
+    - **ELM standar** (tanpa optimasi *Particle Swarm Optimization* / PSO)
+    - **CEEMDAN–ELM–PSO** (ELM yang sudah dioptimasi PSO)
+
+    Untuk setiap objek wisata, terdapat **4 kombinasi**:
+    - Split **80% / 20%**, Konfigurasi **1** : **Partikel = 20**, **Iterasi = 200**
+    - Split **80% / 20%**, Konfigurasi **2** : **Partikel = 30**, **Iterasi = 300**
+    - Split **90% / 10%**, Konfigurasi **1** : **Partikel = 20**, **Iterasi = 200**
+    - Split **90% / 10%**, Konfigurasi **2** : **Partikel = 30**, **Iterasi = 300**
+    """)
+
+
+    wisata_choice = st.selectbox("🗺 Silahkan Pilih Data Wisata:", registry.sites("modelling"))
+    st.markdown(f"**Wisata terpilih:** {wisata_choice}")
+    model_entries = registry.group(wisata_choice, "modelling")
+
+    index = get_modelling_index()
+    df_elm, df_pso = index.site(registry, wisata_choice)
+    for site, file_path, e in index.errors:
+        if site != wisata_choice:
+            continue
+        if isinstance(e, FileNotFoundError):
+            st.warning(f"⚠️ File tidak ditemukan: {file_path}")
+        else:
+            st.error(f"❌ Gagal membaca file `{file_path}`: {e}")
+
+    if df_pso.empty:
+        st.error("Tidak ada file modelling yang berhasil dimuat untuk wisata ini.")
+        st.stop()
+
+    best = df_pso.index[df_pso["Terbaik?"] == "✅"]
+    best_idx = best[0] if len(best) else None
+
+    tab1, tab2 = st.tabs(["📄 ELM Tanpa PSO", "🚀 CEEMDAN–ELM–PSO"])
+
+    with tab1:
+        st.subheader("📊 Ringkasan Hasil ELM Tanpa PSO")
+        st.write(
+            "Tabel berikut menampilkan metrik **ELM tanpa optimasi PSO** untuk setiap kombinasi split data "
+            "(satu baris per model dan split). **ELM** adalah ELM standar hasil Colab; baseline yang dilatih "
+            "ulang di aplikasi tampil dengan labelnya sendiri karena parameter ELM standar tidak tersimpan "
+            "di pickle, sehingga keduanya **bukan model yang sama**."
+        )
+
+        st.dataframe(
+            df_elm.style.format({
+                "MAPE Train (%)": "{:.2f}",
+                "MAPE Test (%)": "{:.2f}",
+                "MAE Train": "{:.4f}",
+                "RMSE Train": "{:.4f}",
+                "R² Train": "{:.4f}",
+                "MAE Test": "{:.4f}",
+                "RMSE Test": "{:.4f}",
+                "R² Test": "{:.4f}",
+                "MAPE Backtest (%)": "{:.2f}",
+                "MAE Backtest": "{:.4f}",
+                "RMSE Backtest": "{:.4f}",
+                "R² Backtest": "{:.4f}",
+            }),
+            use_container_width=True
+        )
+
+    with tab2:
+        st.subheader("📊 Ringkasan Hasil CEEMDAN–ELM–PSO (4 Kombinasi)")
+        st.write(
+            "Nilai **MAPE** dalam persen, semakin kecil semakin baik. "
+            "Kolom **Terbaik?** menandai model dengan MAPE Backtest paling rendah "
+            "(MAPE Test bila belum semua run wisata ini di-backtest)."
+        )
+        st.dataframe(
+            df_pso.style.format({
+                "MAPE Train (%)": "{:.2f}",
+                "MAPE Test (%)": "{:.2f}",
+                "MAE Train": "{:.4f}",
+                "RMSE Train": "{:.4f}",
+                "R² Train": "{:.4f}",
+                "MAE Test": "{:.4f}",
+                "RMSE Test": "{:.4f}",
+                "R² Test": "{:.4f}",
+                "MAPE Backtest (%)": "{:.2f}",
+                "MAE Backtest": "{:.4f}",
+                "RMSE Backtest": "{:.4f}",
+                "R² Backtest": "{:.4f}",
+            }),
+            use_container_width=True
+        )
+        backtest_caption(registry, wisata_choice)
+
+    if best_idx is not None:
+        best_row = df_pso.loc[best_idx]
+
+        st.markdown("---")
+        st.subheader("🏆 Model Terbaik untuk Wisata Ini (berdasarkan CEEMDAN–ELM–PSO)")
+
+        colA, colB = st.columns(2)
+        with colA:
+            st.metric(
+                "MAPE Test Terbaik (%)",
+                f"{best_row['MAPE Test (%)']:.2f}"
+            )
+            st.metric(
+                "Split Data",
+                best_row["Split"]
+            )
+            if pd.notna(best_row["MAPE Backtest (%)"]):
+                st.metric("MAPE Backtest (%)", f"{best_row['MAPE Backtest (%)']:.2f}")
+        with colB:
+            st.metric(
+                "Konfigurasi",
+                best_row["Konfigurasi"]
+            )
+            st.caption(f"File: `{best_row['File Pickle']}`")
+
+        backtest_line = (
+            f"- **MAPE Backtest**: {best_row['MAPE Backtest (%)']:.2f}%"
+            if pd.notna(best_row["MAPE Backtest (%)"]) else ""
+        )
+        st.success(f"""
+        Model terbaik (CEEMDAN–ELM–PSO) diperoleh dari:
+        - **Split**: {best_row['Split']}
+        - **Konfigurasi**: {best_row['Konfigurasi']}
+        - **MAPE Test**: {best_row['MAPE Test (%)']:.2f}%
+        {backtest_line}
+        """)
+
+        st.session_state["best_model_info"] = {
+            "wisata": wisata_choice,
+            "pickle_path": best_row["File Pickle"],
+            "split": best_row["Split"],
+            "config": best_row["Konfigurasi"],
+            "mape_test_pct": float(best_row["MAPE Test (%)"]),
+        }
+        st.caption(
+            "ℹ️ Informasi model terbaik (CEEMDAN–ELM–PSO) sudah disimpan dan dapat dipakai "
+            "di menu berikutnya (visualisasi & forecasting)."
+        )
+    else:
+        st.info("Tidak ditemukan model PSO yang valid untuk dijadikan patokan terbaik (MAPE Test tidak tersedia).")
+
+    st.markdown("---")
+    st.subheader("🔁 Latih Ulang ELM di Aplikasi")
+    st.write(
+        f"Melatih ulang baseline **{BASELINE_LABEL}** dan **ELM–PSO** (parameter `gbest_result`) untuk semua "
+        "komponen IMF/residual sekaligus dari `splitted_data`, lalu membandingkan metriknya dengan nilai yang "
+        "tersimpan di pickle. Baseline tersebut bukan ELM standar hasil Colab (parameternya tidak tersimpan), "
+        "sehingga kolom *Tersimpan*-nya hanya terisi untuk artifact yang dilatih di aplikasi."
+    )
+    retrain_key = st.selectbox(
+        "Pilih kombinasi split & konfigurasi:",
+        list(model_entries.keys()),
+        format_func=lambda k: f"Split {k[0].replace('_', '/')} | {k[1]}",
+    )
+    if st.button("🔁 Latih Ulang & Bandingkan Metrik"):
+        from engine.elm import retrain_artifact
+        try:
+            artifact = load_artifact(model_entries[retrain_key])
+            t_start = datetime.now()
+            df_retrain = pd.DataFrame(retrain_artifact(artifact))
+            elapsed_ms = (datetime.now() - t_start).total_seconds() * 1000
+        except Exception as e:
+            st.error(f"❌ Gagal melatih ulang ELM: {e}")
+        else:
+            df_retrain["Selisih"] = df_retrain["Latih Ulang"] - df_retrain["Tersimpan"]
+            st.dataframe(
+                df_retrain.style.format({"Tersimpan": "{:.4f}", "Latih Ulang": "{:.4f}", "Selisih": "{:+.4f}"}),
+                use_container_width=True,
+            )
+            st.caption(f"⏱️ Waktu latih ulang: {elapsed_ms:.0f} ms")
+
+    if st.button("🧮 Cek Paritas float32 vs float64"):
+        from engine.elm import PRECISIONS, precision_parity
+        from engine.pso import CONFIGS, SwarmEvaluator
+        try:
+            artifact = load_artifact(model_entries[retrain_key])
+            df_parity = pd.DataFrame(precision_parity(artifact))
+            positions = np.random.RandomState(0).uniform(size=(CONFIGS[retrain_key[1]]["particles"], 3))
+            swarm = []
+            for precision, dtype in PRECISIONS.items():
+                evaluator = SwarmEvaluator(artifact.get("splitted_data", {}), dtype=dtype)
+                t_start = datetime.now()
+                for _ in range(20):
+                    evaluator.fitness(positions)
+                swarm.append({
+                    "Presisi": precision,
+                    "Memori Swarm (MB)": evaluator.nbytes / 2**20,
+                    "Fitness / iterasi (ms)": (datetime.now() - t_start).total_seconds() * 1000 / 20,
+                })
+        except Exception as e:
+            st.error(f"❌ Gagal menjalankan cek paritas: {e}")
+        else:
+            df_parity["Selisih"] = df_parity["float32"] - df_parity["float64"]
+            mape = df_parity["Metrik"] == "MAPE"
+            df_parity.loc[mape, ["float64", "float32", "Selisih"]] *= 100
+            df_parity.loc[mape, "Metrik"] = "MAPE (%)"
+            st.dataframe(
+                df_parity.style.format({"float64": "{:.6f}", "float32": "{:.6f}", "Selisih": "{:+.2e}"}),
+                use_container_width=True,
+            )
+            worst = df_parity.loc[mape, "Selisih"].abs().max()
+            st.caption(f"Selisih MAPE terbesar float32 vs float64: **{worst:.2e}** poin persen.")
+            st.dataframe(
+                pd.DataFrame(swarm).style.format({"Memori Swarm (MB)": "{:.2f}", "Fitness / iterasi (ms)": "{:.2f}"}),
+                use_container_width=True,
+                hide_index=True,
+            )
+
+    use_warm_start = st.checkbox(
+        "♻️ Warm start dari `best_params` run sebelumnya (sebagian swarm disebar di sekitar optimum lama, batas pencarian dipersempit)",
+        value=False,
+    )
+    precision = st.radio(
+        "Presisi komputasi PSO:", ["float64", "float32"], horizontal=True,
+        help="float32 memakai setengah memori untuk aktivasi swarm; cek selisih MAPE-nya dengan tombol paritas di atas.",
+    )
+    col_es1, col_es2, col_es3 = st.columns(3)
+    with col_es1:
+        use_early_stop = st.checkbox("Early stopping PSO", value=True)
+    with col_es2:
+        es_patience = st.number_input("Patience (iterasi tanpa perbaikan)", min_value=1, max_value=300, step=1, value=30, disabled=not use_early_stop)
+    with col_es3:
+        es_diversity = st.number_input("Batas sebaran swarm", min_value=0.0, max_value=0.5, step=0.0005, value=0.001, format="%.4f", disabled=not use_early_stop)
+
+    if st.button("🚀 Jalankan Ulang PSO (swarm batched)"):
+        from engine.pso import CONFIGS, previous_optimum, run_config
+        split_key_run, cfg_run = retrain_key
+        try:
+            artifact = load_artifact(model_entries[retrain_key])
+            run_meta = artifact.get("elm_pso") or artifact.get("elm_standard", {})
+            warm_params = previous_optimum(artifact.get("elm_pso", {})) if use_warm_start else None
+            if use_warm_start and warm_params is None:
+                st.warning("⚠️ `best_params` tidak ditemukan di artifact, PSO dijalankan dari awal.")
+            with st.spinner(f"Menjalankan PSO {cfg_run} ({CONFIGS[cfg_run]['particles']} partikel × {CONFIGS[cfg_run]['iterations']} iterasi)..."):
+                st.session_state.setdefault("pso_run_results", {})[(wisata_choice, retrain_key)] = run_config(
+                    artifact.get("splitted_data", {}),
+                    cfg_run,
+                    split_key_run,
+                    seed=run_meta.get("SEED", 42),
+                    window_size=run_meta.get("WINDOW_SIZE", 3),
+                    patience=int(es_patience) if use_early_stop else None,
+                    diversity_tol=float(es_diversity) if use_early_stop and es_diversity > 0 else None,
+                    warm_start=warm_params,
+                    precision=precision,
+                )
+        except Exception as e:
+            st.error(f"❌ Gagal menjalankan PSO: {e}")
+
+    # Keyed by site and split x config, so a run never shows under another selection.
+    pso_run = st.session_state.get("pso_run_results", {}).get((wisata_choice, retrain_key))
+    if pso_run is None:
+        try:
+            stored_pso = load_artifact(model_entries[retrain_key]).get("elm_pso", {})
+            if stored_pso.get("gbest_history"):
+                pso_run = stored_pso
+        except Exception:
+            pso_run = None
+
+    if pso_run is not None:
+        gbest = pso_run["gbest_result"]
+        n_run = pso_run.get("iterations_run", len(pso_run["gbest_history"]))
+        n_max = pso_run.get("iterations_max", n_run)
+        colP1, colP2, colP3, colP4, colP5 = st.columns(5)
+        colP1.metric("MAPE gbest (%)", f"{gbest['mape_gbest'] * 100:.2f}")
+        colP2.metric("Neuron", gbest["neurons"])
+        colP3.metric("Aktivasi", gbest["activation"])
+        colP4.metric("Iterasi", f"{n_run} / {n_max}")
+        colP5.metric("Waktu (detik)", f"{pso_run['elapsed_time']:.1f}")
+        stop_labels = {"max_iter": "iterasi maksimum", "plateau": "gbest stagnan (patience)", "diversity": "sebaran swarm kolaps"}
+        st.caption(
+            f"Split {pso_run['split_label'].replace('_', '/')} | {pso_run['config']} | reg = {gbest['reg']:.3e} | "
+            f"{pso_run.get('precision', 'float64')} | "
+            f"berhenti karena: {stop_labels.get(pso_run.get('stop_reason'), '-')}"
+        )
+        if pso_run.get("warm_start"):
+            ws = pso_run["warm_start"]
+            st.info(
+                f"♻️ Warm start dari neuron = {ws['neurons']}, aktivasi = {ws['activation']}, reg = {ws['reg']:.3e} — "
+                f"**{pso_run.get('iterations_skipped', n_max - n_run)}** dari {n_max} iterasi tidak dijalankan "
+                "(early stopping; run tanpa warm start dengan patience yang sama juga bisa berhenti lebih awal)."
+            )
+
+        def draw_convergence():
+            iters = np.arange(1, len(pso_run["gbest_history"]) + 1)
+            fig, ax = plt.subplots(figsize=(12, 3.5))
+            ax.plot(iters, np.asarray(pso_run["gbest_history"]) * 100, linewidth=2, label="MAPE gbest (%)")
+            ax.set_title("Konvergensi PSO: MAPE gbest & Sebaran Swarm per Iterasi", fontsize=12)
+            ax.set_xlabel("Iterasi")
+            ax.set_ylabel("MAPE gbest (%)")
+            ax.grid(True, linestyle="--", alpha=0.5)
+            if pso_run.get("spread_history"):
+                ax2 = ax.twinx()
+                ax2.plot(iters, pso_run["spread_history"], color="tab:orange", linestyle="--", linewidth=1.5, label="Sebaran swarm")
+                ax2.set_ylabel("Sebaran swarm")
+                h1, l1 = ax.get_legend_handles_labels()
+                h2, l2 = ax2.get_legend_handles_labels()
+                ax.legend(h1 + h2, l1 + l2, loc="upper right")
+            fig.tight_layout()
+            return fig
+
+        show_figure(
+            figure_key(wisata_choice, "pso_convergence",
+                       content_hash(pso_run["gbest_history"], pso_run.get("spread_history") or []),
+                       (pso_run["config"],), pso_run["split_label"]),
+            draw_convergence,
+        )
+
+
+    st.markdown("---")
+    st.subheader("📉 Perbandingan Data Aktual vs CEEMDAN–ELM vs CEEMDAN–ELM–PSO")
+
+    st.write("""
+    Bagian ini menampilkan **grafik perbandingan** antara:
+    - Data aktual,
+    - Prediksi **CEEMDAN–ELM**,
+    - Prediksi **CEEMDAN–ELM–PSO**.
+
+    Grafik dihasilkan dari **file pickle perbandingan** yang sudah dibuat di Colab.
+    """)
+
+    comp_entry = registry.get(wisata_choice, "comparison")
+
+    if comp_entry is None:
+        st.warning("Belum ada file perbandingan (`comparison_*.pkl`) untuk wisata ini.")
+    else:
+        if st.button("Tampilkan Grafik Perbandingan (dari Pickle)"):
+            comp = load_artifact(comp_entry)
+
+            actual = np.asarray(comp["actual"], dtype=float)
+            pred_elm_visual = np.asarray(comp["pred_elm_visual"], dtype=float)
+            elm_label = f"CEEMDAN–{comp.get('elm_label', 'ELM')}"
+            pred_pso = np.asarray(comp["pred_pso"], dtype=float)
+
+            split_label = comp.get("split_label", "")
+            config = comp.get("config", "")
+            mape_test = comp.get("mape_test", None)
+
+            def draw_comparison():
+                fig, ax = plt.subplots(figsize=(12, 5))
+                ax.plot(actual, label="Data Aktual", linewidth=2)
+                ax.plot(pred_elm_visual, label=elm_label, linestyle="-", linewidth=2)
+                ax.plot(pred_pso, label="CEEMDAN–ELM–PSO", linestyle="-", linewidth=2)
+
+                title = f"Perbandingan Data Aktual vs {elm_label} vs CEEMDAN–ELM–PSO\n(Split {split_label.replace('_','/')} | {config})"
+                ax.set_title(title, fontsize=12)
+                ax.set_xlabel("Index Waktu")
+                ax.set_ylabel("Jumlah Wisatawan")
+                ax.legend()
+                ax.grid(True, linestyle="--", alpha=0.5)
+                fig.tight_layout()
+                return fig
+
+            show_figure(figure_key(wisata_choice, "comparison", comp_entry.sha, split=split_label), draw_comparison)
+
+            if mape_test is not None:
+                st.caption(f"ℹ️ MAPE Test (PSO) model terbaik: {mape_test:.2%}")
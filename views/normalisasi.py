@@ -0,0 +1,184 @@
+"""Normalisasi: komponen ternormalisasi dan inverse scaler per komponen."""
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from views.common import get_registry, load_artifact
+from views.exports import export_buttons
+from views.figures import figure_key, show_figure
+
+
+def render():
+    registry = get_registry()
+    st.markdown("---")
+    st.markdown(
+        """
+        <style>
+            .upload-title-center {
+                text-align: left; 
+                font-size: 26px;
+                font-weight: 700;
+                color: #2b2b2b;
+                margin-top: -10px;
+                margin-bottom: 18px;
+                display: flex;
+                align-items: center;
+                gap: 10px;
+            }
+            .upload-title-center span.icon {
+                font-size: 30px;
+            }
+        </style>
+
+        <div class="upload-title-center">
+            <span class="icon">⚙️</span>
+            <span>Menu Normalisasi</span>
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
+
+    wisata_choice = st.selectbox("🗺 Silahkan Pilih Data Wisata:", registry.sites("normalisasi"))
+    entry = registry.get(wisata_choice, "normalisasi")
+
+    if entry is None:
+        st.error(f"❌ File `normalisasi_*.pkl` untuk {wisata_choice} tidak ditemukan. Pastikan file pickle normalisasi berada di folder aplikasi.")
+        st.stop()
+    pickle_path = entry.rel_path
+
+    try:
+        norm_artifact = load_artifact(entry)
+    except Exception as e:
+        st.error(f"❌ Gagal memuat file normalisasi `{pickle_path}`: {e}")
+        st.stop()
+
+    norm_components = norm_artifact.get("normalized_components", {}) or {}
+    scalers = norm_artifact.get("scalers", {}) or {}
+    original_series = np.asarray(norm_artifact.get("original_series", []), dtype=float)
+    jumlah_col = norm_artifact.get("jumlah_col", "jumlah")
+
+    if not norm_components:
+        st.error("❌ Artifact normalisasi tidak berisi 'normalized_components'. Periksa hasil Colab.")
+        st.stop()
+
+    comp_names = list(norm_components.keys())
+    n_comp = len(comp_names)
+    len_series = len(original_series)
+
+    c1, c2, c3 = st.columns([1,1,1])
+    with c1:
+        st.markdown('<div class="metric-card"><div style="font-size:1.02rem;font-weight:600">{}</div><div class="small-muted">Komponen Tersedia</div></div>'.format(n_comp), unsafe_allow_html=True)
+    with c2:
+        st.markdown('<div class="metric-card"><div style="font-size:1.02rem;font-weight:600">{}</div><div class="small-muted">Panjang Sinyal</div></div>'.format(len_series), unsafe_allow_html=True)
+    with c3:
+        st.markdown('<div class="metric-card"><div style="font-size:1.02rem;font-weight:600">{}</div><div class="small-muted">Kolom Target</div></div>'.format(jumlah_col), unsafe_allow_html=True)
+
+    st.markdown("---")
+    st.markdown("### 🔎 Pilih Komponen untuk Dibandingkan")
+    sel_components = st.multiselect("Pilih 1 atau lebih komponen (IMF / residual):", comp_names, default=comp_names[:min(4, len(comp_names))])
+
+    export_buttons(
+        (wisata_choice, "normalisasi", entry.sha, "normalized_components"),
+        lambda: pd.DataFrame({name: np.asarray(norm_components[name]).flatten() for name in comp_names}),
+        f"{wisata_choice.replace(' ','_')}_normalized_components", "normalized_components",
+        "⬇️ Unduh Semua Komponen (CSV)", "⬇️ Unduh Semua Komponen (Excel)",
+    )
+
+    st.markdown("---")
+    st.markdown("### 🔢 Preview Nilai & Statistik Singkat")
+    preview_rows = []
+    for name in comp_names:
+        arr = np.asarray(norm_components[name]).flatten()
+        preview_rows.append({
+            "Komponen": name,
+            "Contoh (5 nilai pertama)": ", ".join([f"{v:.3f}" for v in arr[:5]]),
+            "Min": np.min(arr),
+            "Max": np.max(arr),
+            "Mean": np.mean(arr),
+            "Std": np.std(arr)
+        })
+    df_preview = pd.DataFrame(preview_rows)
+    st.dataframe(df_preview[["Komponen", "Contoh (5 nilai pertama)", "Min", "Max", "Mean", "Std"]], use_container_width=True, height=260)
+
+    st.markdown("---")
+
+    if not sel_components:
+        st.warning("Pilih minimal 1 komponen untuk divisualisasikan.")
+    else:
+        for comp in sel_components:
+            st.markdown(f"#### 🔸 {comp}")
+
+            arr_norm = np.asarray(norm_components[comp]).reshape(-1, 1)
+            scaler = scalers.get(comp, None)
+
+            arr_orig = None
+            if scaler is not None:
+                try:
+                    arr_orig = scaler.inverse_transform(arr_norm).flatten()
+                except Exception:
+                    arr_orig = None
+
+            df_plot = pd.DataFrame({
+                "index": np.arange(len(arr_norm)),
+                "normalized": arr_norm.flatten()
+            })
+            if arr_orig is not None:
+                df_plot["inverse"] = arr_orig
+
+            def draw(comp=comp, df_plot=df_plot):
+                fig, ax = plt.subplots(figsize=(12,4))
+
+                ax.plot(
+                    df_plot["index"],
+                    df_plot["normalized"],
+                    marker="o",
+                    linewidth=2,
+                    label=f"{comp} (Normalized)"
+                )
+
+                if "inverse" in df_plot:
+                    ax.plot(
+                        df_plot["index"],
+                        df_plot["inverse"],
+                        linestyle="--",
+                        linewidth=2,
+                        label=f"{comp} (Inverse → Skala Asli)"
+                    )
+
+                ax.set_title(f"{comp} — Normalized vs Inverse", fontsize=11)
+                ax.set_xlabel("Index")
+                ax.set_ylabel("Nilai")
+                ax.legend()
+                ax.grid(True, linestyle="--", alpha=0.5)
+                return fig
+
+            show_figure(figure_key(wisata_choice, "normalisasi", entry.sha, (comp,)), draw)
+
+
+            if arr_orig is not None:
+                try:
+                    st.markdown(
+                        f"- Skala asli (inverse) → Min: **{arr_orig.min():,.0f}**, Max: **{arr_orig.max():,.0f}**, Mean: **{arr_orig.mean():,.1f}**".replace(",", ".")
+                    )
+                except Exception:
+                    st.write("Ringkasan skala asli tidak tersedia (format numeric tidak sesuai).")
+
+            if scaler is not None:
+                with st.expander("ℹ️ Lihat parameter scaler (MinMaxScaler)"):
+                    try:
+                        data_min = getattr(scaler, "data_min_", None)
+                        data_max = getattr(scaler, "data_max_", None)
+                        feature_range = getattr(scaler, "feature_range", None)
+                        st.write(f"- feature_range: {feature_range}")
+                        if data_min is not None and data_max is not None:
+                            st.write(f"- data_min_: {np.round(data_min, 6).tolist()}")
+                            st.write(f"- data_max_: {np.round(data_max, 6).tolist()}")
+                        else:
+                            st.write("Informasi `data_min_` / `data_max_` tidak tersedia pada scaler.")
+                    except Exception as e:
+                        st.write(f"Gagal menampilkan parameter scaler: {e}")
+            else:
+                st.info("⚠️ Scaler untuk komponen ini tidak ditemukan di artifact. Hanya tampilan normalisasi yang tersedia.")
+            st.markdown("---")
+    st.success("✅ Normalisasi komponen berhasil ditampilkan.")
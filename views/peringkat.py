@@ -0,0 +1,131 @@
+"""Peringkat Model: semua run ELM-PSO dan baseline ELM dari seluruh wisata dalam satu tabel."""
+import streamlit as st
+
+from artifacts.summary import METRIC_COLUMNS
+from views.common import get_modelling_index, get_registry
+from views.exports import export_buttons, frame_hash
+
+METRIC_FORMAT = {c: "{:.2f}" if c.startswith("MAPE") else "{:.4f}" for c in METRIC_COLUMNS}
+
+
+def highlight_best(row):
+    style = "background-color: #d4edda; font-weight: 600;" if row["Terbaik?"] == "✅" else ""
+    return [style] * len(row)
+
+
+def render():
+    registry = get_registry()
+    st.markdown("---")
+    st.markdown(
+        """
+        <style>
+            .upload-title-center {
+                text-align: left;
+                font-size: 26px;
+                font-weight: 700;
+                color: #2b2b2b;
+                margin-top: -10px;
+                margin-bottom: 18px;
+                display: flex;
+                align-items: center;
+                gap: 10px;
+            }
+            .upload-title-center span.icon {
+                font-size: 30px;
+            }
+        </style>
+
+        <div class="upload-title-center">
+            <span class="icon">🏆</span>
+            <span>Menu Peringkat Model</span>
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
+    st.write("""
+    Halaman ini membandingkan **seluruh objek wisata sekaligus**: setiap run **CEEMDAN–ELM–PSO**
+    (split × konfigurasi) dan baseline tanpa PSO (rata-rata per split) diperingkat dalam satu tabel: **ELM** adalah
+    ELM standar hasil Colab, sedangkan baseline yang dilatih ulang di aplikasi tampil dengan labelnya sendiri
+    (mis. *ELM-10 sigmoid*) karena parameter ELM standar tidak tersimpan di pickle.
+    Baris berwarna hijau adalah **model terbaik** untuk wisata tersebut: MAPE *backtest rolling-origin* terendah,
+    atau MAPE Test terendah bila belum semua run wisata itu di-backtest.
+    """)
+
+    index = get_modelling_index()
+    table = index.table(registry)
+    for _, file_path, e in index.errors:
+        st.error(f"❌ Gagal membaca file `{file_path}`: {e}")
+    if table.empty:
+        st.error("Tidak ada file modelling yang berhasil dimuat.")
+        st.stop()
+
+    sites = sorted(table["Wisata"].unique())
+    splits = sorted(table["Split"].unique())
+    configs = sorted(c for c in table["Konfigurasi"].unique() if c)
+    models = ["ELM-PSO", *sorted(m for m in table["Model"].unique() if m != "ELM-PSO")]
+
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        site_filter = st.multiselect("🗺 Wisata:", sites, default=sites)
+    with col2:
+        model_filter = st.multiselect("Model:", models, default=models)
+    col3, col4, col5, col6 = st.columns([1, 1, 1.5, 1])
+    with col3:
+        split_filter = st.multiselect("Split:", splits, default=splits)
+    with col4:
+        config_filter = st.multiselect("Konfigurasi (ELM-PSO):", configs, default=configs)
+    with col5:
+        sort_by = st.selectbox("Urutkan berdasarkan:", METRIC_COLUMNS, index=METRIC_COLUMNS.index("MAPE Test (%)"))
+    with col6:
+        # R² makin besar makin baik; metrik galat makin kecil makin baik.
+        order = st.radio("Urutan:", ["Naik", "Turun"], index=1 if sort_by.startswith("R²") else 0, horizontal=True)
+    best_only = st.checkbox("Tampilkan hanya model terbaik per wisata", value=False)
+
+    mask = (
+        table["Wisata"].isin(site_filter)
+        & table["Model"].isin(model_filter)
+        & table["Split"].isin(split_filter)
+        & ((table["Model"] != "ELM-PSO") | table["Konfigurasi"].isin(config_filter))
+    )
+    if best_only:
+        mask &= table["Terbaik?"] == "✅"
+    view = table[mask].sort_values(sort_by, ascending=(order == "Naik"), kind="stable", na_position="last")
+    view = view.reset_index(drop=True)
+    view.insert(0, "Peringkat", range(1, len(view) + 1))
+
+    n_pso = int((table["Model"] == "ELM-PSO").sum())
+    m1, m2, m3 = st.columns(3)
+    m1.metric("Jumlah Wisata", len(sites))
+    m2.metric("Run ELM-PSO", n_pso)
+    m3.metric("Baris Ditampilkan", len(view))
+
+    if view.empty:
+        st.warning("⚠️ Tidak ada baris yang cocok dengan filter.")
+        st.stop()
+
+    st.dataframe(
+        view.style.apply(highlight_best, axis=1).format(METRIC_FORMAT),
+        use_container_width=True,
+        hide_index=True,
+        height=min(38 + 35 * len(view), 740),
+    )
+
+    st.markdown("---")
+    st.subheader("🥇 Model Terbaik per Wisata")
+    best = table[table["Terbaik?"] == "✅"].sort_values("MAPE Test (%)", kind="stable")
+    st.dataframe(
+        best[["Wisata", "Split", "Konfigurasi", "MAPE Test (%)", "MAE Test", "RMSE Test", "R² Test",
+              "MAPE Backtest (%)", "File Pickle"]]
+        .style.format(METRIC_FORMAT, subset=["MAPE Test (%)", "MAE Test", "RMSE Test", "R² Test", "MAPE Backtest (%)"]),
+        use_container_width=True,
+        hide_index=True,
+    )
+
+    export_buttons(
+        ("Semua Wisata", "peringkat", frame_hash(view), "peringkat_model"),
+        lambda: view,
+        "peringkat_model",
+        "Peringkat",
+        "⬇️ Download Peringkat (CSV)",
+        "⬇️ Download Peringkat (Excel)",
+    )
@@ -0,0 +1,322 @@
+"""Prediksi: hasil forecasting bulan berikutnya dari model terbaik."""
+import os
+from datetime import datetime
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from artifacts.cache import ByteLRU, nbytes
+from engine import ensemble, forecast
+from engine.elm import PRECISIONS
+from views.common import get_modelling_index, get_registry, load_artifact
+from views.exports import export_buttons, frame_hash
+from views.figures import content_hash, figure_key, show_figure
+
+FIT_CACHE_MB = 32
+ENSEMBLE_CACHE_MB = 32
+
+
+@st.cache_resource(show_spinner=False)
+def get_fit_cache():
+    return ByteLRU(FIT_CACHE_MB << 20)
+
+
+@st.cache_resource(show_spinner=False)
+def get_ensemble_cache():
+    return ByteLRU(ENSEMBLE_CACHE_MB << 20)
+
+
+def best_entries(registry):
+    """``{site: (modelling entry, normalisasi entry)}`` of each site's best ELM-PSO run (the index's ✅ row)."""
+    table = get_modelling_index().table(registry)
+    best = table[table["Terbaik?"] == "✅"]
+    out = {}
+    for row in best.itertuples(index=False):
+        model_entry = registry.get(row.Wisata, "modelling", row.Split.replace("/", "_"), row.Konfigurasi)
+        norm_entry = registry.get(row.Wisata, "normalisasi")
+        if model_entry is not None and norm_entry is not None:
+            out[row.Wisata] = (model_entry, norm_entry)
+    return out
+
+
+def site_fits(best, precision="float64"):
+    """Fitted forecast models of every site, refitted only when its best model, normalisation or precision changes."""
+    cache = get_fit_cache()
+    fits = {}
+    for site, (model_entry, norm_entry) in best.items():
+        key = (site, model_entry.sha, norm_entry.sha, precision)
+        fit = cache.get(key)
+        if fit is None:
+            fit = forecast.fit_site(load_artifact(model_entry), load_artifact(norm_entry), dtype=PRECISIONS[precision])
+            fit = cache.put(key, fit, nbytes(fit), supersedes=lambda k, site=site: k[0] == site)
+        fits[site] = fit
+    return fits
+
+
+def ensemble_form(registry, best):
+    """Seed-ensemble controls; returns the cached ensemble for the current artifacts, if one was run."""
+    with st.expander("🎲 Mode Ensemble (P10 / P50 / P90)"):
+        st.caption(
+            "Setiap anggota ensemble memakai *seed* bobot tersembunyi ELM yang berbeda; opsional ditambah "
+            "realisasi noise CEEMDAN baru (dekomposisi ulang, jauh lebih lambat). Pita P10–P90 menunjukkan "
+            "sebaran prediksi antar anggota."
+        )
+        with st.form("form_ensemble"):
+            ce1, ce2, ce3, ce4 = st.columns(4)
+            with ce1:
+                n_members = st.number_input("Jumlah anggota", min_value=5, max_value=1000, step=5, value=50)
+            with ce2:
+                noise = st.number_input("Realisasi noise CEEMDAN", min_value=0, max_value=10, step=1, value=0)
+            with ce3:
+                trials = st.number_input("Trials CEEMDAN", min_value=10, max_value=2000, step=10, value=100)
+            with ce4:
+                workers = st.number_input("Jumlah proses", min_value=1, max_value=os.cpu_count() or 1, step=1,
+                                          value=os.cpu_count() or 1)
+            run_ensemble = st.form_submit_button("🚀 Jalankan Ensemble")
+
+    versions = tuple(sorted((site, m.sha, n.sha) for site, (m, n) in best.items()))
+    cache = get_ensemble_cache()
+    if run_ensemble:
+        key = (versions, int(n_members), int(noise), int(trials) if noise else 0)
+        if cache.get(key) is None:
+            try:
+                with st.spinner("Menjalankan ensemble..."):
+                    t_start = datetime.now()
+                    sites = {}
+                    for site, (model_entry, norm_entry) in best.items():
+                        ceemdan_entry = registry.get(site, "ceemdan")
+                        params = (load_artifact(ceemdan_entry).get("params") or {}) if ceemdan_entry else {}
+                        sites[site] = ensemble.site_payload(
+                            load_artifact(model_entry), load_artifact(norm_entry), {"trials": int(trials), **params}
+                        )
+                    result = ensemble.run(sites, forecast.MAX_HORIZON, int(n_members), int(noise), workers=int(workers))
+                    cache.put(key, result, nbytes(result))
+                st.success(f"✅ Ensemble {int(n_members)} anggota selesai dalam {(datetime.now() - t_start).total_seconds():.1f} detik.")
+            except Exception as e:
+                st.error(f"❌ Gagal menjalankan ensemble: {e}")
+                return None
+        st.session_state["ensemble_key"] = key
+    key = st.session_state.get("ensemble_key")
+    if key is None or key[0] != versions:
+        return None
+    return cache.get(key)
+
+
+def multi_month_section(registry, wisata_choice):
+    st.markdown("---")
+    st.subheader("📅 Prediksi Beberapa Bulan ke Depan")
+    st.write(
+        "Model ELM-PSO terbaik tiap wisata (kolom **Terbaik?** di menu Modelling) dijalankan **rekursif**: prediksi satu bulan "
+        "menjadi input bulan berikutnya. Semua wisata dan komponen IMF dihitung bersamaan."
+    )
+    horizon = st.slider("Jumlah bulan ke depan:", 1, forecast.MAX_HORIZON, 6)
+    precision = st.radio(
+        "Presisi komputasi prediksi:", list(PRECISIONS), horizontal=True,
+        help="float32 memakai setengah memori untuk bobot dan rollout; hasilnya bisa sedikit berbeda dari float64.",
+    )
+
+    try:
+        best = best_entries(registry)
+        fits = site_fits(best, precision)
+    except Exception as e:
+        st.error(f"❌ Gagal menyiapkan model prediksi: {e}")
+        return
+    if wisata_choice not in fits:
+        st.warning(f"⚠️ Model terbaik atau file normalisasi untuk {wisata_choice} tidak ditemukan.")
+        return
+    if fits[wisata_choice]["source"] == "os_elm":
+        st.caption(
+            f"🔁 Bobot output {wisata_choice} diambil dari status OS-ELM di file modelling "
+            f"({fits[wisata_choice]['updates']} pembaruan bulan baru), tanpa pelatihan ulang."
+        )
+    result = forecast.rollout(fits, horizon)
+    ens = ensemble_form(registry, best)
+    bands = None
+    if ens is not None and wisata_choice in ens["sites"]:
+        i = ens["sites"].index(wisata_choice)
+        bands = {q: np.maximum(v[i, :horizon], 0.0) for q, v in ens["quantiles"].items()}
+
+    months = [f"Bulan +{h}" for h in range(1, horizon + 1)]
+    total = result[wisata_choice]["total"]
+    rows = {"Prediksi Jumlah Wisatawan": total}
+    if bands is not None:
+        rows.update({f"P{int(q * 100)}": v for q, v in bands.items()})
+    st.dataframe(
+        pd.DataFrame([np.round(v).astype(int) for v in rows.values()], columns=months, index=list(rows)),
+        use_container_width=True,
+    )
+
+    norm_entry = registry.get(wisata_choice, "normalisasi")
+    hist = np.asarray(load_artifact(norm_entry)["original_series"], dtype=float).ravel()
+    idx = np.arange(len(hist))
+    next_idx = np.arange(len(hist) - 1, len(hist) + horizon)
+    path = np.concatenate([hist[-1:], total])
+
+    def draw():
+        fig, ax = plt.subplots(figsize=(12, 5))
+        ax.plot(idx, hist, label="Data Aktual", linewidth=2)
+        if bands is not None:
+            ax.fill_between(next_idx[1:], bands[0.1], bands[0.9], alpha=0.25, label="Ensemble P10–P90")
+            ax.plot(next_idx[1:], bands[0.5], linestyle=":", linewidth=2, label="Ensemble P50")
+        ax.plot(next_idx, path, linestyle="--", marker="o", linewidth=2, label=f"Prediksi {horizon} Bulan")
+        ax.set_title(f"Prediksi {horizon} Bulan — {wisata_choice}")
+        ax.set_xlabel("Index Waktu (Bulan)")
+        ax.set_ylabel("Jumlah Wisatawan")
+        ax.legend()
+        ax.grid(True, linestyle="--", alpha=0.5)
+        fig.tight_layout()
+        return fig
+
+    band_arrays = tuple(bands.values()) if bands is not None else ()
+    show_figure(figure_key(wisata_choice, "forecast_multi", content_hash(hist, total, *band_arrays), (horizon,)), draw)
+
+    st.markdown("**Prediksi Semua Wisata**")
+    all_sites = pd.DataFrame(
+        {site: np.round(res["total"]).astype(int) for site, res in sorted(result.items())}, index=months
+    ).T.rename_axis("Wisata").reset_index()
+    st.dataframe(all_sites, use_container_width=True, hide_index=True)
+    if ens is not None:
+        # Format panjang: satu baris per wisata x bulan dengan prediksi titik dan pita ensemble.
+        all_sites = pd.DataFrame([
+            {"Wisata": site, "Bulan": months[h], "Prediksi": round(float(result[site]["total"][h])),
+             **{f"P{int(q * 100)}": round(float(max(v[i, h], 0.0))) for q, v in ens["quantiles"].items()}}
+            for i, site in enumerate(ens["sites"]) if site in result for h in range(horizon)
+        ])
+    export_buttons(
+        ("Semua Wisata", "forecast_multi", frame_hash(all_sites), f"{horizon}_bulan"),
+        lambda: all_sites,
+        f"prediksi_{horizon}_bulan_semua_wisata",
+        "Prediksi",
+        "⬇️ Download Prediksi (CSV)",
+        "⬇️ Download Prediksi (Excel)",
+    )
+
+
+def render():
+    registry = get_registry()
+    st.markdown("---")
+    st.markdown(
+        """
+        <style>
+            .upload-title-center {
+                text-align: left; 
+                font-size: 26px;
+                font-weight: 700;
+                color: #2b2b2b;
+                margin-top: -10px;
+                margin-bottom: 18px;
+                display: flex;
+                align-items: center;
+                gap: 10px;
+            }
+            .upload-title-center span.icon {
+                font-size: 30px;
+            }
+        </style>
+
+        <div class="upload-title-center">
+            <span class="icon">📈</span>
+            <span>Menu Prediksi 1 Bulan Berikutnya</span>
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
+
+    wisata_choice = st.selectbox("🗺 Silahkan Pilih Data Wisata Untuk Diprediksi:", registry.sites("forecast"))
+    st.markdown(f"**Wisata terpilih :** {wisata_choice}")
+
+    if st.button("🔍 Tampilkan Hasil Prediksi 1 Bulan Berikutnya"):
+        forecast_entry = registry.get(wisata_choice, "forecast")
+        if forecast_entry is None:
+            st.error(f"❌ File pickle `forecast_*.pkl` untuk {wisata_choice} tidak ditemukan. Pastikan path benar.")
+            st.stop()
+
+        try:
+            artifact = load_artifact(forecast_entry)
+        except Exception as e:
+            st.error(f"❌ Gagal memuat pickle: {e}")
+            st.stop()
+
+        st.session_state["last_forecast_artifact"] = artifact
+
+        y_next_orig = artifact.get("y_next_orig", None)
+        try:
+            if y_next_orig is not None:
+                st.metric("🔮 Prediksi 1 Bulan ", f"{int(round(float(y_next_orig))):,}".replace(",", "."))
+            else:
+                st.metric("🔮 Prediksi 1 Bulan ", "Tidak tersedia")
+        except Exception:
+            st.metric("🔮 Prediksi 1 Bulan ", str(y_next_orig))
+
+        st.markdown("---")
+        st.subheader("📷 Visualisasi Prediksi ")
+
+        plotted = False
+
+        if "forecast_series" in artifact:
+            try:
+                fs = np.asarray(artifact["forecast_series"], dtype=float).flatten()
+                if fs.size >= 2:
+                    hist = fs[:-1]
+                    pred_val = float(fs[-1])
+                    idx = np.arange(len(hist))
+
+                    def draw():
+                        fig, ax = plt.subplots(figsize=(12,5))
+                        ax.plot(idx, hist, label="Data Aktual", linewidth=2)
+                        last_idx = len(hist) - 1
+                        next_idx = last_idx + 1
+                        ax.plot([last_idx, next_idx], [hist[-1], pred_val],
+                                linestyle="--", marker="o", linewidth=2, label="Prediksi 1 Bulan")
+                        ax.scatter([next_idx], [pred_val], s=80, zorder=3)
+                        ax.set_title(f"Prediksi 1 Bulan — {wisata_choice}")
+                        ax.set_xlabel("Index Waktu (Bulan)")
+                        ax.set_ylabel("Jumlah Wisatawan")
+                        ax.legend()
+                        ax.grid(True, linestyle="--", alpha=0.5)
+                        fig.tight_layout()
+                        return fig
+
+                    png = show_figure(figure_key(wisata_choice, "forecast", forecast_entry.sha, ("forecast_series",)), draw)
+                    st.download_button("⬇️ Download Plot ", data=png,
+                                       file_name=f"{wisata_choice.replace(' ','_')}_plot_generated.png", mime="image/png")
+                    plotted = True
+            except Exception as e:
+                st.warning("⚠️ Gagal menggambar dari `forecast_series`: " + str(e))
+                plotted = False
+
+        if (not plotted) and "original_series" in artifact and artifact.get("y_next_orig", None) is not None:
+            try:
+                orig = np.asarray(artifact["original_series"], dtype=float).flatten()
+                if orig.size >= 1:
+                    pred_val = float(artifact["y_next_orig"])
+                    idx = np.arange(len(orig))
+                    def draw():
+                        fig, ax = plt.subplots(figsize=(12,5))
+                        ax.plot(idx, orig, label="Data Aktual", linewidth=2)
+                        last_idx = len(orig)-1
+                        next_idx = last_idx + 1
+                        ax.plot([last_idx, next_idx], [orig[-1], pred_val],
+                                linestyle="--", marker="o", linewidth=2, label="Prediksi 1 Bulan")
+                        ax.scatter([next_idx], [pred_val], s=80, zorder=3)
+                        ax.set_title(f"Prediksi 1 Bulan — {wisata_choice}")
+                        ax.set_xlabel("Index Waktu (Bulan)")
+                        ax.set_ylabel("Jumlah Wisatawan")
+                        ax.legend()
+                        ax.grid(True, linestyle="--", alpha=0.5)
+                        fig.tight_layout()
+                        return fig
+
+                    png = show_figure(figure_key(wisata_choice, "forecast", forecast_entry.sha, ("original_series",)), draw)
+                    st.download_button("⬇️ Download Plot ", data=png,
+                                       file_name=f"{wisata_choice.replace(' ','_')}_plot_generated.png", mime="image/png")
+                    plotted = True
+            except Exception as e:
+                st.warning("⚠️ Gagal menggambar dari `original_series`: " + str(e))
+
+        if not plotted:
+            st.info("📉 Tidak cukup data untuk menggambar plot (tidak ada forecast_series maupun original_series dengan prediksi).")
+
+    multi_month_section(registry, wisata_choice)
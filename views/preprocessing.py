@@ -0,0 +1,265 @@
+"""Preprocessing: tampilkan artifact preprocessing per wisata."""
+import matplotlib.dates as mdates
+import matplotlib.pyplot as plt
+import pandas as pd
+import streamlit as st
+from matplotlib.ticker import FuncFormatter
+
+from engine.ingest import BULAN
+from views.common import get_registry, get_store, load_artifact
+from views.figures import figure_key, show_figure
+
+
+def stored_section(registry, wisata_choice):
+    """Chart of one range of years of the site's months in the local store (only that range is read)."""
+    db = get_store()
+    site = registry.folder(wisata_choice)
+    span = db.bounds(site) if db.exists else None
+    if span is None:
+        return
+    st.markdown("### 🗄 Data Tersimpan per Rentang Tahun")
+    (first, _), (last, _) = span
+    years = (first, last)
+    if first < last:
+        years = st.slider("Rentang tahun:", first, last, (max(first, last - 4), last), key="store_chart_years")
+    df = db.query(site, (years[0], 1), (years[1], 12))
+    df["tanggal"] = pd.to_datetime(dict(year=df["tahun"], month=df["bulan"].str.lower().map(BULAN), day=1))
+    st.caption(f"{len(df)} bulan dari penyimpanan lokal (versi {db.version(site)}), termasuk bulan yang ditambahkan "
+               "setelah artifact preprocessing dibuat.")
+
+    def draw():
+        fig, ax = plt.subplots(figsize=(12, 4))
+        ax.plot(df["tanggal"], df["jumlah"], marker="o", linewidth=2, color="tab:green")
+        ax.set_title(f"Jumlah Kunjungan Wisatawan {years[0]}–{years[1]}", fontsize=13, fontweight="bold")
+        ax.set_xlabel("Bulan")
+        ax.set_ylabel("Jumlah Wisatawan")
+        ax.yaxis.set_major_formatter(FuncFormatter(lambda x, _: f"{int(x):,}".replace(",", ".")))
+        ax.xaxis.set_major_formatter(mdates.DateFormatter("%b %Y"))
+        ax.tick_params(axis="x", labelrotation=45)
+        ax.grid(True, linestyle="--", alpha=0.5)
+        return fig
+
+    show_figure(figure_key(wisata_choice, "store", db.version(site), years), draw)
+
+
+def render():
+    registry = get_registry()
+    st.markdown("---")
+    st.markdown(
+        """
+        <style>
+            .upload-title-center {
+                text-align: left; 
+                font-size: 26px;
+                font-weight: 700;
+                color: #2b2b2b;
+                margin-top: -10px;
+                margin-bottom: 18px;
+                display: flex;
+                align-items: center;
+                gap: 10px;
+            }
+            .upload-title-center span.icon {
+                font-size: 30px;
+            }
+        </style>
+
+        <div class="upload-title-center">
+            <span class="icon">🧹</span>
+            <span>Menu Preprocessing</span>
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
+
+    wisata_choice = st.selectbox(
+        "Pilihlah Objek Wisata:",
+        registry.sites("preprocessing"),
+        index=0,
+    )
+    entry = registry.get(wisata_choice, "preprocessing")
+
+    if entry is None:
+        st.error(
+            f"❌ File pickle untuk **{wisata_choice}** tidak ditemukan.\n\n"
+            f"Pastikan file **`preprocessing_*.pkl`** berada di folder `{registry.folder(wisata_choice)}` aplikasi Streamlit."
+        )
+        st.stop()
+    pickle_path = entry.rel_path
+
+    try:
+        preproc_artifact = load_artifact(entry)
+    except Exception as e:
+        st.error(f"❌ Gagal membaca file pickle `{pickle_path}`: {e}")
+        st.stop()
+
+    df = preproc_artifact.get("df_preprocessed")
+    median_jumlah = preproc_artifact.get("median_jumlah", None)
+    jumlah_col = preproc_artifact.get("jumlah_col", "jumlah")
+    missing_info = preproc_artifact.get("missing_info", None)
+    total_missing = preproc_artifact.get("total_missing", None)
+    n_zero = preproc_artifact.get("n_zero", None)
+    baris_imputasi = preproc_artifact.get("baris_imputasi", None)
+    n_before = preproc_artifact.get("n_before", None)
+    n_after = preproc_artifact.get("n_after", None)
+    n_dup = preproc_artifact.get("n_dup", None)
+
+    if df is None:
+        st.error("❌ `df_preprocessed` tidak ditemukan di dalam pickle. Cek kembali isi file preprocessing di Colab.")
+        st.stop()
+
+    try:
+        df = df.copy()
+        df.columns = [c.strip().lower() if isinstance(c, str) else c for c in df.columns]
+        if "jumlah" not in df.columns:
+            if jumlah_col and jumlah_col in df.columns:
+                df = df.rename(columns={jumlah_col: "jumlah"})
+            else:
+                st.error("❌ Kolom target 'jumlah' tidak ditemukan di data hasil preprocessing.")
+                st.stop()
+
+        if "tahun" not in df.columns:
+            possible = [c for c in df.columns if "tahun" in c]
+            if possible:
+                df = df.rename(columns={possible[0]: "tahun"})
+            else:
+                st.error("❌ Kolom 'tahun' tidak ditemukan di data hasil preprocessing.")
+                st.stop()
+
+        df["jumlah"] = pd.to_numeric(df["jumlah"], errors="coerce")
+        df["tahun"] = pd.to_numeric(df["tahun"], errors="coerce").astype("Int64")
+    except Exception as e:
+        st.error(f"❌ Gagal memproses dataframe hasil preprocessing: {e}")
+        st.stop()
+    try:
+        st.session_state["df"] = df.copy()
+        st.info("ℹ️ Data hasil preprocessing telah disimpan ke `st.session_state['df']` dan siap dipakai di menu Prediksi.")
+    except Exception as e:
+        st.warning(f"⚠️ Gagal menyimpan ke session_state: {e}")
+
+    st.markdown("### 📊 Ringkasan Data – " + wisata_choice)
+    with st.container():
+        c1, c2, c3 = st.columns([1,1,1])
+        with c1:
+            st.markdown('<div class="metric-card"><div style="font-size:1.05rem;font-weight:600">{}</div><div class="small-muted">Jumlah Baris (akhir)</div></div>'.format(df.shape[0]), unsafe_allow_html=True)
+        with c2:
+            st.markdown('<div class="metric-card"><div style="font-size:1.05rem;font-weight:600">{}</div><div class="small-muted">Jumlah Kolom</div></div>'.format(df.shape[1]), unsafe_allow_html=True)
+        with c3:
+            if "tahun" in df.columns:
+                try:
+                    tahun_min = int(df["tahun"].min())
+                    tahun_max = int(df["tahun"].max())
+                    rentang = f"{tahun_min}–{tahun_max}"
+                except Exception:
+                    rentang = "-"
+            else:
+                rentang = "-"
+            st.markdown('<div class="metric-card"><div style="font-size:1.05rem;font-weight:600">{}</div><div class="small-muted">Rentang Tahun</div></div>'.format(rentang), unsafe_allow_html=True)
+
+    cols_info = st.columns(2)
+    with cols_info[0]:
+        if (n_before is not None) and (n_after is not None) and (n_dup is not None):
+            st.info(
+                f"🧾 **Duplikat data**  \n"
+                f"- Sebelum: **{n_before}**  \n"
+                f"- Setelah: **{n_after}**  \n"
+                f"- Dihapus: **{n_dup}**"
+            )
+        else:
+            st.write("")
+    with cols_info[1]:
+        if median_jumlah is not None:
+            teks_median = f"📌 Median untuk imputasi kolom **`{jumlah_col}`**: **{median_jumlah:,.0f}**".replace(",", ".")
+            if n_zero is not None:
+                teks_median += f"  \nJumlah baris bernilai 0 yang diimputasi: **{n_zero}**"
+            st.success(teks_median)
+        else:
+            st.write("")
+
+    with st.expander("🔎 Detail Missing Value & Tipe Kolom", expanded=False):
+        if missing_info is not None:
+            if total_missing is not None:
+                st.caption(f"Total missing value di seluruh kolom: **{total_missing}**.")
+            try:
+                st.dataframe(missing_info.to_frame("Jumlah Missing"), use_container_width=True, height=220)
+            except Exception:
+                st.write(missing_info)
+        else:
+            st.info("Tidak ada informasi missing value yang disimpan di artifact.")
+
+        st.markdown("**Tipe data kolom**")
+        st.code(df.dtypes.to_string())
+
+    st.markdown("### 👀 Preview Data (5 baris pertama)")
+    st.dataframe(df.head(), use_container_width=True, height=200)
+    csv_bytes = df.to_csv(index=False).encode("utf-8")
+    st.download_button("⬇️ Unduh CSV Preview", data=csv_bytes, file_name=f"{wisata_choice.replace(' ','_')}_preview.csv", mime="text/csv")
+
+    if isinstance(baris_imputasi, pd.DataFrame) and not baris_imputasi.empty:
+        with st.expander("🧮 Lihat Baris yang Diimputasi Median (Sebelumnya 0)", expanded=False):
+            st.dataframe(baris_imputasi, use_container_width=True, height=300)
+            csv_imp = baris_imputasi.to_csv(index=False).encode("utf-8")
+            st.download_button("⬇️ Unduh Baris Imputasi (CSV)", data=csv_imp, file_name=f"{wisata_choice.replace(' ','_')}_imputasi.csv", mime="text/csv")
+
+    bulan_col = None
+    tahun_col = None
+    for c in df.columns:
+        if str(c).lower() == "bulan":
+            bulan_col = c
+        if str(c).lower() == "tahun":
+            tahun_col = c
+
+    if bulan_col is None or tahun_col is None:
+        st.error("❌ Kolom 'bulan' atau 'tahun' tidak ditemukan di data hasil preprocessing.")
+        st.stop()
+
+    if "bulan_num" not in df.columns or "tanggal" not in df.columns:
+        bulan_mapping = {
+            'Januari': 1, 'Februari': 2, 'Maret': 3, 'April': 4,
+            'Mei': 5, 'Juni': 6, 'Juli': 7, 'Agustus': 8,
+            'September': 9, 'Oktober': 10, 'November': 11, 'Desember': 12
+        }
+        df["bulan_num"] = df[bulan_col].map(bulan_mapping)
+        df["tanggal"] = pd.to_datetime(dict(
+            year=df[tahun_col].astype(int),
+            month=df["bulan_num"].astype(int),
+            day=1
+        ))
+
+    df = df.sort_values("tanggal").reset_index(drop=True)
+
+    st.markdown("### 📈 Visualisasi Jumlah Wisatawan per Bulan")
+    try:
+        def draw():
+            fig, ax = plt.subplots(figsize=(12,4))
+
+            ax.plot(df["tanggal"], df["jumlah"], marker="o", linewidth=2)
+            ax.set_title("Jumlah Kunjungan Wisatawan", fontsize=13, fontweight="bold")
+            ax.set_xlabel("Bulan")
+            ax.set_ylabel("Jumlah Wisatawan")
+
+            ax.yaxis.set_major_formatter(
+                FuncFormatter(lambda x, _: f"{int(x):,}".replace(",", "."))
+            )
+            ax.xaxis.set_major_formatter(mdates.DateFormatter("%Y"))
+            ax.tick_params(axis="x", labelrotation=45)
+            ax.grid(True, linestyle="--", alpha=0.5)
+            return fig
+
+        show_figure(figure_key(wisata_choice, "preprocessing", entry.sha), draw)
+
+    except Exception as e:
+        st.error(f"Gagal membuat grafik interaktif: {e}")
+        fig, ax = plt.subplots(figsize=(12, 4))
+        ax.plot(df["tanggal"], df["jumlah"], marker="o", linewidth=2)
+        ax.set_title(f"Jumlah Kunjungan Wisatawan\n{wisata_choice}", fontsize=14, fontweight="bold")
+        ax.set_xlabel("Bulan", fontsize=12)
+        ax.set_ylabel("Jumlah Wisatawan", fontsize=12)
+        ax.yaxis.set_major_formatter(FuncFormatter(lambda x, loc: f"{int(x):,}".replace(",", ".")))
+        ax.xaxis.set_major_formatter(mdates.DateFormatter("%Y"))
+        plt.xticks(rotation=45)
+        plt.grid(True, linestyle="--", alpha=0.5)
+        st.pyplot(fig)
+        plt.close(fig)
+    stored_section(registry, wisata_choice)
+    st.success("✅ Hasil lengkap preprocessing berhasil ditampilkan.")
@@ -0,0 +1,156 @@
+"""Split Data: pembagian train/test komponen per rasio split."""
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from views.common import get_registry, load_artifact
+from views.exports import export_buttons
+from views.figures import figure_key, show_figure
+
+
+def render():
+    registry = get_registry()
+    st.markdown("---")
+    st.markdown(
+        """
+        <style>
+            .upload-title-center {
+                text-align: left; 
+                font-size: 26px;
+                font-weight: 700;
+                color: #2b2b2b;
+                margin-top: -10px;
+                margin-bottom: 18px;
+                display: flex;
+                align-items: center;
+                gap: 10px;
+            }
+            .upload-title-center span.icon {
+                font-size: 30px;
+            }
+        </style>
+
+        <div class="upload-title-center">
+            <span class="icon">✂️</span>
+            <span>Menu Split Data</span>
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
+
+    col_wisata, col_split = st.columns([2, 1])
+    with col_wisata:
+        wisata_choice = st.selectbox("🗺 Silahkan Pilih Data Wisata:", registry.sites("split"))
+    with col_split:
+        split_label_ui = st.radio("Pilih rasio split:", ["80% / 20%", "90% / 10%"], index=0, horizontal=True)
+
+    split_key = "80_20" if "80%" in split_label_ui else "90_10"
+    entry = registry.get(wisata_choice, "split", split_key)
+
+    if entry is None:
+        st.error(f"❌ File split {split_key.replace('_', '/')} untuk {wisata_choice} tidak ditemukan. Pastikan file pickle split ada di folder aplikasi.")
+        st.stop()
+    pickle_path = entry.rel_path
+
+    st.info(f"📂 File split yang akan dimuat: `{pickle_path}`")
+
+    try:
+        split_artifact = load_artifact(entry)
+    except Exception as e:
+        st.error(f"❌ Gagal memuat `{pickle_path}`: {e}")
+        st.stop()
+
+    train_components = split_artifact.get("train_components", {}) or {}
+    test_components = split_artifact.get("test_components", {}) or {}
+    y_train = np.asarray(split_artifact.get("y_train", []), dtype=float)
+    y_test = np.asarray(split_artifact.get("y_test", []), dtype=float)
+    train_ratio = split_artifact.get("train_ratio", None)
+    split_index = split_artifact.get("split_index", None)
+    N = split_artifact.get("N", len(y_train) + len(y_test))     
+    label = split_artifact.get("label", split_label_ui)
+
+    st.session_state["current_split_artifact"] = split_artifact
+    st.session_state["current_split_info"] = {
+        "wisata": wisata_choice,
+        "pickle_path": pickle_path,
+        "split_key": split_key,
+        "label": label,
+    }
+
+    st.success("✅ File split berhasil dimuat.")
+
+    st.subheader("🧾 Ringkasan Split Data")
+    c1, c2, c3 = st.columns([1,1,1])
+    with c1:
+        st.markdown('<div class="metric-card"><div style="font-size:1.02rem;font-weight:600">{}</div><div class="small-muted">Total (N)</div></div>'.format(N), unsafe_allow_html=True)
+    with c2:
+        st.markdown('<div class="metric-card"><div style="font-size:1.02rem;font-weight:600">{}</div><div class="small-muted">Panjang Latih</div></div>'.format(len(y_train)), unsafe_allow_html=True)
+    with c3:
+        st.markdown('<div class="metric-card"><div style="font-size:1.02rem;font-weight:600">{}</div><div class="small-muted">Panjang Uji</div></div>'.format(len(y_test)), unsafe_allow_html=True)
+
+    if train_ratio is not None:
+        st.caption(f"Rasio latih ≈ {train_ratio*100:.1f}%  |  uji ≈ {(1-train_ratio)*100:.1f}%")
+    st.write(f"Label split : **{label}**")
+    st.markdown("---")
+
+    st.subheader("🧩 Panjang Komponen IMF (Latih / Uji)")
+    comp_names = list(train_components.keys())
+    st.write(f"Jumlah komponen: **{len(comp_names)}**")
+
+    preview_comps = comp_names[:6]
+    rows = []
+    for name in preview_comps:
+        rows.append({"Komponen": name, "Latih": len(train_components.get(name, [])), "Test": len(test_components.get(name, []))})
+    df_comp_preview = pd.DataFrame(rows)
+    st.dataframe(df_comp_preview, use_container_width=True, height=160)
+    if len(comp_names) > len(preview_comps):
+        st.caption(f"... dan {len(comp_names) - len(preview_comps)} komponen lainnya.")
+
+    export_buttons(
+        (wisata_choice, "split", entry.sha, "components"),
+        lambda: pd.DataFrame({k: np.concatenate([train_components.get(k, []), test_components.get(k, [])]) for k in comp_names}),
+        f"{wisata_choice.replace(' ','_')}_components", "components",
+        "⬇️ Unduh Komponen (CSV)", "⬇️ Unduh Komponen (Excel)",
+    )
+
+    st.markdown("---")
+    st.subheader("📈 Visualisasi Sinyal Asli (Latih + Uji)")
+    full_series = np.concatenate([y_train, y_test])
+    idx = np.arange(len(full_series))
+    df_plot = pd.DataFrame({
+        "index": idx,
+        "value": full_series,
+        "set": ["latih"] * len(y_train) + ["uji"] * len(y_test)
+    })
+
+    def draw():
+        fig, ax = plt.subplots(figsize=(12,4))
+
+        ax.plot(df_plot[df_plot["set"]=="latih"]["index"],
+                df_plot[df_plot["set"]=="latih"]["value"],
+                label="Latih", linewidth=2)
+
+        ax.plot(df_plot[df_plot["set"]=="uji"]["index"],
+                df_plot[df_plot["set"]=="uji"]["value"],
+                label="Uji", linewidth=2)
+
+        ax.axvline(split_index, linestyle="--", color="red", label="Batas Latih/Uji")
+        ax.legend()
+        ax.grid(True, linestyle="--", alpha=0.5)
+        return fig
+
+    show_figure(figure_key(wisata_choice, "split", entry.sha, split=split_key), draw)
+
+
+    st.markdown("---")
+    st.markdown("---")
+    st.markdown("### ✅ Ringkasan Akhir")
+    st.write(
+        f"- Wisata dipilih: **{wisata_choice}**  \n"
+        f"- File pickle split: `{pickle_path}`  \n"
+        f"- Label / Rasio: **{label}**  \n"
+        f"- Data latih: **{len(y_train)}** titik  \n"
+        f"- Data uji: **{len(y_test)}** titik"
+    )
+    st.success("🎉 Artefak split berhasil dimuat dan ditampilkan. Artefak tersimpan di `st.session_state['current_split_artifact']` untuk langkah berikutnya.")
@@ -0,0 +1,440 @@
+"""Upload Data: unggah, validasi, dan edit data kunjungan bulanan."""
+import os
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from artifacts.registry import site_label
+from engine import ingest, oselm
+from views import editlog
+from views.common import get_registry, get_store, load_artifact
+from views.exports import export_buttons
+
+
+def oselm_section(df):
+    """Apply the months appended to a site's series to its four modelling artifacts (OS-ELM update)."""
+    registry = get_registry()
+    sites = registry.sites("modelling")
+    if not sites:
+        st.info("ℹ️ Belum ada artifact modelling di folder aplikasi.")
+        return
+    site = st.selectbox("🗺 Wisata yang datanya diperbarui:", sites, key="oselm_site")
+    norm_entry = registry.get(site, "normalisasi")
+    if norm_entry is None:
+        st.warning(f"⚠️ File normalisasi untuk {site} tidak ditemukan.")
+        return
+    normalisasi = load_artifact(norm_entry)
+    stored = np.asarray(normalisasi["original_series"], dtype=float).ravel()
+    series = pd.to_numeric(df["jumlah"], errors="coerce").dropna().to_numpy(dtype=float)
+    n_new = len(series) - len(stored)
+    if n_new <= 0 or not np.allclose(series[:len(stored)], stored):
+        st.info(
+            f"ℹ️ Data sesi harus memuat seluruh **{len(stored)}** bulan data {site} (urutan sama), "
+            "diikuti bulan baru yang ditambahkan lewat **➕ Tambah Data Baru**."
+        )
+        return
+    st.write(f"**{n_new}** bulan baru terdeteksi: " + ", ".join(f"{int(v):,}".replace(",", ".") for v in series[len(stored):]))
+
+    if not st.button(f"🔁 Perbarui Model {site}", use_container_width=True):
+        return
+    try:
+        with st.spinner("Mendekomposisi bulan baru dan memperbarui model..."):
+            t_start = time.perf_counter()
+            ceemdan_entry = registry.get(site, "ceemdan")
+            ceemdan_artifact = load_artifact(ceemdan_entry) if ceemdan_entry else {}
+            params = {k: v for k, v in (ceemdan_artifact.get("params") or {}).items() if k in ("trials", "epsilon")}
+            entries = registry.entries(site, "modelling")
+            window = int(load_artifact(entries[0]).get("elm_pso", {}).get("WINDOW_SIZE", 3)) if entries else 3
+            new_norm = oselm.extend_normalisasi(
+                normalisasi, series[len(stored):], seed=ceemdan_artifact.get("seed", 42),
+                workers=os.cpu_count() or 1, window=window, **params,
+            )
+            t_decomposed = time.perf_counter()
+            updated = [
+                (entry, oselm.update_artifact(load_artifact(entry), new_norm["normalized_components"], n_new))
+                for entry in entries
+            ]
+            t_updated = time.perf_counter()
+            for entry, artifact in updated:
+                oselm.save(entry.path, artifact)
+            oselm.save(norm_entry.path, new_norm)
+            registry.refresh()
+        st.success(
+            f"✅ {len(updated)} model {site} diperbarui dengan {n_new} bulan baru — dekomposisi "
+            f"{t_decomposed - t_start:.1f} detik, pembaruan OS-ELM {(t_updated - t_decomposed) * 1000:.1f} ms."
+        )
+        join = new_norm["sambungan_oselm"][-1]
+        st.warning(
+            "⚠️ Komponen bulan baru adalah **pendekatan**: diambil dari dekomposisi CEEMDAN ulang seluruh seri "
+            "lalu disambung ke komponen tersimpan, sehingga nilainya bisa melompat di sambungan. Selisih terbesar "
+            f"di sambungan: **{join['selisih_maks']:.4f}** (skala normalisasi, komponen `{join['komponen']}`)"
+            + ("" if params else "; parameter CEEMDAN asli tidak tersimpan, dipakai parameter bawaan")
+            + ". Bila selisihnya besar, jalankan ulang pipeline lengkap (`python -m engine.pipeline`)."
+        )
+    except Exception as e:
+        st.error(f"❌ Gagal memperbarui model: {e}")
+
+
+def ingest_upload(uploaded_file):
+    """``engine.ingest`` result of the uploaded file, read (chunk by chunk) once per upload."""
+    key = (uploaded_file.name, uploaded_file.size, getattr(uploaded_file, "file_id", None))
+    cached = st.session_state.get("_ingest")
+    if cached is None or cached[0] != key:
+        uploaded_file.seek(0)
+        with st.spinner("Membaca file per bagian..."):
+            cached = (key, ingest.ingest(uploaded_file, uploaded_file.name))
+        st.session_state["_ingest"] = cached
+    return cached[1]
+
+
+def ingest_report(result, site, df):
+    layout = "harian, dijumlahkan per bulan" if result["layout"] == "harian" else "bulanan"
+    rows, chunk_rows = (f"{n:,}".replace(",", ".") for n in (result["rows"], result["chunk_rows"]))
+    st.caption(
+        f"📄 {rows} baris dibaca dalam {result['chunks']} bagian (maks. {chunk_rows} baris per bagian) — "
+        f"data {layout}" + (f" — wisata **{site}**" if site else "") + f": **{len(df)}** bulan."
+    )
+    if result["incomplete_months"]:
+        st.warning(
+            f"⚠️ {result['incomplete_months']} bulan (semua wisata) tidak memiliki data untuk setiap hari; "
+            "jumlahnya hanya dari hari yang tercatat."
+        )
+    for column, info in result["invalid"].items():
+        st.warning(
+            f"⚠️ {info['jumlah']} nilai kolom `{column}` tidak valid (contoh: {', '.join(info['contoh'])})."
+        )
+
+
+def edit_log():
+    """The session's ``EditLog``, started afresh when ``st.session_state.df`` was replaced elsewhere."""
+    log = st.session_state.get("_edit_log")
+    if log is None or log.frame is not st.session_state.df:
+        log = editlog.EditLog(st.session_state.df)
+        st.session_state["_edit_log"] = log
+    return log
+
+
+def commit(change):
+    st.session_state.df = edit_log().record(change)
+
+
+def step_history(undo):
+    if "df" not in st.session_state:
+        st.warning("❗ Belum ada data di memori.")
+        return
+    log = edit_log()
+    change = log.undo() if undo else log.redo()
+    if change is None:
+        st.warning("❗ Tidak ada perubahan untuk " + ("dibatalkan." if undo else "diulang."))
+        return
+    st.session_state.df = log.frame
+    if undo:
+        st.success(f"🔁 Perubahan dibatalkan ({change.label}).")
+    else:
+        st.success(f"↪️ Perubahan diulang ({change.label}).")
+
+
+def apply_editor_changes(key):
+    """``on_change`` of the table editor: record its change set as one undo step."""
+    log = edit_log()
+    try:
+        change = editlog.from_editor(log.frame, st.session_state[key])
+        if change is None:
+            return
+        commit(change)
+    except Exception as e:
+        log.refresh()
+        st.session_state["_edit_notice"] = ("error", f"⚠️ Gagal menyimpan perubahan: {e}")
+    else:
+        st.session_state["_edit_notice"] = ("success", "✅ Perubahan pada tabel berhasil disimpan ke memori aplikasi.")
+
+
+def history_caption(log):
+    st.caption(
+        f"🕘 Riwayat: {len(log.undo_stack)} langkah undo, {len(log.redo_stack)} redo — "
+        f"{log.nbytes / 1024:.1f} KB (maks. {log.max_steps} langkah / {log.max_bytes >> 20} MB)."
+    )
+
+
+def load_from_store():
+    """Load a stored site (one range of years) as the session table instead of uploading a file."""
+    db = get_store()
+    sites = db.sites() if db.exists else []
+    if not sites:
+        return
+    with st.expander("📦 Atau Muat dari Penyimpanan Lokal", expanded=False):
+        site = st.selectbox("Wisata:", sites, format_func=site_label, key="store_load_site")
+        (first, _), (last, _) = db.bounds(site)
+        years = (first, last)
+        if first < last:
+            years = st.slider("Rentang tahun:", first, last, (first, last), key="store_load_years")
+        if st.button("📥 Muat dari Penyimpanan", use_container_width=True):
+            df = db.query(site, (years[0], 1), (years[1], 12))
+            st.session_state.df = df
+            st.session_state["_edit_log"] = editlog.EditLog(df)
+            st.session_state["store_site"] = site
+            st.success(f"✅ {len(df)} bulan {site_label(site)} ({years[0]}–{years[1]}) dimuat dari penyimpanan lokal.")
+
+
+def store_section(df):
+    """Site of the local store the session table belongs to, with a button to save the whole table there."""
+    registry = get_registry()
+    db = get_store()
+    options = sorted(set(db.sites() if db.exists else []) | {registry.folder(s) for s in registry.sites()})
+    if not options:
+        st.info("ℹ️ Belum ada folder wisata untuk penyimpanan lokal.")
+        return None
+    if st.session_state.get("store_site") not in options:
+        st.session_state["store_site"] = options[0]
+    site = st.selectbox("🗺 Wisata data ini:", options, format_func=site_label, key="store_site")
+    span = db.bounds(site) if db.exists else None
+    if span:
+        (y0, m0), (y1, m1) = span
+        st.caption(
+            f"🗄 Tersimpan: {ingest.NAMA_BULAN[m0]} {y0} – {ingest.NAMA_BULAN[m1]} {y1} "
+            f"(versi {db.version(site)}). Bulan yang sudah ada akan ditimpa."
+        )
+    else:
+        st.caption("🗄 Wisata ini belum ada di penyimpanan lokal.")
+    if st.button("💾 Simpan Seluruh Data Sesi ke Penyimpanan", use_container_width=True):
+        try:
+            n = db.upsert(site, df, "upload")
+        except ValueError as e:
+            st.error(f"❌ Data tidak disimpan: {e}")
+        else:
+            st.success(f"✅ {n} bulan {site_label(site)} disimpan (versi {db.version(site)}).")
+    return site
+
+
+def render():
+    st.markdown("---")
+    st.markdown(
+        """
+        <style>
+            .upload-title-center {
+                text-align: left; 
+                font-size: 26px; 
+                font-weight: 700;
+                color: #2b2b2b;
+                margin-top: -10px;
+                margin-bottom: 18px;
+                display: flex;
+                align-items: center;
+                gap: 10px;
+            }
+            .upload-title-center span.icon {
+                font-size: 30px;
+            }
+        </style>
+
+        <div class="upload-title-center">
+            <span class="icon">📂</span>
+            <span>Menu Upload Data</span>
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
+
+    uploaded_file = st.file_uploader(
+        "Silakan Upload File CSV atau Excel",
+        type=["csv", "xlsx", "xls"],
+        help="Pastikan kolom: no, bulan, tahun, jumlah — atau data harian: tanggal, jumlah "
+             "(opsional kolom wisata untuk beberapa wisata sekaligus)."
+    )
+
+    col_reset, col_undo, col_redo, _ = st.columns([1,1,1,2])
+    with col_reset:
+        if st.button("🔄 Reset Data di Memori", use_container_width=True):
+            st.session_state.pop("df", None)
+            st.session_state.pop("_edit_log", None)
+            st.success("Data di memori aplikasi berhasil di-reset. Silakan unggah ulang file.")
+    with col_undo:
+        if st.button("↩️ Undo Perubahan Terakhir", use_container_width=True):
+            step_history(undo=True)
+    with col_redo:
+        if st.button("↪️ Redo Perubahan", use_container_width=True):
+            step_history(undo=False)
+
+    if uploaded_file is not None and "df" not in st.session_state:
+        try:
+            result = ingest_upload(uploaded_file)
+        except ValueError as e:
+            st.error(f"❌ Format file tidak sesuai: {e}")
+        except Exception as e:
+            st.error(f"❌ Gagal membaca file: {e}")
+        else:
+            sites = result["sites"]
+            site = next(iter(sites))
+            load = True
+            if len(sites) > 1:
+                site = st.selectbox("🗺 File berisi beberapa wisata — pilih yang dimuat:", list(sites))
+                load = st.button("📥 Muat Data Wisata Ini")
+            if load:
+                df = sites[site]
+                st.session_state.df = df
+                st.session_state["_edit_log"] = editlog.EditLog(df)
+                st.success("✅ Data berhasil dimuat dan disimpan ke memori aplikasi.")
+                ingest_report(result, site, df)
+
+    if "df" not in st.session_state:
+        load_from_store()
+    if "df" not in st.session_state:
+        st.info("📥 Silakan unggah file terlebih dahulu untuk mulai mengelola data.")
+        st.stop()
+
+    log = edit_log()
+    df = log.frame
+
+    st.markdown("### 🔎 Ringkasan Dataset")
+    c1, c2, c3 = st.columns([1,1,1])
+    with c1:
+        st.markdown('<div class="metric-card"><div style="font-size:1.05rem;font-weight:600">{}</div><div class="small-muted">Jumlah Baris</div></div>'.format(df.shape[0]), unsafe_allow_html=True)
+    with c2:
+        st.markdown('<div class="metric-card"><div style="font-size:1.05rem;font-weight:600">{}</div><div class="small-muted">Jumlah Kolom</div></div>'.format(df.shape[1]), unsafe_allow_html=True)
+    with c3:
+        if "tahun" in df.columns and df["tahun"].notna().any():
+            try:
+                tahun_min = int(df["tahun"].min())
+                tahun_max = int(df["tahun"].max())
+                rentang = f"{tahun_min} – {tahun_max}"
+            except Exception:
+                rentang = "-"
+        else:
+            rentang = "-"
+        st.markdown('<div class="metric-card"><div style="font-size:1.05rem;font-weight:600">{}</div><div class="small-muted">Rentang Tahun</div></div>'.format(rentang), unsafe_allow_html=True)
+
+    with st.expander("ℹ️ Tipe Data Kolom", expanded=False):
+        st.code(df.dtypes.to_string())
+
+    st.markdown("### 👀 Preview 5 Baris Pertama")
+    st.dataframe(df.head(), use_container_width=True, height=200)
+
+    csv_preview = df.head().to_csv(index=False).encode("utf-8")
+    st.download_button("⬇️ Unduh Preview (CSV)", data=csv_preview, file_name="preview_data.csv", mime="text/csv")
+
+    st.markdown("---")
+    st.markdown("### 📌 Data Terakhir yang Tersimpan")
+    if df.shape[0] == 0:
+        st.warning("Data kosong — belum ada baris tersimpan.")
+        last_no, last_bulan, last_tahun, last_jumlah = 0, "", datetime.now().year, 0
+    else:
+        last_row = df.tail(1).iloc[0]
+        last_no = int(last_row.get("no", df["no"].dropna().max() or 0)) if not pd.isna(last_row.get("no")) else int(df["no"].dropna().max() or 0)
+        last_bulan = str(last_row.get("bulan", "")) if not pd.isna(last_row.get("bulan")) else ""
+        last_tahun = int(last_row.get("tahun", datetime.now().year)) if not pd.isna(last_row.get("tahun")) else datetime.now().year
+        last_jumlah = int(last_row.get("jumlah", 0)) if not pd.isna(last_row.get("jumlah")) else 0
+
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("Nomor Terakhir", last_no)
+    c2.metric("Bulan Terakhir", last_bulan if last_bulan else "-")
+    c3.metric("Tahun Terakhir", last_tahun)
+    c4.metric("Jumlah Wisatawan", f"{last_jumlah:,}".replace(",", "."))
+
+    if last_bulan:
+        st.info(f"📅 Data terakhir: **{last_bulan} {last_tahun}** — **{last_jumlah:,}** wisatawan.".replace(",", "."))
+    else:
+        st.info(f"📅 Data terakhir pada tahun **{last_tahun}** — **{last_jumlah:,}** wisatawan.".replace(",", "."))
+
+    st.markdown("---")
+    st.markdown("### 🗄 Penyimpanan Lokal")
+    st.caption(
+        "Data kunjungan disimpan per wisata, tahun, dan bulan (SQLite). Bulan baru cukup ditambahkan satu baris; "
+        "grafik dan pipeline pelatihan ulang membaca dari sini."
+    )
+    store_site = store_section(df)
+
+    st.markdown("---")
+
+    st.markdown("### ➕ Tambah Data Baru (Manual)")
+    if df.shape[0] > 0:
+        next_no_default = int(df["no"].dropna().max() or 0) + 1
+        default_year = int(df["tahun"].dropna().max() or datetime.now().year)
+    else:
+        next_no_default = 1
+        default_year = datetime.now().year
+
+    with st.form("form_tambah_data", clear_on_submit=True):
+        col_a, col_b, col_c = st.columns([2,1,1])
+        with col_a:
+            bulan_baru = st.text_input("Bulan (nama)", placeholder="Contoh: Januari")
+        with col_b:
+            tahun_baru = st.number_input("Tahun", min_value=1900, max_value=9999, step=1, value=default_year)
+        with col_c:
+            jumlah_baru = st.number_input("Jumlah Wisatawan", min_value=0, step=1, value=0)
+        simpan_store = store_site is not None and st.checkbox(
+            f"💾 Simpan juga ke penyimpanan lokal ({site_label(store_site)})", value=True,
+        )
+
+        submitted = st.form_submit_button("✅ Tambah ke Tabel")
+
+    if submitted:
+        if not bulan_baru.strip():
+            st.warning("⚠️ Nama bulan tidak boleh kosong.")
+        else:
+            new_row = {"no": next_no_default, "bulan": bulan_baru.strip(), "tahun": int(tahun_baru), "jumlah": int(jumlah_baru)}
+            if simpan_store:
+                try:
+                    get_store().append(store_site, int(tahun_baru), bulan_baru.strip(), int(jumlah_baru))
+                except ValueError as e:
+                    st.warning(f"⚠️ Tidak disimpan ke penyimpanan lokal: {e}")
+            commit(editlog.append_rows(df, [new_row], f"tambah {bulan_baru.strip()} {tahun_baru}"))
+            df = st.session_state.df
+            st.success(f"Data baru untuk **{bulan_baru.strip()} {tahun_baru}** berhasil ditambahkan.")
+
+    st.markdown("---")
+    st.markdown("### 📝 Edit & Hapus Data")
+    st.caption("Klik sel untuk mengedit. Untuk menghapus, hapus isi baris atau gunakan opsi di bawah. Setelah selesai, perubahan otomatis tersimpan ke memori aplikasi.")
+    # A new key per table version remounts the editor, so its change set is always relative to ``df``.
+    editor_key = f"editor_upload_{log.version}"
+    st.data_editor(
+        df,
+        num_rows="dynamic",
+        use_container_width=True,
+        key=editor_key,
+        on_change=apply_editor_changes,
+        args=(editor_key,),
+    )
+    notice = st.session_state.pop("_edit_notice", None)
+    if notice:
+        getattr(st, notice[0])(notice[1])
+    history_caption(log)
+
+    st.markdown("---")
+    st.markdown("### ❌ Hapus Baris Tertentu")
+    st.caption("Masukkan nomor baris (kolom 'no') yang ingin dihapus, lalu tekan Hapus.")
+    col_del1, col_del2 = st.columns([2,1])
+    with col_del1:
+        hapus_no = st.number_input("No (hapus berdasarkan kolom 'no')", min_value=0, step=1, value=0)
+    with col_del2:
+        if st.button("Hapus Baris"):
+            positions = np.flatnonzero(df["no"].eq(hapus_no).fillna(False).to_numpy(dtype=bool))
+            if hapus_no and len(positions):
+                commit(editlog.delete_rows(df, positions, f"hapus no {hapus_no}"))
+                df = st.session_state.df
+                st.success(f"Baris dengan no = {hapus_no} berhasil dihapus.")
+            else:
+                st.warning("No yang dimasukkan tidak ditemukan di tabel.")
+
+    st.markdown("---")
+    st.markdown("### 🔁 Perbarui Model dengan Bulan Baru (OS-ELM)")
+    st.caption(
+        "Bulan baru diterapkan langsung ke bobot output model ELM-PSO tiap komponen (*recursive least squares*), "
+        "tanpa pelatihan ulang penuh. Status OS-ELM disimpan di file modelling wisata tersebut."
+    )
+    oselm_section(df)
+
+    st.markdown("---")
+    st.markdown("### 💾 Unduh Data yang Sudah Diperbarui")
+    export_buttons(
+        ("Data Sesi", "upload", f"v{edit_log().version}", "data_wisata"),
+        lambda: df,
+        "data_wisata_diperbarui", "DataWisata",
+        "⬇️ Download sebagai CSV", "⬇️ Download sebagai Excel",
+    )
+
+    st.markdown("---")
+    st.markdown("### 📊 Preview Data Saat Ini")
+    st.dataframe(df, use_container_width=True, height=350)